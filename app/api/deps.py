@@ -1,21 +1,58 @@
 # app/api/deps.py - API Dependencies (FIXED)
 from fastapi import Depends, HTTPException, status, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from dataclasses import dataclass
 from typing import Optional
 
-from app.database import get_db
+from app.database import get_async_db
+from app.config import settings
+from app.core.cache import TTLCache
 from app.services.auth_service import AuthService
-from app.models.user import User, UserRole
+from app.models.user import UserRole
 
 security = HTTPBearer(auto_error=False)
 
 
+@dataclass(frozen=True)
+class Principal:
+    """Authenticated user identity kept in the principal cache"""
+    id: int
+    username: str
+    role: UserRole
+
+
+# Per-worker cache of user id -> Principal. Entries are invalidated when an
+# admin changes a role or deletes a user; other workers pick the change up
+# once the TTL expires.
+principal_cache = TTLCache(
+    maxsize=settings.PRINCIPAL_CACHE_SIZE,
+    ttl=settings.PRINCIPAL_CACHE_TTL
+)
+
+
+async def _load_principal(db: AsyncSession, user_id: int) -> Optional[Principal]:
+    """Get principal from cache, falling back to the users table"""
+    principal = principal_cache.get(user_id)
+    if principal is not None:
+        return principal
+
+    user = await AuthService.get_user_by_id(db, user_id)
+    if not user:
+        return None
+
+    principal = Principal(id=user.id, username=user.username, role=user.role)
+    principal_cache.set(user_id, principal)
+    # Most handlers use the sync engine, so don't hold this connection for the whole request
+    await db.commit()
+    return principal
+
+
 async def get_current_user(
     request: Request,
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
-    db: Session = Depends(get_db)
-) -> Optional[User]:
+    db: AsyncSession = Depends(get_async_db)
+) -> Optional[Principal]:
     """
     Get current user from JWT token or session.
     Returns None if not authenticated (for optional auth).
@@ -26,25 +63,25 @@ async def get_current_user(
             payload = AuthService.verify_token(credentials.credentials)
             user_id = payload.get("user_id")
             if user_id:
-                user = AuthService.get_user_by_id(db, user_id)
+                user = await _load_principal(db, user_id)
                 if user:
                     return user
         except:
             pass
-    
+
     # Try session as fallback
     user_id = request.session.get("user_id")
     if user_id:
-        user = AuthService.get_user_by_id(db, user_id)
+        user = await _load_principal(db, user_id)
         if user:
             return user
-    
+
     return None
 
 
 async def require_current_user(
-    current_user: Optional[User] = Depends(get_current_user)
-) -> User:
+    current_user: Optional[Principal] = Depends(get_current_user)
+) -> Principal:
     """
     Require authentication. Raises 401 if not authenticated.
     """
@@ -58,11 +95,11 @@ async def require_current_user(
 
 
 async def require_admin(
-    current_user: User = Depends(require_current_user)
-) -> User:
+    current_user: Principal = Depends(require_current_user)
+) -> Principal:
     if current_user.role != UserRole.ADMIN:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Admin access required"
         )
-    return current_user
\ No newline at end of file
+    return current_user
@@ -1,68 +1,91 @@
 # app/api/endpoints/admin.py - FIXED: Add Multiple Photos Support
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form
-from sqlalchemy.orm import Session
-from sqlalchemy import func, or_
-from typing import Optional, List
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, UploadFile, File, Form, Query
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy import func, or_, and_, insert, update, delete, select, case, true, literal, union_all
+from typing import Optional, List, Tuple
 from decimal import Decimal
 
 from app.database import get_db
-from app.api.deps import require_admin
-from app.models.user import User
+from app.config import settings
+from app.services.image_service import apply_metadata
+from app.services.upload_store import StoredUpload, process_uploads, release_upload, release_uploads
+from app.schemas.bulk import ReviewBulkAction, FeedbackBulkAction, DestinationBulkAction
+from app.api.deps import Principal, require_admin, principal_cache
+from app.core.cache import TTLCache
+from app.models.user import User, UserRole
 from app.models.destination import Destination, DestinationImage
 from app.models.category import Category
 from app.models.route import Route, TransportMode
 from app.models.review import Review
 from app.models.feedback import WebsiteFeedback
 import os
-import shutil
+import threading
 from pathlib import Path
-import uuid
-from datetime import datetime
 
+# Handlers here are plain `def`: FastAPI runs them in the threadpool, so the
+# blocking Session queries and upload file I/O never stall the event loop
 router = APIRouter()
 
 # File upload directory
-UPLOAD_DIR = Path("uploads")
-UPLOAD_DIR.mkdir(exist_ok=True)
-(UPLOAD_DIR / "destinations").mkdir(exist_ok=True)
-(UPLOAD_DIR / "categories").mkdir(exist_ok=True)
+UPLOAD_DIR = Path(settings.UPLOAD_DIR)
 
 
-# ============ HELPER FUNCTIONS ============
-def save_uploaded_file(file: UploadFile, folder: str) -> str:
-    """Save uploaded file and return path"""
-    ext = file.filename.split('.')[-1]
-    filename = f"{uuid.uuid4()}_{int(datetime.now().timestamp())}.{ext}"
-    file_path = UPLOAD_DIR / folder / filename
-    
-    with open(file_path, "wb") as f:
-        shutil.copyfileobj(file.file, f)
-    
-    return f"{folder}/{filename}"
+def ensure_upload_dirs():
+    """Create upload folders (called from the app lifespan, not at import)"""
+    UPLOAD_DIR.mkdir(exist_ok=True)
+    (UPLOAD_DIR / "destinations").mkdir(exist_ok=True)
+    (UPLOAD_DIR / "categories").mkdir(exist_ok=True)
 
 
 # ============ DASHBOARD ============
+# Every admin page draws sidebar badges from these stats
+dashboard_cache = TTLCache(maxsize=1, ttl=settings.DASHBOARD_STATS_TTL)
+dashboard_lock = threading.Lock()
+
+
 @router.get("/dashboard/stats")
-async def get_dashboard_stats(
+def get_dashboard_stats(
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_admin)
+    current_user: Principal = Depends(require_admin)
 ):
-    """Get dashboard statistics"""
-    
-    total_destinations = db.query(func.count(Destination.id)).scalar() or 0
-    active_destinations = db.query(func.count(Destination.id)).filter(
-        Destination.is_active == True
-    ).scalar() or 0
-    total_categories = db.query(func.count(Category.id)).scalar() or 0
-    total_routes = db.query(func.count(Route.id)).scalar() or 0
-    total_reviews = db.query(func.count(Review.id)).scalar() or 0
-    pending_reviews = db.query(func.count(Review.id)).filter(
-        Review.is_approved == False
-    ).scalar() or 0
-    total_feedback = db.query(func.count(WebsiteFeedback.id)).scalar() or 0
-    unread_feedback = db.query(func.count(WebsiteFeedback.id)).filter(
-        WebsiteFeedback.is_read == False
-    ).scalar() or 0
+    """Get dashboard statistics (shared by all admins for DASHBOARD_STATS_TTL seconds)"""
+    
+    stats = dashboard_cache.get("stats")
+    if stats is None:
+        # Only one request recomputes an expired entry; the rest wait and reuse it
+        with dashboard_lock:
+            stats = dashboard_cache.get("stats")
+            if stats is None:
+                stats = compute_dashboard_stats(db)
+                dashboard_cache.set("stats", stats)
+    return stats
+
+
+def compute_dashboard_stats(db: Session) -> dict:
+    """All dashboard counts in one statement, plus the recent destinations"""
+    
+    def counts(model, **flags):
+        """COUNT(*) plus one conditional SUM per flag, from a single pass over the table"""
+        columns = [func.count().label("total")]
+        for label, condition in flags.items():
+            columns.append(func.coalesce(func.sum(case((condition, 1), else_=0)), 0).label(label))
+        return select(*columns).select_from(model).subquery()
+    
+    dest = counts(Destination, active=Destination.is_active == True)
+    cats = counts(Category)
+    routes = counts(Route)
+    reviews = counts(Review, pending=Review.is_approved == False)
+    feedback = counts(WebsiteFeedback, unread=WebsiteFeedback.is_read == False)
+    
+    row = db.execute(
+        select(
+            dest.c.total, dest.c.active, cats.c.total, routes.c.total,
+            reviews.c.total, reviews.c.pending, feedback.c.total, feedback.c.unread
+        ).select_from(
+            # Each derived table is a single row, so the joins just line them up
+            dest.join(cats, true()).join(routes, true()).join(reviews, true()).join(feedback, true())
+        )
+    ).one()
     
     # Recent destinations
     recent_destinations = db.query(Destination).order_by(
@@ -70,14 +93,14 @@ async def get_dashboard_stats(
     ).limit(5).all()
     
     return {
-        "total_destinations": total_destinations,
-        "active_destinations": active_destinations,
-        "total_categories": total_categories,
-        "total_routes": total_routes,
-        "total_reviews": total_reviews,
-        "pending_reviews": pending_reviews,
-        "total_feedback": total_feedback,
-        "unread_feedback": unread_feedback,
+        "total_destinations": row[0],
+        "active_destinations": int(row[1]),
+        "total_categories": row[2],
+        "total_routes": row[3],
+        "total_reviews": row[4],
+        "pending_reviews": int(row[5]),
+        "total_feedback": row[6],
+        "unread_feedback": int(row[7]),
         "recent_destinations": [
             {
                 "id": d.id,
@@ -89,9 +112,259 @@ async def get_dashboard_stats(
     }
 
 
+# ============ HELPER FUNCTIONS ============
+def process_destination_uploads(
+    db: Session,
+    image: Optional[UploadFile],
+    additional_photos: Optional[List[UploadFile]]
+) -> Tuple[Optional[StoredUpload], List[StoredUpload]]:
+    """
+    Store the featured image and gallery photos of a destination form as one
+    concurrent batch. A rejected featured image fails the request; rejected
+    gallery photos are only reported back per file.
+    """
+    featured_file = image if image and image.filename else None
+    photo_files = [f for f in additional_photos or [] if f.filename]
+    
+    results = process_uploads(db, ([featured_file] if featured_file else []) + photo_files, "destinations")
+    featured = results.pop(0) if featured_file else None
+    
+    if featured and not featured.ok:
+        # Photos stored alongside are just written, so release_upload would
+        # keep them anyway; the upload GC removes them if they stay unused
+        raise HTTPException(status_code=featured.status_code, detail=featured.detail)
+    
+    return featured, results
+
+
+def set_featured_image(dest: Destination, upload: StoredUpload):
+    dest.image_path = upload.path
+    dest.image_variants = upload.variants
+    apply_metadata(dest, upload.metadata)
+
+
+def add_gallery_images(db: Session, destination_id: int, photos: List[StoredUpload]):
+    """Insert the gallery rows of all stored photos in one bulk INSERT"""
+    rows = [
+        {
+            "destination_id": destination_id,
+            "image_path": photo.path,
+            "variants": photo.variants,
+            "caption": "",
+            **(photo.metadata or {})
+        }
+        for photo in photos if photo.ok
+    ]
+    if rows:
+        db.execute(insert(DestinationImage), rows)
+
+
+# Bulk action filter fields -> WHERE condition for the given value
+DESTINATION_FILTERS = {
+    "category_id": lambda v: Destination.category_id == v,
+    "is_active": lambda v: Destination.is_active == v,
+}
+REVIEW_FILTERS = {
+    "destination_id": lambda v: Review.destination_id == v,
+    "is_approved": lambda v: Review.is_approved == v,
+    "max_rating": lambda v: Review.rating <= v,
+    "created_before": lambda v: Review.created_at < v,
+}
+FEEDBACK_FILTERS = {
+    "is_read": lambda v: WebsiteFeedback.is_read == v,
+    "category": lambda v: WebsiteFeedback.category == v,
+    "created_before": lambda v: WebsiteFeedback.created_at < v,
+}
+
+
+def bulk_selection(model, body, filters: dict):
+    """WHERE clause for a bulk action: the explicit ids, or the filter's conditions"""
+    if body.ids is not None:
+        return model.id.in_(body.ids)
+    return and_(*(filters[name](value) for name, value in body.filter.model_dump(exclude_none=True).items()))
+
+
+def bulk_update(db: Session, model, where, **values) -> int:
+    """
+    One set-based UPDATE. Rows already in the target state are left out of the
+    WHERE, so the count is rows actually changed on every backend (MySQL
+    reports changed rather than matched rows).
+    """
+    pending = or_(*(or_(getattr(model, k).is_(None), getattr(model, k) != v) for k, v in values.items()))
+    result = db.execute(
+        update(model).where(where, pending).values(**values)
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount
+
+
+def bulk_delete(db: Session, model, where) -> int:
+    result = db.execute(delete(model).where(where).execution_options(synchronize_session=False))
+    return result.rowcount
+
+
+def check_expected_count(db: Session, body, affected: int):
+    """Roll back a delete that removed a different number of rows than the client expected"""
+    if body.expected_count is not None and affected != body.expected_count:
+        db.rollback()
+        raise HTTPException(
+            status_code=409,
+            detail=f"Selection matches {affected} rows, expected {body.expected_count}; nothing was deleted"
+        )
+
+
+def sort_clause(sort: str, columns: dict) -> list:
+    """ORDER BY for a `sort` parameter: a column key, prefixed with '-' for descending"""
+    column = columns.get(sort.lstrip("-"))
+    if column is None:
+        raise HTTPException(
+            status_code=400,
+            detail=f"sort must be one of: {', '.join(sorted(columns))} (prefix '-' for descending)"
+        )
+    return [column.desc() if sort.startswith("-") else column.asc()]
+
+
+def status_counts(rows, status: Optional[str]) -> Tuple[dict, int]:
+    """
+    Active/inactive counts from (is_active, count) rows, and the total
+    matching the status filter - so one GROUP BY also replaces COUNT(*)
+    """
+    active = sum(n for is_active, n in rows if is_active)
+    inactive = sum(n for is_active, n in rows if not is_active)
+    counts = {"all": active + inactive, "active": active, "inactive": inactive}
+    return counts, counts[status or "all"]
+
+
+def page_info(total: int, page: int, page_size: int) -> dict:
+    return {
+        "total": total,
+        "page": page,
+        "page_size": page_size,
+        "total_pages": (total + page_size - 1) // page_size
+    }
+
+
+def prefix_pattern(prefix: str) -> str:
+    """LIKE pattern matching values that start with prefix (wildcards escaped)"""
+    escaped = prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return escaped + "%"
+
+
+def contains_pattern(text: str) -> str:
+    """LIKE pattern matching values that contain text (wildcards escaped)"""
+    return "%" + prefix_pattern(text)
+
+
 # ============ DESTINATIONS MANAGEMENT ============
+# Per-row counts as correlated subqueries: evaluated only for the rows on
+# the page (via the destination_id indexes) unless the page is sorted by them
+DEST_REVIEW_COUNT = select(func.count()).where(
+    Review.destination_id == Destination.id
+).correlate(Destination).scalar_subquery()
+DEST_PENDING_REVIEWS = select(func.count()).where(
+    Review.destination_id == Destination.id, Review.is_approved == False
+).correlate(Destination).scalar_subquery()
+DEST_AVG_RATING = select(func.avg(Review.rating)).where(
+    Review.destination_id == Destination.id, Review.is_approved == True
+).correlate(Destination).scalar_subquery()
+DEST_IMAGE_COUNT = select(func.count()).where(
+    DestinationImage.destination_id == Destination.id
+).correlate(Destination).scalar_subquery()
+
+DEST_SORTS = {
+    "name": Destination.name,
+    "created_at": Destination.created_at,
+    "updated_at": Destination.updated_at,
+    "category": Category.name,
+    "review_count": DEST_REVIEW_COUNT,
+    "pending_reviews": DEST_PENDING_REVIEWS,
+    "avg_rating": DEST_AVG_RATING,
+}
+
+
+@router.get("/destinations")
+def list_destinations(
+    page: int = Query(1, ge=1),
+    page_size: int = Query(25, ge=1, le=100),
+    search: Optional[str] = None,
+    category_id: Optional[int] = None,
+    status: Optional[str] = Query(None, pattern="^(active|inactive)$"),
+    sort: str = "name",
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(require_admin)
+):
+    """
+    Admin listing of active and inactive destinations together, searched,
+    filtered, sorted and paginated in the database. Two queries per page:
+    the status counts and the page itself, with per-row review and photo
+    counts included.
+    """
+    
+    order_by = sort_clause(sort, DEST_SORTS)
+    filters = []
+    if search:
+        pattern = contains_pattern(search)
+        filters.append(or_(
+            Destination.name.ilike(pattern, escape="\\"),
+            Destination.address.ilike(pattern, escape="\\"),
+            Destination.description.ilike(pattern, escape="\\")
+        ))
+    if category_id:
+        filters.append(Destination.category_id == category_id)
+    
+    counts, total = status_counts(
+        db.execute(
+            select(Destination.is_active, func.count()).where(*filters).group_by(Destination.is_active)
+        ).all(),
+        status
+    )
+    if status:
+        filters.append(Destination.is_active == (status == "active"))
+    
+    rows = db.execute(
+        select(
+            Destination.id, Destination.name, Destination.category_id,
+            Category.name.label("category_name"), Category.icon.label("category_icon"),
+            Destination.address, Destination.latitude, Destination.longitude,
+            Destination.image_path, Destination.image_color, Destination.is_active,
+            Destination.created_at, Destination.updated_at,
+            DEST_REVIEW_COUNT.label("review_count"),
+            DEST_PENDING_REVIEWS.label("pending_reviews"),
+            DEST_AVG_RATING.label("avg_rating"),
+            DEST_IMAGE_COUNT.label("image_count")
+        )
+        .outerjoin(Category, Category.id == Destination.category_id)
+        .where(*filters)
+        .order_by(*order_by, Destination.id)
+        .offset((page - 1) * page_size)
+        .limit(page_size)
+    ).mappings().all()
+    
+    return {
+        "destinations": [
+            {**row, "avg_rating": round(float(row["avg_rating"]), 1) if row["avg_rating"] is not None else None}
+            for row in rows
+        ],
+        "counts": counts,
+        **page_info(total, page, page_size)
+    }
+
+
+@router.get("/destinations/options")
+def destination_options(
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(require_admin)
+):
+    """Id and name of every destination, for pickers (route endpoints, review filters)"""
+    
+    rows = db.execute(
+        select(Destination.id, Destination.name, Destination.is_active).order_by(Destination.name, Destination.id)
+    ).mappings().all()
+    return [dict(row) for row in rows]
+
+
 @router.post("/destinations")
-async def create_destination(
+def create_destination(
     name: str = Form(...),
     category_id: int = Form(...),
     description: Optional[str] = Form(None),
@@ -107,14 +380,11 @@ async def create_destination(
     image: Optional[UploadFile] = File(None),
     additional_photos: List[UploadFile] = File(None),
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_admin)
+    current_user: Principal = Depends(require_admin)
 ):
     """Create new destination with multiple photos"""
     
-    # Handle featured image upload
-    image_path = None
-    if image:
-        image_path = save_uploaded_file(image, "destinations")
+    featured, photos = process_destination_uploads(db, image, additional_photos)
     
     # Create destination
     new_dest = Destination(
@@ -129,36 +399,91 @@ async def create_destination(
         website=website,
         opening_hours=opening_hours,
         entry_fee=entry_fee,
-        image_path=image_path,
         is_active=is_active
     )
+    if featured:
+        set_featured_image(new_dest, featured)
     
     db.add(new_dest)
+    db.flush()
+    
+    # Destination and gallery rows go in one transaction
+    add_gallery_images(db, new_dest.id, photos)
     db.commit()
-    db.refresh(new_dest)
-    
-    # Handle additional photos
-    if additional_photos and additional_photos[0].filename:
-        for photo_file in additional_photos:
-            if photo_file.filename:
-                photo_path = save_uploaded_file(photo_file, "destinations")
-                
-                new_image = DestinationImage(
-                    destination_id=new_dest.id,
-                    image_path=photo_path,
-                    caption=""
-                )
-                db.add(new_image)
-        
-        db.commit()
+    dashboard_cache.invalidate("stats")
+    
+    return {
+        "message": "Destination created successfully",
+        "id": new_dest.id,
+        "photos": [p.report() for p in photos]
+    }
+
+
+@router.put("/destinations/{destination_id}")
+def update_destination(
+    destination_id: int,
+    name: str = Form(...),
+    category_id: int = Form(...),
+    description: Optional[str] = Form(None),
+    address: Optional[str] = Form(None),
+    latitude: Optional[float] = Form(None),
+    longitude: Optional[float] = Form(None),
+    contact_number: Optional[str] = Form(None),
+    email: Optional[str] = Form(None),
+    website: Optional[str] = Form(None),
+    opening_hours: Optional[str] = Form(None),
+    entry_fee: Optional[str] = Form(None),
+    is_active: bool = Form(True),
+    image: Optional[UploadFile] = File(None),
+    additional_photos: List[UploadFile] = File(None),
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(require_admin)
+):
+    """Update destination; a new image replaces the featured one, new photos are added to the gallery"""
+    
+    dest = db.query(Destination).filter(Destination.id == destination_id).first()
+    if not dest:
+        raise HTTPException(status_code=404, detail="Destination not found")
+    
+    featured, photos = process_destination_uploads(db, image, additional_photos)
+    
+    # Update fields
+    dest.name = name
+    dest.category_id = category_id
+    dest.description = description
+    dest.address = address
+    dest.latitude = latitude
+    dest.longitude = longitude
+    dest.contact_number = contact_number
+    dest.email = email
+    dest.website = website
+    dest.opening_hours = opening_hours
+    dest.entry_fee = entry_fee
+    dest.is_active = is_active
+    
+    replaced = None
+    if featured:
+        replaced = (dest.image_path, dest.image_variants)
+        set_featured_image(dest, featured)
+    
+    add_gallery_images(db, destination_id, photos)
+    db.commit()
+    dashboard_cache.invalidate("stats")
     
-    return {"message": "Destination created successfully", "id": new_dest.id}
+    # The old featured image goes once nothing else references it
+    if replaced:
+        release_upload(db, *replaced)
+    
+    return {
+        "message": "Destination updated successfully",
+        "photos": [p.report() for p in photos]
+    }
 
 
 # app/api/endpoints/admin.py - ADD THIS ENDPOINT for Routes Update
 
 @router.put("/routes/{route_id}")
-async def update_route(
+def update_route(
     route_id: int,
     route_name: Optional[str] = Form(None),
     origin_id: int = Form(...),
@@ -171,7 +496,7 @@ async def update_route(
     description: Optional[str] = Form(None),
     is_active: bool = Form(True),
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_admin)
+    current_user: Principal = Depends(require_admin)
 ):
     """Update existing route"""
     
@@ -195,31 +520,12 @@ async def update_route(
     
     return {"message": "Route updated successfully"}
 
-    
-    
-    # Handle additional photos
-    if additional_photos and additional_photos[0].filename:
-        for photo_file in additional_photos:
-            if photo_file.filename:
-                photo_path = save_uploaded_file(photo_file, "destinations")
-                
-                new_image = DestinationImage(
-                    destination_id=destination_id,
-                    image_path=photo_path,
-                    caption=""
-                )
-                db.add(new_image)
-        
-        db.commit()
-    
-    return {"message": "Destination updated successfully"}
-
 
 @router.delete("/destination-images/{image_id}")
-async def delete_destination_image(
+def delete_destination_image(
     image_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_admin)
+    current_user: Principal = Depends(require_admin)
 ):
     """Delete a destination gallery image"""
     
@@ -227,22 +533,21 @@ async def delete_destination_image(
     if not image:
         raise HTTPException(status_code=404, detail="Image not found")
     
-    # Delete file
-    image_path = UPLOAD_DIR / image.image_path
-    if image_path.exists():
-        image_path.unlink()
-    
+    image_path, variants = image.image_path, image.variants
     db.delete(image)
     db.commit()
     
+    # Remove the file and its variants unless another row still uses it
+    release_upload(db, image_path, variants)
+    
     return {"message": "Image deleted successfully"}
 
 
 @router.delete("/destinations/{destination_id}")
-async def delete_destination(
+def delete_destination(
     destination_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_admin)
+    current_user: Principal = Depends(require_admin)
 ):
     """Delete destination"""
     
@@ -250,33 +555,29 @@ async def delete_destination(
     if not dest:
         raise HTTPException(status_code=404, detail="Destination not found")
     
-    # Delete featured image
-    if dest.image_path:
-        image_path = UPLOAD_DIR / dest.image_path
-        if image_path.exists():
-            image_path.unlink()
-    
-    # Delete gallery images (cascade will handle DB, but we need to delete files)
+    # Featured and gallery files (cascade will handle DB, but we need to delete files)
     gallery_images = db.query(DestinationImage).filter(
         DestinationImage.destination_id == destination_id
     ).all()
-    
-    for img in gallery_images:
-        img_path = UPLOAD_DIR / img.image_path
-        if img_path.exists():
-            img_path.unlink()
+    files = [(dest.image_path, dest.image_variants)]
+    files += [(img.image_path, img.variants) for img in gallery_images]
     
     db.delete(dest)
     db.commit()
+    dashboard_cache.invalidate("stats")
+    
+    # Files are shared by content, so only unlink those nothing else references
+    for image_path, variants in files:
+        release_upload(db, image_path, variants)
     
     return {"message": "Destination deleted successfully"}
 
 
 @router.patch("/destinations/{destination_id}/toggle")
-async def toggle_destination_status(
+def toggle_destination_status(
     destination_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_admin)
+    current_user: Principal = Depends(require_admin)
 ):
     """Toggle destination active status"""
     
@@ -286,35 +587,82 @@ async def toggle_destination_status(
     
     dest.is_active = not dest.is_active
     db.commit()
+    dashboard_cache.invalidate("stats")
     
     return {"message": "Status updated", "is_active": dest.is_active}
 
 
+@router.post("/destinations/bulk")
+def bulk_destination_action(
+    body: DestinationBulkAction,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(require_admin)
+):
+    """Activate, deactivate or delete many destinations in one transaction"""
+    
+    where = bulk_selection(Destination, body, DESTINATION_FILTERS)
+    related = {}
+    
+    if body.action == "delete":
+        selected = select(Destination.id).where(where).scalar_subquery()
+        files = db.execute(select(Destination.image_path, Destination.image_variants).where(where)).all()
+        files += db.execute(
+            select(DestinationImage.image_path, DestinationImage.variants)
+            .where(DestinationImage.destination_id.in_(selected))
+        ).all()
+        
+        # Children first, explicitly, so no backend depends on ON DELETE CASCADE
+        related = {
+            "images": bulk_delete(db, DestinationImage, DestinationImage.destination_id.in_(selected)),
+            "reviews": bulk_delete(db, Review, Review.destination_id.in_(selected)),
+            "routes": bulk_delete(db, Route, or_(Route.origin_id.in_(selected), Route.destination_id.in_(selected))),
+        }
+        affected = bulk_delete(db, Destination, where)
+        check_expected_count(db, body, affected)
+        db.commit()
+        
+        # Files are shared by content, so only unlink those nothing else references
+        background_tasks.add_task(release_uploads, files)
+    else:
+        affected = bulk_update(db, Destination, where, is_active=body.action == "activate")
+        db.commit()
+    
+    dashboard_cache.invalidate("stats")
+    return {
+        "message": f"{affected} destinations {body.action}d",
+        "action": body.action,
+        "affected": affected,
+        "related": related
+    }
+
+
 # ============ CATEGORIES MANAGEMENT ============
 @router.post("/categories")
-async def create_category(
+def create_category(
     name: str = Form(...),
     icon: str = Form(...),
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_admin)
+    current_user: Principal = Depends(require_admin)
 ):
     """Create new category"""
     
     new_cat = Category(name=name, icon=icon)
     db.add(new_cat)
     db.commit()
+    dashboard_cache.invalidate("stats")
     db.refresh(new_cat)
     
     return {"message": "Category created successfully", "id": new_cat.id}
 
 
 @router.put("/categories/{category_id}")
-async def update_category(
+def update_category(
     category_id: int,
     name: str = Form(...),
     icon: str = Form(...),
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_admin)
+    current_user: Principal = Depends(require_admin)
 ):
     """Update category"""
     
@@ -330,10 +678,10 @@ async def update_category(
 
 
 @router.delete("/categories/{category_id}")
-async def delete_category(
+def delete_category(
     category_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_admin)
+    current_user: Principal = Depends(require_admin)
 ):
     """Delete category"""
     
@@ -354,13 +702,115 @@ async def delete_category(
     
     db.delete(cat)
     db.commit()
+    dashboard_cache.invalidate("stats")
     
     return {"message": "Category deleted successfully"}
 
 
 # ============ ROUTES MANAGEMENT ============
+RouteOrigin = aliased(Destination)
+RouteTarget = aliased(Destination)
+
+ROUTE_SORTS = {
+    "route_name": Route.route_name,
+    "origin": RouteOrigin.name,
+    "destination": RouteTarget.name,
+    "transport_mode": Route.transport_mode,
+    "distance_km": Route.distance_km,
+    "estimated_time_minutes": Route.estimated_time_minutes,
+    "base_fare": Route.base_fare,
+    "created_at": Route.created_at,
+}
+
+
+@router.get("/routes")
+def list_routes(
+    page: int = Query(1, ge=1),
+    page_size: int = Query(25, ge=1, le=100),
+    search: Optional[str] = None,
+    transport_mode: Optional[TransportMode] = None,
+    destination_id: Optional[int] = None,
+    status: Optional[str] = Query(None, pattern="^(active|inactive)$"),
+    sort: str = "route_name",
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(require_admin)
+):
+    """
+    Admin listing of active and inactive routes with endpoint names joined
+    in, searched, filtered, sorted and paginated in the database. Status and
+    transport mode counts come from one GROUP BY.
+    """
+    
+    order_by = sort_clause(sort, ROUTE_SORTS)
+    
+    def with_endpoints(query):
+        return (
+            query.outerjoin(RouteOrigin, RouteOrigin.id == Route.origin_id)
+            .outerjoin(RouteTarget, RouteTarget.id == Route.destination_id)
+        )
+    
+    filters = []
+    if search:
+        pattern = contains_pattern(search)
+        filters.append(or_(
+            Route.route_name.ilike(pattern, escape="\\"),
+            RouteOrigin.name.ilike(pattern, escape="\\"),
+            RouteTarget.name.ilike(pattern, escape="\\")
+        ))
+    if destination_id:
+        # Routes touching the destination at either end
+        filters.append(or_(Route.origin_id == destination_id, Route.destination_id == destination_id))
+    
+    count_query = select(Route.is_active, Route.transport_mode, func.count())
+    if search:
+        count_query = with_endpoints(count_query)
+    grouped = db.execute(
+        count_query.where(*filters).group_by(Route.is_active, Route.transport_mode)
+    ).all()
+    mode = transport_mode.value if transport_mode else None
+    counts, total = status_counts(
+        [(is_active, n) for is_active, m, n in grouped if mode is None or m == mode],
+        status
+    )
+    wanted = None if status is None else status == "active"
+    modes = {}
+    for is_active, m, n in grouped:
+        if wanted is None or bool(is_active) == wanted:
+            modes[m] = modes.get(m, 0) + n
+    counts["transport_modes"] = modes
+    
+    if mode:
+        filters.append(Route.transport_mode == mode)
+    if status:
+        filters.append(Route.is_active == wanted)
+    
+    rows = db.execute(
+        with_endpoints(select(
+            Route.id, Route.route_name, Route.origin_id, Route.destination_id,
+            Route.transport_mode, Route.distance_km, Route.estimated_time_minutes,
+            Route.base_fare, Route.fare_per_km, Route.description, Route.is_active,
+            Route.created_at,
+            RouteOrigin.name.label("origin_name"),
+            RouteTarget.name.label("destination_name")
+        ))
+        .where(*filters)
+        .order_by(*order_by, Route.id)
+        .offset((page - 1) * page_size)
+        .limit(page_size)
+    ).mappings().all()
+    
+    routes = []
+    for row in rows:
+        total_fare = None
+        if row["base_fare"] is not None and row["distance_km"] is not None and row["fare_per_km"] is not None:
+            total_fare = Decimal(str(row["base_fare"])) + Decimal(str(row["distance_km"])) * Decimal(str(row["fare_per_km"]))
+        routes.append({**row, "total_fare": total_fare})
+    
+    return {"routes": routes, "counts": counts, **page_info(total, page, page_size)}
+
+
 @router.post("/routes")
-async def create_route(
+def create_route(
     route_name: Optional[str] = Form(None),
     origin_id: int = Form(...),
     destination_id: int = Form(...),
@@ -372,7 +822,7 @@ async def create_route(
     description: Optional[str] = Form(None),
     is_active: bool = Form(True),
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_admin)
+    current_user: Principal = Depends(require_admin)
 ):
     """Create new route"""
     
@@ -391,16 +841,17 @@ async def create_route(
     
     db.add(new_route)
     db.commit()
+    dashboard_cache.invalidate("stats")
     db.refresh(new_route)
     
     return {"message": "Route created successfully", "id": new_route.id}
 
 
 @router.delete("/routes/{route_id}")
-async def delete_route(
+def delete_route(
     route_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_admin)
+    current_user: Principal = Depends(require_admin)
 ):
     """Delete route"""
     
@@ -410,16 +861,17 @@ async def delete_route(
     
     db.delete(route)
     db.commit()
+    dashboard_cache.invalidate("stats")
     
     return {"message": "Route deleted successfully"}
 
 
 # ============ REVIEWS MANAGEMENT ============
 @router.delete("/reviews/{review_id}")
-async def delete_review(
+def delete_review(
     review_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_admin)
+    current_user: Principal = Depends(require_admin)
 ):
     """Delete review"""
     
@@ -429,15 +881,16 @@ async def delete_review(
     
     db.delete(review)
     db.commit()
+    dashboard_cache.invalidate("stats")
     
     return {"message": "Review deleted successfully"}
 
 
 @router.patch("/reviews/{review_id}/toggle")
-async def toggle_review_approval(
+def toggle_review_approval(
     review_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_admin)
+    current_user: Principal = Depends(require_admin)
 ):
     """Toggle review approval"""
     
@@ -447,15 +900,37 @@ async def toggle_review_approval(
     
     review.is_approved = not review.is_approved
     db.commit()
+    dashboard_cache.invalidate("stats")
     
     return {"message": "Review status updated", "is_approved": review.is_approved}
 
 
+@router.post("/reviews/bulk")
+def bulk_review_action(
+    body: ReviewBulkAction,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(require_admin)
+):
+    """Approve, unapprove or delete many reviews in one statement"""
+    
+    where = bulk_selection(Review, body, REVIEW_FILTERS)
+    
+    if body.action == "delete":
+        affected = bulk_delete(db, Review, where)
+        check_expected_count(db, body, affected)
+    else:
+        affected = bulk_update(db, Review, where, is_approved=body.action == "approve")
+    db.commit()
+    
+    dashboard_cache.invalidate("stats")
+    return {"message": f"{affected} reviews {body.action}d", "action": body.action, "affected": affected}
+
+
 # ============ FEEDBACK MANAGEMENT ============
 @router.get("/feedback")
-async def get_all_feedback(
+def get_all_feedback(
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_admin)
+    current_user: Principal = Depends(require_admin)
 ):
     """Get all feedback"""
     
@@ -468,10 +943,10 @@ async def get_all_feedback(
 
 
 @router.patch("/feedback/{feedback_id}/read")
-async def mark_feedback_read(
+def mark_feedback_read(
     feedback_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_admin)
+    current_user: Principal = Depends(require_admin)
 ):
     """Mark feedback as read"""
     
@@ -484,15 +959,16 @@ async def mark_feedback_read(
     
     feedback.is_read = True
     db.commit()
+    dashboard_cache.invalidate("stats")
     
     return {"message": "Feedback marked as read"}
 
 
 @router.delete("/feedback/{feedback_id}")
-async def delete_feedback(
+def delete_feedback(
     feedback_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_admin)
+    current_user: Principal = Depends(require_admin)
 ):
     """Delete feedback"""
     
@@ -505,34 +981,114 @@ async def delete_feedback(
     
     db.delete(feedback)
     db.commit()
+    dashboard_cache.invalidate("stats")
     
     return {"message": "Feedback deleted successfully"}
 
 
+@router.post("/feedback/bulk")
+def bulk_feedback_action(
+    body: FeedbackBulkAction,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(require_admin)
+):
+    """Mark read/unread or delete many feedback entries in one statement"""
+    
+    where = bulk_selection(WebsiteFeedback, body, FEEDBACK_FILTERS)
+    
+    if body.action == "delete":
+        affected = bulk_delete(db, WebsiteFeedback, where)
+        check_expected_count(db, body, affected)
+    else:
+        affected = bulk_update(db, WebsiteFeedback, where, is_read=body.action == "mark_read")
+    db.commit()
+    
+    dashboard_cache.invalidate("stats")
+    return {"message": f"{affected} feedback entries updated", "action": body.action, "affected": affected}
+
+
 # ============ USERS MANAGEMENT ============
 @router.get("/users")
-async def get_all_users(
+def get_all_users(
+    cursor: Optional[int] = Query(None, ge=1),
+    limit: int = Query(50, ge=1, le=200),
+    search: Optional[str] = Query(None, max_length=100),
+    role: Optional[UserRole] = None,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_admin)
+    current_user: Principal = Depends(require_admin)
 ):
-    """Get all users"""
-    
-    users = db.query(User).order_by(User.created_at.desc()).all()
+    """
+    One page of users, newest first. Pass the returned next_cursor back as
+    `cursor` for the following page (keyset on id, so deep pages cost the
+    same as the first). `search` is a prefix match on username or email,
+    served by their indexes. Role counts are only computed for the first page.
+    """
+    
+    matching = []
+    if search:
+        pattern = prefix_pattern(search.strip())
+        matching.append(or_(
+            User.username.like(pattern, escape="\\"),
+            User.email.like(pattern, escape="\\")
+        ))
+    role_filter = [User.role == role] if role else []
+    
+    query = select(User.id, User.username, User.email, User.role, User.created_at).where(*matching, *role_filter)
+    if cursor:
+        query = query.where(User.id < cursor)
+    rows = db.execute(query.order_by(User.id.desc()).limit(limit + 1)).all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    
+    # Review and feedback counts for the whole page in one grouped query
+    activity = {}
+    ids = [row.id for row in rows]
+    if ids:
+        per_source = union_all(
+            select(Review.user_id.label("user_id"), literal(1).label("reviews"), literal(0).label("feedback"))
+            .where(Review.user_id.in_(ids)),
+            select(WebsiteFeedback.user_id, literal(0), literal(1))
+            .where(WebsiteFeedback.user_id.in_(ids))
+        ).subquery()
+        activity = {
+            user_id: (reviews, feedback)
+            for user_id, reviews, feedback in db.execute(
+                select(per_source.c.user_id, func.sum(per_source.c.reviews), func.sum(per_source.c.feedback))
+                .group_by(per_source.c.user_id)
+            )
+        }
+    
+    result = {
+        "users": [{
+            "id": u.id,
+            "username": u.username,
+            "email": u.email,
+            "role": u.role.value,
+            "created_at": u.created_at,
+            "review_count": int(activity.get(u.id, (0, 0))[0]),
+            "feedback_count": int(activity.get(u.id, (0, 0))[1])
+        } for u in rows],
+        "next_cursor": rows[-1].id if has_more else None
+    }
     
-    return [{
-        "id": u.id,
-        "username": u.username,
-        "email": u.email,
-        "role": u.role.value,
-        "created_at": u.created_at
-    } for u in users]
+    if cursor is None:
+        # Role counts ignore the role filter so the filter options can show them
+        by_role = dict(db.execute(
+            select(User.role, func.count()).where(*matching).group_by(User.role)
+        ).all())
+        counts = {r.value: by_role.get(r, 0) for r in UserRole}
+        counts["all"] = sum(counts.values())
+        result["counts"] = counts
+        result["total"] = counts[role.value] if role else counts["all"]
+    
+    return result
 
 
 @router.patch("/users/{user_id}/toggle-role")
-async def toggle_user_role(
+def toggle_user_role(
     user_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_admin)
+    current_user: Principal = Depends(require_admin)
 ):
     """Toggle user role between admin and user"""
     
@@ -546,18 +1102,18 @@ async def toggle_user_role(
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     
-    from app.models.user import UserRole
     user.role = UserRole.USER if user.role == UserRole.ADMIN else UserRole.ADMIN
     db.commit()
+    principal_cache.invalidate(user_id)
     
     return {"message": "User role updated", "role": user.role.value}
 
 
 @router.delete("/users/{user_id}")
-async def delete_user(
+def delete_user(
     user_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_admin)
+    current_user: Principal = Depends(require_admin)
 ):
     """Delete user"""
     
@@ -573,5 +1129,7 @@ async def delete_user(
     
     db.delete(user)
     db.commit()
+    dashboard_cache.invalidate("stats")
+    principal_cache.invalidate(user_id)
     
     return {"message": "User deleted successfully"}
\ No newline at end of file
@@ -1,13 +1,14 @@
 # app/api/endpoints/auth.py - FIXED Authentication API Endpoints
 from fastapi import APIRouter, Depends, HTTPException, status, Request
 from fastapi.responses import JSONResponse
-from sqlalchemy.orm import Session
+from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.database import get_async_db
 from app.services.auth_service import AuthService
 from app.schemas.auth import UserRegister, UserLogin, UserResponse, Token, UserWithToken
-from app.api.deps import get_current_user
-from app.models.user import User
+from app.api.deps import Principal, get_current_user
+from app.core.rate_limit import login_throttle
 
 router = APIRouter()
 
@@ -15,11 +16,11 @@ router = APIRouter()
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
 async def register(
     user_data: UserRegister,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Register a new user - FIXED"""
     try:
-        user = AuthService.register_user(
+        user = await AuthService.register_user(
             db=db,
             username=user_data.username,
             email=user_data.email,
@@ -49,11 +50,17 @@ async def register(
 async def login(
     request: Request,
     credentials: UserLogin,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Login user and return token - FIXED"""
+    # Throttle before touching the database or bcrypt
+    await login_throttle.check(
+        request.client.host if request.client else None,
+        credentials.username
+    )
+    
     try:
-        user = AuthService.authenticate_user(
+        user = await AuthService.authenticate_user(
             db=db,
             username=credentials.username,
             password=credentials.password
@@ -65,6 +72,8 @@ async def login(
                 detail="Invalid username or password"
             )
         
+        await login_throttle.success(user.username)
+        
         # Create access token
         access_token = AuthService.create_access_token(
             data={"user_id": user.id, "username": user.username}
@@ -110,7 +119,8 @@ async def logout(request: Request):
 
 @router.get("/me", response_model=UserResponse)
 async def get_current_user_info(
-    current_user: User = Depends(get_current_user)
+    current_user: Optional[Principal] = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get current user information"""
     if not current_user:
@@ -118,7 +128,15 @@ async def get_current_user_info(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Not authenticated"
         )
-    return current_user
+    
+    # The cached principal only holds id/username/role, load the full profile
+    user = await AuthService.get_user_by_id(db, current_user.id)
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated"
+        )
+    return user
 
 
 @router.get("/check-session")
@@ -3,7 +3,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 from typing import List
-from app.database import get_db
+from app.database import get_read_db
 from app.models.category import Category
 from app.models.destination import Destination
 from app.schemas.category import CategoryResponse
@@ -12,7 +12,7 @@ router = APIRouter()
 
 
 @router.get("/", response_model=List[CategoryResponse])
-def get_categories(db: Session = Depends(get_db)):
+def get_categories(db: Session = Depends(get_read_db)):
     """Get all categories with destination count"""
     
     categories = db.query(
@@ -38,7 +38,7 @@ def get_categories(db: Session = Depends(get_db)):
 
 
 @router.get("/{category_id}", response_model=CategoryResponse)
-def get_category(category_id: int, db: Session = Depends(get_db)):
+def get_category(category_id: int, db: Session = Depends(get_read_db)):
     """Get single category by ID"""
     
     category = db.query(Category).filter(Category.id == category_id).first()
@@ -3,7 +3,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 from sqlalchemy import func, or_
 from typing import Optional
-from app.database import get_db
+from app.database import get_read_db
 from app.models.destination import Destination, DestinationImage
 from app.models.category import Category
 from app.models.review import Review
@@ -19,7 +19,7 @@ def get_destinations(
     search: Optional[str] = None,
     category_id: Optional[int] = None,
     is_active: bool = True,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """Get list of destinations with pagination and filters"""
     
@@ -86,7 +86,7 @@ def get_destinations(
 
 
 @router.get("/{destination_id}", response_model=DestinationResponse)
-def get_destination(destination_id: int, db: Session = Depends(get_db)):
+def get_destination(destination_id: int, db: Session = Depends(get_read_db)):
     """Get single destination by ID with all related data"""
     
     destination = db.query(Destination).filter(
@@ -132,7 +132,7 @@ def get_destination(destination_id: int, db: Session = Depends(get_db)):
 
 
 @router.get("/stats/summary")
-def get_destination_stats(db: Session = Depends(get_db)):
+def get_destination_stats(db: Session = Depends(get_read_db)):
     """Get destination statistics for homepage"""
     
     total_destinations = db.query(func.count(Destination.id)).filter(
@@ -0,0 +1,168 @@
+# app/api/endpoints/export.py - Streaming Admin Data Export
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from typing import Optional, Iterator
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+import csv
+import io
+import json
+import zlib
+
+from app.database import SessionLocal
+from app.api.deps import Principal, require_admin
+from app.models.destination import Destination
+from app.models.review import Review
+from app.models.feedback import WebsiteFeedback
+
+router = APIRouter()
+
+# Rows fetched per round-trip from the server-side cursor
+EXPORT_BATCH_SIZE = 500
+
+# Flush the encoded buffer to the client once it grows past this size
+EXPORT_CHUNK_BYTES = 64 * 1024
+
+# Exportable tables and the columns written for each of them
+EXPORT_DATASETS = {
+    "reviews": (Review, [
+        "id", "destination_id", "user_id", "user_name", "rating",
+        "comment", "is_approved", "created_at"
+    ]),
+    "feedback": (WebsiteFeedback, [
+        "id", "user_id", "user_name", "email", "rating", "category",
+        "feedback", "is_public", "is_read", "created_at"
+    ]),
+    "destinations": (Destination, [
+        "id", "name", "category_id", "description", "address", "latitude",
+        "longitude", "contact_number", "email", "website", "opening_hours",
+        "entry_fee", "rating", "image_path", "is_active", "created_at",
+        "updated_at"
+    ]),
+}
+
+
+# ============ HELPER FUNCTIONS ============
+def _to_text(value):
+    """Convert a column value to a plain CSV/JSON friendly value"""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+
+def _iter_rows(model, columns: list, start_date: Optional[date], end_date: Optional[date]) -> Iterator:
+    """
+    Yield rows one at a time using a server-side cursor.
+    Opens its own session because the request-scoped one is closed
+    before the response body starts streaming.
+    """
+    db = SessionLocal()
+    try:
+        query = select(*[getattr(model, c) for c in columns]).order_by(model.id)
+
+        if start_date:
+            query = query.where(model.created_at >= start_date)
+        if end_date:
+            # Inclusive end date
+            query = query.where(model.created_at < end_date + timedelta(days=1))
+
+        result = db.execute(
+            query,
+            execution_options={"stream_results": True, "yield_per": EXPORT_BATCH_SIZE}
+        )
+        for row in result:
+            yield row
+    finally:
+        db.close()
+
+
+def _encode_csv(rows: Iterator, columns: list) -> Iterator[bytes]:
+    """Encode rows as CSV, yielding chunks of roughly EXPORT_CHUNK_BYTES"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+
+    for row in rows:
+        writer.writerow([_to_text(v) for v in row])
+        if buffer.tell() >= EXPORT_CHUNK_BYTES:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+def _encode_ndjson(rows: Iterator, columns: list) -> Iterator[bytes]:
+    """Encode rows as newline-delimited JSON objects"""
+    chunk = []
+    size = 0
+
+    for row in rows:
+        line = json.dumps(
+            {c: _to_text(v) for c, v in zip(columns, row)},
+            ensure_ascii=False
+        ) + "\n"
+        chunk.append(line)
+        size += len(line)
+        if size >= EXPORT_CHUNK_BYTES:
+            yield "".join(chunk).encode("utf-8")
+            chunk = []
+            size = 0
+
+    if chunk:
+        yield "".join(chunk).encode("utf-8")
+
+
+def _gzip_stream(chunks: Iterator[bytes]) -> Iterator[bytes]:
+    """Compress a byte stream on the fly into gzip format"""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)  # 31 = gzip container
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+# ============ EXPORT ENDPOINT ============
+@router.get("/{dataset}")
+def export_dataset(
+    dataset: str,
+    format: str = Query("csv", pattern="^(csv|ndjson)$"),
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    gzip: bool = False,
+    current_user: Principal = Depends(require_admin)
+):
+    """Stream reviews, feedback or destinations as CSV or NDJSON"""
+
+    if dataset not in EXPORT_DATASETS:
+        raise HTTPException(status_code=404, detail="Unknown export dataset")
+
+    if start_date and end_date and start_date > end_date:
+        raise HTTPException(status_code=400, detail="start_date must be before end_date")
+
+    model, columns = EXPORT_DATASETS[dataset]
+    rows = _iter_rows(model, columns, start_date, end_date)
+
+    if format == "csv":
+        body = _encode_csv(rows, columns)
+        media_type = "text/csv; charset=utf-8"
+    else:
+        body = _encode_ndjson(rows, columns)
+        media_type = "application/x-ndjson"
+
+    filename = f"{dataset}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{format}"
+    if gzip:
+        body = _gzip_stream(body)
+        media_type = "application/gzip"
+        filename += ".gz"
+
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
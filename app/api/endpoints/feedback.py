@@ -1,10 +1,10 @@
 # app/api/endpoints/feedback.py - FIXED Feedback API Endpoints
 from fastapi import APIRouter, Depends, HTTPException
 from fastapi.responses import JSONResponse
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import func, select
 from typing import List
-from app.database import get_db
+from app.database import get_async_db
 from app.models.feedback import WebsiteFeedback
 from app.schemas.feedback import FeedbackCreate, FeedbackResponse, FeedbackStats
 
@@ -12,7 +12,7 @@ router = APIRouter()
 
 
 @router.post("/", status_code=201)
-async def submit_feedback(feedback: FeedbackCreate, db: Session = Depends(get_db)):
+async def submit_feedback(feedback: FeedbackCreate, db: AsyncSession = Depends(get_async_db)):
     """Submit website feedback - FIXED"""
     try:
         # Create feedback with string category (no enum conversion needed)
@@ -27,8 +27,8 @@ async def submit_feedback(feedback: FeedbackCreate, db: Session = Depends(get_db
         )
         
         db.add(db_feedback)
-        db.commit()
-        db.refresh(db_feedback)
+        await db.commit()
+        await db.refresh(db_feedback)
         
         # Return JSON response
         return JSONResponse(
@@ -47,18 +47,21 @@ async def submit_feedback(feedback: FeedbackCreate, db: Session = Depends(get_db
         )
         
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         print(f"Feedback submission error: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to submit feedback: {str(e)}")
 
 
 @router.get("/public")
-async def get_public_feedback(limit: int = 10, db: Session = Depends(get_db)):
+async def get_public_feedback(limit: int = 10, db: AsyncSession = Depends(get_async_db)):
     """Get public feedback for display - FIXED"""
     try:
-        feedbacks = db.query(WebsiteFeedback).filter(
-            WebsiteFeedback.is_public == True
-        ).order_by(WebsiteFeedback.created_at.desc()).limit(limit).all()
+        rows = await db.execute(
+            select(WebsiteFeedback).where(
+                WebsiteFeedback.is_public == True
+            ).order_by(WebsiteFeedback.created_at.desc()).limit(limit)
+        )
+        feedbacks = rows.scalars().all()
         
         # Convert to JSON-serializable format
         result = []
@@ -83,16 +86,18 @@ async def get_public_feedback(limit: int = 10, db: Session = Depends(get_db)):
 
 
 @router.get("/stats")
-async def get_feedback_stats(db: Session = Depends(get_db)):
+async def get_feedback_stats(db: AsyncSession = Depends(get_async_db)):
     """Get feedback statistics - FIXED"""
     try:
-        total = db.query(func.count(WebsiteFeedback.id)).scalar() or 0
+        total = await db.scalar(select(func.count(WebsiteFeedback.id))) or 0
         
-        avg_rating = db.query(func.avg(WebsiteFeedback.rating)).scalar()
+        avg_rating = await db.scalar(select(func.avg(WebsiteFeedback.rating)))
         
-        unread = db.query(func.count(WebsiteFeedback.id)).filter(
-            WebsiteFeedback.is_read == False
-        ).scalar() or 0
+        unread = await db.scalar(
+            select(func.count(WebsiteFeedback.id)).where(
+                WebsiteFeedback.is_read == False
+            )
+        ) or 0
         
         return JSONResponse(content={
             "total_feedback": total,
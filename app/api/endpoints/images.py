@@ -0,0 +1,92 @@
+# app/api/endpoints/images.py - On-Demand Image Resizing
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from pathlib import Path
+from typing import BinaryIO, Optional
+import anyio
+import os
+
+from app.config import settings
+from app.core.static_files import IMMUTABLE
+from app.services.image_cache import resize_cache
+from app.services.image_service import VARIANT_FORMATS
+
+router = APIRouter()
+
+UPLOAD_DIR = Path(settings.UPLOAD_DIR)
+MEDIA_TYPES = {"webp": "image/webp", "jpeg": "image/jpeg"}
+CHUNK_SIZE = 64 * 1024
+
+
+async def stream_file(file: BinaryIO):
+    """Send an already open file in chunks (it may be unlinked by cache eviction meanwhile)"""
+    async with anyio.wrap_file(file) as f:
+        while chunk := await f.read(CHUNK_SIZE):
+            yield chunk
+
+
+class OpenFileResponse(StreamingResponse):
+    """
+    Streams an open file and closes it however the response ends - also when
+    the client disconnects before the body starts, so the generator never runs.
+    """
+
+    def __init__(self, file: BinaryIO, **kwargs):
+        super().__init__(stream_file(file), **kwargs)
+        self.file = file
+
+    async def __call__(self, scope, receive, send):
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            self.file.close()
+
+
+def resolve_upload(path: str) -> Optional[Path]:
+    """File under UPLOAD_DIR for a request path, or None (no hidden files, no escaping the directory)"""
+    if any(part.startswith(".") for part in Path(path).parts):
+        return None
+    root = UPLOAD_DIR.resolve()
+    full = (root / path).resolve()
+    if not full.is_relative_to(root) or not full.is_file():
+        return None
+    return full
+
+
+@router.get("/{width}/{path:path}")
+async def get_resized_image(
+    width: int,
+    path: str,
+    request: Request,
+    format: Optional[str] = Query(None, description="webp or jpeg; negotiated from Accept when omitted")
+):
+    """Any uploaded image resized to an allow-listed width, cached on disk after the first request"""
+    if width not in settings.IMAGE_RESIZE_WIDTHS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Width must be one of {', '.join(map(str, settings.IMAGE_RESIZE_WIDTHS))}"
+        )
+
+    fmt = format
+    if fmt is None:
+        fmt = "webp" if "image/webp" in request.headers.get("accept", "") else "jpeg"
+    if fmt not in VARIANT_FORMATS:
+        raise HTTPException(status_code=400, detail=f"Format must be one of {', '.join(VARIANT_FORMATS)}")
+
+    source = await anyio.to_thread.run_sync(resolve_upload, path)
+    if source is None:
+        raise HTTPException(status_code=404, detail="Image not found")
+
+    try:
+        cached = await resize_cache.open(source, path, width, fmt)
+    except HTTPException:
+        raise
+    except Exception as e:
+        print(f"Could not resize {path} to {width}px {fmt}: {e}")
+        raise HTTPException(status_code=415, detail="File is not a supported image")
+
+    headers = {"Cache-Control": IMMUTABLE}
+    if format is None:
+        headers["Vary"] = "Accept"
+    headers["Content-Length"] = str(os.fstat(cached.fileno()).st_size)
+    return OpenFileResponse(cached, media_type=MEDIA_TYPES[fmt], headers=headers)
@@ -0,0 +1,47 @@
+# app/api/endpoints/imports.py - Admin Catalog Import
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form
+from sqlalchemy.orm import Session
+from typing import Optional
+
+from app.database import get_db
+from app.api.deps import Principal, require_admin
+from app.api.endpoints.admin import dashboard_cache
+from app.services.catalog_import import FORMATS, IMPORTERS, detect_format, run_import
+
+router = APIRouter()
+
+
+# ============ IMPORT ENDPOINT ============
+@router.post("/{dataset}")
+def import_dataset(
+    dataset: str,
+    file: UploadFile = File(...),
+    format: Optional[str] = Form(None),
+    dry_run: bool = Form(False),
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(require_admin)
+):
+    """
+    Upsert destinations or routes from a CSV, NDJSON or JSON file.
+    Invalid rows are listed in the returned report; the others are imported.
+    """
+
+    if dataset not in IMPORTERS:
+        raise HTTPException(status_code=404, detail="Unknown import dataset")
+
+    if format is not None and format not in FORMATS:
+        raise HTTPException(status_code=400, detail=f"format must be one of {', '.join(FORMATS)}")
+    try:
+        fmt = format or detect_format(file.filename)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    try:
+        report = run_import(db, dataset, file.file, fmt, dry_run)
+    except (UnicodeDecodeError, ValueError) as e:
+        # Unreadable file as a whole (bad encoding, broken JSON array)
+        raise HTTPException(status_code=400, detail=f"Could not read {file.filename}: {e}")
+
+    if not dry_run:
+        dashboard_cache.invalidate("stats")
+    return report.as_dict()
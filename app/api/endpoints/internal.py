@@ -0,0 +1,32 @@
+# app/api/endpoints/internal.py - Internal Operational Metrics (admin only)
+from fastapi import APIRouter, Depends
+
+from app.api.deps import Principal, require_admin, principal_cache
+from app.api.endpoints.admin import dashboard_cache
+from app.core.db_pool import describe_pools
+from app.core.security import password_hash_pool
+from app.core.rate_limit import login_throttle
+from app.core.startup import startup_timings
+from app.services.image_cache import resize_cache
+
+router = APIRouter()
+
+
+@router.get("/metrics/pool")
+def get_pool_metrics(current_user: Principal = Depends(require_admin)):
+    """Connection pool usage per engine: checked out, overflow, waits, timeouts"""
+    return describe_pools()
+
+
+@router.get("/metrics")
+def get_internal_metrics(current_user: Principal = Depends(require_admin)):
+    """All in-process runtime metrics for this worker"""
+    return {
+        "pools": describe_pools(),
+        "password_hashing": password_hash_pool.stats(),
+        "principal_cache": principal_cache.stats(),
+        "dashboard_cache": dashboard_cache.stats(),
+        "login_throttle": {"rejected": login_throttle.rejected},
+        "image_cache": resize_cache.stats(),
+        "startup_ms": startup_timings,
+    }
@@ -1,9 +1,9 @@
 # app/api/endpoints/reviews.py - Review API Endpoints (FIXED)
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 from typing import List
-from app.database import get_db
+from app.database import get_db, get_read_db, mark_primary_sticky
 from app.models.review import Review
 from app.schemas.review import ReviewCreate, ReviewResponse, ReviewStats
 
@@ -14,7 +14,7 @@ router = APIRouter()
 def get_destination_reviews(
     destination_id: int,
     is_approved: bool = True,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """Get all reviews for a destination"""
     
@@ -27,7 +27,11 @@ def get_destination_reviews(
 
 
 @router.post("/", response_model=ReviewResponse, status_code=201)
-def create_review(review: ReviewCreate, db: Session = Depends(get_db)):
+def create_review(
+    review: ReviewCreate,
+    request: Request,
+    db: Session = Depends(get_db)
+):
     """Submit a new review"""
     
     # Validate destination exists
@@ -52,11 +56,14 @@ def create_review(review: ReviewCreate, db: Session = Depends(get_db)):
     db.commit()
     db.refresh(db_review)
     
+    # Let the reviewer see their own review even if replicas lag behind
+    mark_primary_sticky(request)
+    
     return db_review
 
 
 @router.get("/destination/{destination_id}/stats", response_model=ReviewStats)
-def get_review_stats(destination_id: int, db: Session = Depends(get_db)):
+def get_review_stats(destination_id: int, db: Session = Depends(get_read_db)):
     """Get review statistics for a destination"""
     
     reviews = db.query(Review).filter(
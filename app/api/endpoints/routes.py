@@ -3,7 +3,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from decimal import Decimal
-from app.database import get_db
+from app.database import get_read_db
 from app.models.route import Route
 from app.models.destination import Destination
 from app.schemas.route import RouteResponse
@@ -17,7 +17,7 @@ def get_routes(
     destination_id: Optional[int] = None,
     transport_mode: Optional[str] = None,
     is_active: bool = True,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """Get all routes with optional filters"""
     
@@ -62,7 +62,7 @@ def get_routes(
 
 
 @router.get("/{route_id}", response_model=RouteResponse)
-def get_route(route_id: int, db: Session = Depends(get_db)):
+def get_route(route_id: int, db: Session = Depends(get_read_db)):
     """Get single route by ID"""
     
     route = db.query(Route).filter(Route.id == route_id).first()
@@ -1,31 +1,95 @@
 # app/config.py - Application Configuration
 from pydantic_settings import BaseSettings
-from typing import Optional
+from typing import Optional, List
 
 class Settings(BaseSettings):
     """Application settings from environment variables"""
     
     # Database
     DATABASE_URL: str = "mysql+pymysql://root:@localhost/tourism_guide"
+    # Async engine URL; derived from DATABASE_URL (aiomysql/aiosqlite) when unset
+    ASYNC_DATABASE_URL: Optional[str] = None
+    
+    # Connection Pool (per database, per worker). The primary database is
+    # reached through a sync and an async engine; together they never hold
+    # more than DB_POOL_SIZE + DB_MAX_OVERFLOW connections.
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_ASYNC_POOL_SHARE: float = 0.2  # part of the budget given to the async engine (min PASSWORD_HASH_WORKERS + 1)
+    DB_POOL_TIMEOUT: int = 30  # seconds to wait for a connection
+    DB_POOL_RECYCLE: int = 3600  # seconds
+    DB_POOL_PING: str = "idle"  # "always" (every checkout), "idle" or "never"
+    DB_POOL_PING_IDLE_SECONDS: int = 30  # "idle": ping only connections unused this long
+    
+    # Read Replicas (comma-separated URLs; empty = all reads go to the primary)
+    DATABASE_REPLICA_URLS: str = ""
+    REPLICA_RETRY_SECONDS: int = 10  # how long a failed replica is skipped
+    READ_YOUR_WRITES_SECONDS: int = 10  # reads stick to the primary after a write
+    
+    # Schema Migrations (python -m app.migrations upgrade)
+    AUTO_MIGRATE: bool = False  # apply pending migrations at startup
     
     # Security
     SECRET_KEY: str = "your-secret-key-change-this-in-production"
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     
+    # Password Hashing (bcrypt runs on a bounded worker pool)
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_PENDING: int = 32
+    
+    # Authenticated-principal cache (per worker)
+    PRINCIPAL_CACHE_SIZE: int = 10000
+    PRINCIPAL_CACHE_TTL: int = 60  # seconds
+    
+    # Login Throttling (token buckets, checked before any DB/bcrypt work)
+    LOGIN_RATE_LIMIT_ENABLED: bool = True
+    LOGIN_RATE_LIMIT_BACKEND: str = "memory"  # "memory" (per worker) or "sqlite" (shared on host)
+    LOGIN_RATE_LIMIT_SQLITE_PATH: str = "./login_throttle.db"
+    LOGIN_RATE_LIMIT_MAX_KEYS: int = 100000
+    LOGIN_IP_BURST: int = 20
+    LOGIN_IP_PER_MINUTE: float = 10
+    LOGIN_USERNAME_BURST: int = 5
+    LOGIN_USERNAME_PER_MINUTE: float = 2
+    
     # Application
     APP_NAME: str = "Tourism Guide System"
     BASE_URL: str = "http://localhost:8000"
+    DEBUG: bool = False  # adds Server-Timing / query count headers, N+1 warnings
+    QUERY_REPEAT_THRESHOLD: int = 5  # identical statements per request flagged as N+1
+    DASHBOARD_STATS_TTL: float = 5  # seconds admin dashboard counts are shared between requests
+    THREADPOOL_SIZE: int = 40  # worker threads for sync endpoints (admin, public GETs)
     
     # Upload Settings
     UPLOAD_DIR: str = "./uploads"
-    MAX_UPLOAD_SIZE: int = 5 * 1024 * 1024  # 5MB
+    MAX_UPLOAD_SIZE: int = 5 * 1024 * 1024  # 5MB per file
+    MAX_REQUEST_SIZE: int = 50 * 1024 * 1024  # whole request body (all files of a form)
     ALLOWED_EXTENSIONS: set = {".jpg", ".jpeg", ".png", ".gif", ".webp"}
+    IMAGE_VARIANT_WIDTHS: List[int] = [320, 640, 1280]  # resized copies made on upload
+    IMAGE_WORKERS: int = 2  # processes for Pillow work
+    UPLOAD_WORKERS: int = 4  # threads writing/validating the files of one multi-photo upload
+    IMAGE_RESIZE_WIDTHS: List[int] = [160, 320, 480, 640, 960, 1280, 1920]  # allowed /img/{width}/ sizes
+    IMAGE_CACHE_DIR: str = "./cache/images"
+    IMAGE_CACHE_MAX_BYTES: int = 512 * 1024 * 1024  # LRU-evicted beyond this
+    UPLOAD_RELEASE_GRACE_SECONDS: int = 600  # deletes keep files written this recently (left to the GC)
+    UPLOAD_GC_INTERVAL_HOURS: float = 24  # orphaned upload collection; 0 disables the scheduled run
+    UPLOAD_GC_GRACE_HOURS: float = 24  # never touch files younger than this
+    UPLOAD_GC_PURGE_DAYS: float = 7  # quarantined files are deleted after this
+    UPLOAD_QUARANTINE_DIR: str = "./uploads_quarantine"  # outside UPLOAD_DIR, so never served under /uploads
+    UPLOAD_GC_BATCH_SIZE: int = 500
+    
+    # Static Files (precompressed .gz/.br copies live outside static/)
+    STATIC_CACHE_DIR: str = "./cache/static"
+    STATIC_PRECOMPRESS_ON_STARTUP: bool = True  # False: only `python -m app.core.static_files` writes them
     
     # Pagination
     DEFAULT_PAGE_SIZE: int = 12
     MAX_PAGE_SIZE: int = 100
     
+    @property
+    def replica_urls(self) -> List[str]:
+        return [u.strip() for u in self.DATABASE_REPLICA_URLS.split(",") if u.strip()]
+    
     class Config:
         env_file = ".env"
         case_sensitive = True
@@ -0,0 +1,169 @@
+# app/core/db_pool.py - Connection Pool Configuration and Instrumentation
+import threading
+import time
+from typing import Dict, Optional, Tuple, Type
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import Pool, QueuePool
+
+from app.config import settings
+
+
+class PoolStats:
+    """Counters for one engine's pool (thread-safe)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.pings = 0
+        self.ping_failures = 0
+
+    def record_wait(self, seconds: float, timed_out: bool = False):
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.wait_total += seconds
+            if seconds > self.wait_max:
+                self.wait_max = seconds
+
+    def record_ping(self, ok: bool):
+        with self._lock:
+            self.pings += 1
+            if not ok:
+                self.ping_failures += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            checkouts = self.checkouts or 1
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "avg_wait_ms": round(self.wait_total / checkouts * 1000, 3),
+                "max_wait_ms": round(self.wait_max * 1000, 3),
+                "pings": self.pings,
+                "ping_failures": self.ping_failures,
+            }
+
+
+# Stats per engine name ("primary", "async", ...), read by the metrics endpoints
+pool_stats: Dict[str, PoolStats] = {}
+
+# Live engines per name, so metrics can read the current pool state
+pool_engines: Dict[str, Engine] = {}
+
+
+def instrumented_pool_class(base: Type[QueuePool], stats: PoolStats) -> Type[QueuePool]:
+    """Subclass a QueuePool so every checkout records how long it waited"""
+
+    class InstrumentedPool(base):
+        def _do_get(self):
+            started = time.perf_counter()
+            try:
+                conn = super()._do_get()
+            except exc.TimeoutError:
+                stats.record_wait(time.perf_counter() - started, timed_out=True)
+                raise
+            stats.record_wait(time.perf_counter() - started)
+            return conn
+
+    InstrumentedPool.__name__ = f"Instrumented{base.__name__}"
+    return InstrumentedPool
+
+
+def primary_pool_budget(engine: str) -> Tuple[int, int]:
+    """
+    (pool_size, max_overflow) for the "primary" (sync) or "async" engine.
+    Both reach the primary database, so they split DB_POOL_SIZE and
+    DB_MAX_OVERFLOW. The async engine serves logins and principal loads and
+    keeps at least PASSWORD_HASH_WORKERS + 1 connections, so logins arriving
+    while every hashing worker is busy never queue behind each other.
+    """
+    async_size = max(round(settings.DB_POOL_SIZE * settings.DB_ASYNC_POOL_SHARE), settings.PASSWORD_HASH_WORKERS + 1)
+    async_size = max(1, min(async_size, settings.DB_POOL_SIZE - 1))
+    async_overflow = round(settings.DB_MAX_OVERFLOW * settings.DB_ASYNC_POOL_SHARE)
+    if engine == "async":
+        return async_size, async_overflow
+    return max(1, settings.DB_POOL_SIZE - async_size), max(0, settings.DB_MAX_OVERFLOW - async_overflow)
+
+
+def pool_options(url: str, name: str, base: Type[QueuePool] = QueuePool, budget: Optional[Tuple[int, int]] = None) -> dict:
+    """
+    Engine keyword arguments for the pool settings in Settings.
+    budget overrides (pool_size, max_overflow) for engines that share a
+    database with another engine (see primary_pool_budget).
+    In-memory SQLite keeps SQLAlchemy's default single-connection pool.
+    """
+    stats = pool_stats.setdefault(name, PoolStats())
+
+    options = {
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PING == "always",
+    }
+    if url.startswith("sqlite") and (":memory:" in url or url.rstrip("/").endswith(":")):
+        return options
+
+    options.update({
+        "poolclass": instrumented_pool_class(base, stats),
+        "pool_size": budget[0] if budget else settings.DB_POOL_SIZE,
+        "max_overflow": budget[1] if budget else settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+    })
+    return options
+
+
+def install_pool_events(engine: Engine, name: str):
+    """Register the engine for metrics and set up the idle ping strategy"""
+    pool_engines[name] = engine
+    stats = pool_stats.setdefault(name, PoolStats())
+
+    if settings.DB_POOL_PING != "idle":
+        return
+
+    @event.listens_for(engine, "checkin")
+    def _on_checkin(dbapi_connection, connection_record):
+        connection_record.info["checked_in_at"] = time.monotonic()
+
+    @event.listens_for(engine, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+        # Only ping connections that sat unused long enough to have gone stale
+        checked_in_at = connection_record.info.get("checked_in_at")
+        if checked_in_at is None:
+            return
+        if time.monotonic() - checked_in_at < settings.DB_POOL_PING_IDLE_SECONDS:
+            return
+
+        try:
+            cursor = dbapi_connection.cursor()
+            cursor.execute("SELECT 1")
+            cursor.close()
+        except Exception:
+            stats.record_ping(False)
+            # The pool discards this connection and retries with a fresh one
+            raise exc.DisconnectionError()
+        stats.record_ping(True)
+
+
+def describe_pools() -> dict:
+    """Current pool state plus counters for every registered engine"""
+    result = {}
+    for name, engine in pool_engines.items():
+        pool: Pool = engine.pool
+        info = {"pool_class": type(pool).__name__}
+        if isinstance(pool, QueuePool):
+            info.update({
+                "size": pool.size(),
+                "checked_out": pool.checkedout(),
+                "checked_in": pool.checkedin(),
+                "overflow": pool.overflow(),
+                "max_overflow": pool._max_overflow,
+                "timeout_seconds": pool.timeout(),
+            })
+        info.update(pool_stats[name].snapshot())
+        result[name] = info
+    return result
@@ -0,0 +1,73 @@
+# app/core/import_budget.py - Import-Time Budget Check
+"""
+Fails (exit code 1) when importing the application takes longer than the
+budget, using CPython's -X importtime report.
+
+    python -m app.core.import_budget --budget-ms 2000
+"""
+import argparse
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+# Default budget for "import main" (also enforced by tests/test_import_budget.py)
+IMPORT_BUDGET_MS = 2000.0
+
+
+def measure_import(module: str = "main") -> Tuple[int, List[Tuple[int, int, str]]]:
+    """
+    Import module in a fresh interpreter.
+    Returns (cumulative microseconds for module, [(self_us, cumulative_us, name), ...]).
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{proc.stderr[-2000:]}")
+
+    entries = []
+    totals: Dict[str, int] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        parts = line[len("import time:"):].split("|")
+        try:
+            self_us, cumulative_us = int(parts[0]), int(parts[1])
+        except ValueError:
+            continue  # header line
+        name = parts[2].strip()
+        entries.append((self_us, cumulative_us, name))
+        totals[name] = cumulative_us
+
+    return totals.get(module, 0), entries
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Check application import time against a budget")
+    parser.add_argument("--module", default="main")
+    parser.add_argument("--budget-ms", type=float, default=IMPORT_BUDGET_MS)
+    parser.add_argument("--runs", type=int, default=3, help="best of N runs (first run warms .pyc files)")
+    parser.add_argument("--top", type=int, default=10, help="show the N slowest modules (self time)")
+    args = parser.parse_args(argv)
+
+    best_us, best_entries = None, []
+    for _ in range(args.runs):
+        total_us, entries = measure_import(args.module)
+        if best_us is None or total_us < best_us:
+            best_us, best_entries = total_us, entries
+
+    total_ms = best_us / 1000
+    print(f"import {args.module}: {total_ms:.1f}ms (budget {args.budget_ms:.0f}ms)")
+    for self_us, cumulative_us, name in sorted(best_entries, reverse=True)[:args.top]:
+        print(f"  {self_us / 1000:8.1f}ms self {cumulative_us / 1000:8.1f}ms total  {name}")
+
+    if total_ms > args.budget_ms:
+        print(f"FAIL: import time exceeds budget by {total_ms - args.budget_ms:.1f}ms")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,212 @@
+# app/core/metrics.py - Prometheus Text-Format Metrics
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, List, Tuple
+
+# Request metrics are only updated and rendered on the event loop thread
+# (the /metrics handler is async def), so plain dicts and ints are enough -
+# no locks on the hot path. Never call render() from a worker thread.
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+
+def _format_labels(names: Tuple[str, ...], values: Tuple) -> str:
+    if not names:
+        return ""
+    pairs = []
+    for name, value in zip(names, values):
+        escaped = str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        pairs.append(f'{name}="{escaped}"')
+    return "{" + ",".join(pairs) + "}"
+
+
+class Counter:
+    def __init__(self, name: str, help: str, labels: Tuple[str, ...] = ()):
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self.values: Dict[Tuple, float] = {}
+
+    def inc(self, labels: Tuple = (), amount: float = 1):
+        self.values[labels] = self.values.get(labels, 0) + amount
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        for labels, value in self.values.items():
+            lines.append(f"{self.name}{_format_labels(self.labels, labels)} {value}")
+        return lines
+
+
+class Gauge(Counter):
+    def dec(self, labels: Tuple = (), amount: float = 1):
+        self.values[labels] = self.values.get(labels, 0) - amount
+
+    def render(self) -> List[str]:
+        lines = super().render()
+        lines[1] = f"# TYPE {self.name} gauge"
+        return lines
+
+
+class Histogram:
+    def __init__(self, name: str, help: str, labels: Tuple[str, ...] = (), buckets: Tuple = LATENCY_BUCKETS):
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self.buckets = tuple(buckets)
+        # labels -> [per-bucket counts (+Inf last), sum, count]
+        self.values: Dict[Tuple, list] = {}
+
+    def observe(self, value: float, labels: Tuple = ()):
+        entry = self.values.get(labels)
+        if entry is None:
+            entry = self.values[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+        entry[0][bisect_left(self.buckets, value)] += 1
+        entry[1] += value
+        entry[2] += 1
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        names = self.labels + ("le",)
+        for labels, (counts, total, count) in self.values.items():
+            cumulative = 0
+            for bound, n in zip(self.buckets + ("+Inf",), counts):
+                cumulative += n
+                lines.append(f"{self.name}_bucket{_format_labels(names, labels + (bound,))} {cumulative}")
+            label_text = _format_labels(self.labels, labels)
+            lines.append(f"{self.name}_sum{label_text} {total}")
+            lines.append(f"{self.name}_count{label_text} {count}")
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self.metrics: list = []
+        # Callables returning extra exposition lines (pool stats, etc.), run at scrape time
+        self.collectors: List[Callable[[], List[str]]] = []
+
+    def register(self, metric):
+        self.metrics.append(metric)
+        return metric
+
+    def add_collector(self, collector: Callable[[], List[str]]):
+        self.collectors.append(collector)
+
+    def render(self) -> str:
+        lines = []
+        for metric in self.metrics:
+            lines.extend(metric.render())
+        for collector in self.collectors:
+            lines.extend(collector())
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+HTTP_REQUESTS = registry.register(Counter(
+    "http_requests_total", "HTTP requests handled", ("method", "route", "status")
+))
+HTTP_LATENCY = registry.register(Histogram(
+    "http_request_duration_seconds", "HTTP request latency", ("method", "route")
+))
+HTTP_IN_FLIGHT = registry.register(Gauge(
+    "http_requests_in_flight", "HTTP requests currently being handled"
+))
+HTTP_RESPONSE_SIZE = registry.register(Histogram(
+    "http_response_size_bytes", "HTTP response body size", ("method", "route"), buckets=SIZE_BUCKETS
+))
+HTTP_DB_TIME = registry.register(Histogram(
+    "http_request_db_duration_seconds", "Time spent in SQL per HTTP request", ("method", "route")
+))
+
+
+def route_label(scope) -> str:
+    """Route template (e.g. /api/destinations/{destination_id}) instead of the raw path"""
+    route = scope.get("route")
+    if route is not None:
+        return route.path
+    if "endpoint" in scope and scope.get("root_path"):
+        # Mounted apps (/static, /uploads)
+        return scope["root_path"] + "/{path}"
+    return "unmatched"
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware recording per-route request metrics"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status = [500]
+        size = [0]
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status[0] = message["status"]
+            elif message["type"] == "http.response.body":
+                size[0] += len(message.get("body", b""))
+            await send(message)
+
+        HTTP_IN_FLIGHT.inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            HTTP_IN_FLIGHT.dec()
+            labels = (scope["method"], route_label(scope))
+            HTTP_REQUESTS.inc(labels + (str(status[0]),))
+            HTTP_LATENCY.observe(time.perf_counter() - started, labels)
+            HTTP_RESPONSE_SIZE.observe(size[0], labels)
+            query_stats = scope.get("state", {}).get("query_stats")
+            if query_stats is not None:
+                HTTP_DB_TIME.observe(query_stats.total_seconds, labels)
+
+
+def _sample_lines(name: str, help: str, kind: str, samples: List[Tuple[Tuple[str, ...], Tuple, float]]) -> List[str]:
+    lines = [f"# HELP {name} {help}", f"# TYPE {name} {kind}"]
+    for names, values, value in samples:
+        lines.append(f"{name}{_format_labels(names, values)} {value}")
+    return lines
+
+
+def _gauge_lines(name: str, help: str, samples: List[Tuple[Tuple[str, ...], Tuple, float]]) -> List[str]:
+    return _sample_lines(name, help, "gauge", samples)
+
+
+def _counter_lines(name: str, help: str, samples: List[Tuple[Tuple[str, ...], Tuple, float]]) -> List[str]:
+    return _sample_lines(name, help, "counter", samples)
+
+
+def collect_runtime() -> List[str]:
+    """Connection pool and password-hashing pool state, read at scrape time"""
+    from app.core.db_pool import describe_pools
+    from app.core.security import password_hash_pool
+
+    pools = describe_pools()
+    lines = []
+    for key, help in (
+        ("checked_out", "Connections currently checked out"),
+        ("overflow", "Connections opened beyond pool_size"),
+        ("max_wait_ms", "Longest checkout wait in milliseconds"),
+    ):
+        lines.extend(_gauge_lines(
+            f"db_pool_{key}", help,
+            [(("pool",), (name,), info[key]) for name, info in pools.items() if key in info]
+        ))
+    lines.extend(_counter_lines(
+        "db_pool_timeouts_total", "Checkouts that timed out",
+        [(("pool",), (name,), info["timeouts"]) for name, info in pools.items()]
+    ))
+
+    hashing = password_hash_pool.stats()
+    lines.extend(_gauge_lines("password_hash_pending", "Queued or running bcrypt jobs", [((), (), hashing["pending"])]))
+    lines.extend(_counter_lines("password_hash_rejected_total", "bcrypt jobs rejected because the queue was full", [((), (), hashing["rejected"])]))
+    return lines
+
+
+registry.add_collector(collect_runtime)
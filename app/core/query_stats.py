@@ -0,0 +1,130 @@
+# app/core/query_stats.py - Per-Request SQL Query Counting and N+1 Detection
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import MutableHeaders
+
+
+class QueryStats:
+    """Queries executed (and time spent in the DB) during one request"""
+
+    def __init__(self):
+        self.count = 0
+        self.total_seconds = 0.0
+        self.statements: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def record(self, statement: str, seconds: float):
+        with self._lock:
+            self.count += 1
+            self.total_seconds += seconds
+            self.statements[statement] += 1
+
+    def repeated(self, threshold: int) -> list:
+        """Identical statements run at least threshold times - the N+1 signature"""
+        return [(s, n) for s, n in self.statements.most_common() if n >= threshold]
+
+    def report(self) -> str:
+        lines = [f"{self.count} queries, {self.total_seconds * 1000:.2f}ms"]
+        for statement, n in self.statements.most_common():
+            lines.append(f"  {n:4d}x {' '.join(statement.split())[:200]}")
+        return "\n".join(lines)
+
+
+# Stats for the request currently being handled (propagates into threadpool calls)
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+# Extra collectors registered by capture_queries() (used by tests); queries
+# run on threadpool threads, so the list is only touched under the lock
+_captures: List[QueryStats] = []
+_captures_lock = threading.Lock()
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    return _current_stats.get()
+
+
+@contextmanager
+def capture_queries():
+    """Collect every query executed on any engine while the block runs"""
+    stats = QueryStats()
+    with _captures_lock:
+        _captures.append(stats)
+    try:
+        yield stats
+    finally:
+        with _captures_lock:
+            _captures.remove(stats)
+
+
+def install_query_events(engine: Engine):
+    """Time every cursor execution on engine and attribute it to the current request"""
+
+    # The start time lives on the execution context, which is discarded with
+    # the statement, so a failed query leaves nothing behind on the connection
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        context._query_started = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - context._query_started
+        stats = _current_stats.get()
+        if stats is not None:
+            stats.record(statement, elapsed)
+        with _captures_lock:
+            captures = list(_captures)
+        for capture in captures:
+            capture.record(statement, elapsed)
+
+
+class QueryStatsMiddleware:
+    """
+    Pure ASGI middleware giving each request its own QueryStats.
+    In debug mode the counts are added to the response as Server-Timing /
+    X-DB-Query-Count headers and repeated statements are reported.
+    """
+
+    def __init__(self, app, debug: bool = False, repeat_threshold: int = 5):
+        self.app = app
+        self.debug = debug
+        self.repeat_threshold = repeat_threshold
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats()
+        scope.setdefault("state", {})["query_stats"] = stats
+        token = _current_stats.set(stats)
+
+        async def send_with_headers(message):
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers.append(
+                    "Server-Timing",
+                    f'db;dur={stats.total_seconds * 1000:.2f};desc="{stats.count} queries"'
+                )
+                headers.append("X-DB-Query-Count", str(stats.count))
+
+                repeated = stats.repeated(self.repeat_threshold)
+                if repeated:
+                    headers.append("X-DB-Repeated-Queries", str(len(repeated)))
+                    for statement, n in repeated:
+                        print(
+                            f"Possible N+1 on {scope['method']} {scope['path']}: "
+                            f"{n}x {' '.join(statement.split())[:200]}"
+                        )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_headers if self.debug else send)
+        finally:
+            _current_stats.reset(token)
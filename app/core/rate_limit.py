@@ -0,0 +1,195 @@
+# app/core/rate_limit.py - Token Bucket Rate Limiting
+import math
+import random
+from abc import ABC, abstractmethod
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from fastapi import HTTPException, status
+from starlette.concurrency import run_in_threadpool
+
+from app.config import settings
+
+
+class RateLimitBackend(ABC):
+    """
+    Storage interface for token buckets.
+
+    consume() atomically refills the bucket for key, tries to take cost
+    tokens and returns 0 when allowed, otherwise the number of seconds
+    until enough tokens will be available. Both methods may block, so
+    async callers go through a thread (see LoginThrottle).
+    """
+
+    @abstractmethod
+    def consume(self, key: str, capacity: float, refill_rate: float, cost: float = 1.0) -> float:
+        ...
+
+    @abstractmethod
+    def reset(self, key: str):
+        ...
+
+
+def _take(tokens: float, elapsed: float, capacity: float, refill_rate: float, cost: float):
+    """Token bucket arithmetic shared by all backends: returns (tokens, retry_after)"""
+    tokens = min(capacity, tokens + max(elapsed, 0.0) * refill_rate)
+    if tokens >= cost:
+        return tokens - cost, 0.0
+    return tokens, (cost - tokens) / refill_rate
+
+
+class MemoryBackend(RateLimitBackend):
+    """Per-worker buckets kept in a bounded LRU (least recently seen keys are dropped)"""
+
+    def __init__(self, max_keys: int = 100000):
+        self.max_keys = max_keys
+        self._buckets: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def consume(self, key: str, capacity: float, refill_rate: float, cost: float = 1.0) -> float:
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated = self._buckets.get(key, (capacity, now))
+            tokens, retry_after = _take(tokens, now - updated, capacity, refill_rate, cost)
+            self._buckets[key] = (tokens, now)
+            self._buckets.move_to_end(key)
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+        return retry_after
+
+    def reset(self, key: str):
+        with self._lock:
+            self._buckets.pop(key, None)
+
+
+class SQLiteBackend(RateLimitBackend):
+    """
+    Buckets stored in a local SQLite file so every worker on the host shares
+    the same limits. Stands in for a networked store such as Redis.
+    """
+
+    def __init__(self, path: str, max_keys: int = 100000):
+        self.path = path
+        self.max_keys = max_keys
+        self._local = threading.local()
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS rate_limit_buckets ("
+                "key TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_rate_limit_updated "
+                "ON rate_limit_buckets (updated)"
+            )
+            self._local.conn = conn
+        return conn
+
+    def consume(self, key: str, capacity: float, refill_rate: float, cost: float = 1.0) -> float:
+        conn = self._conn()
+        now = time.time()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                "SELECT tokens, updated FROM rate_limit_buckets WHERE key = ?", (key,)
+            ).fetchone()
+            tokens, updated = row if row else (capacity, now)
+            tokens, retry_after = _take(tokens, now - updated, capacity, refill_rate, cost)
+            conn.execute(
+                "INSERT OR REPLACE INTO rate_limit_buckets (key, tokens, updated) VALUES (?, ?, ?)",
+                (key, tokens, now)
+            )
+            # Occasionally trim the least recently updated buckets
+            if random.random() < 0.01:
+                conn.execute(
+                    "DELETE FROM rate_limit_buckets WHERE key IN ("
+                    "SELECT key FROM rate_limit_buckets ORDER BY updated DESC LIMIT -1 OFFSET ?)",
+                    (self.max_keys,)
+                )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return retry_after
+
+    def reset(self, key: str):
+        self._conn().execute("DELETE FROM rate_limit_buckets WHERE key = ?", (key,))
+
+
+class TokenBucketLimiter:
+    """A named bucket policy: burst capacity plus a steady refill rate"""
+
+    def __init__(self, backend: RateLimitBackend, name: str, capacity: int, per_minute: float):
+        self.backend = backend
+        self.name = name
+        self.capacity = capacity
+        self.refill_rate = per_minute / 60.0
+
+    def hit(self, key: str) -> float:
+        """Consume one token for key; returns seconds to wait (0 = allowed)"""
+        return self.backend.consume(f"{self.name}:{key}", self.capacity, self.refill_rate)
+
+    def reset(self, key: str):
+        self.backend.reset(f"{self.name}:{key}")
+
+
+class LoginThrottle:
+    """Per-IP and per-username throttling for the login endpoint"""
+
+    def __init__(self, backend: RateLimitBackend):
+        self.by_ip = TokenBucketLimiter(
+            backend, "login-ip",
+            settings.LOGIN_IP_BURST, settings.LOGIN_IP_PER_MINUTE
+        )
+        self.by_username = TokenBucketLimiter(
+            backend, "login-user",
+            settings.LOGIN_USERNAME_BURST, settings.LOGIN_USERNAME_PER_MINUTE
+        )
+        self.rejected = 0
+
+    def _consume(self, ip: Optional[str], username: str) -> float:
+        # An IP that is already throttled must not also drain the
+        # username bucket, or it could lock a victim's account out
+        retry_after = self.by_ip.hit(ip or "unknown")
+        if retry_after > 0:
+            return retry_after
+        return self.by_username.hit(username.strip().lower())
+
+    async def check(self, ip: Optional[str], username: str):
+        """Raise 429 with Retry-After if either bucket is empty"""
+        if not settings.LOGIN_RATE_LIMIT_ENABLED:
+            return
+
+        # The SQLite backend can wait up to 5s on its file lock
+        retry_after = await run_in_threadpool(self._consume, ip, username)
+        if retry_after > 0:
+            self.rejected += 1
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Too many login attempts, please try again later",
+                headers={"Retry-After": str(math.ceil(retry_after))}
+            )
+
+    async def success(self, username: str):
+        """Give a user their full allowance back after a successful login"""
+        await run_in_threadpool(self.by_username.reset, username.strip().lower())
+
+
+def create_backend() -> RateLimitBackend:
+    """Build the backend selected by LOGIN_RATE_LIMIT_BACKEND"""
+    if settings.LOGIN_RATE_LIMIT_BACKEND == "sqlite":
+        return SQLiteBackend(
+            settings.LOGIN_RATE_LIMIT_SQLITE_PATH,
+            max_keys=settings.LOGIN_RATE_LIMIT_MAX_KEYS
+        )
+    return MemoryBackend(max_keys=settings.LOGIN_RATE_LIMIT_MAX_KEYS)
+
+
+login_throttle = LoginThrottle(create_backend())
@@ -0,0 +1,99 @@
+# app/core/security.py - Password Hashing Worker Pool
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+
+from fastapi import HTTPException, status
+
+from app.config import settings
+
+
+class PasswordHashPool:
+    """
+    Runs bcrypt hashing/verification off the event loop.
+
+    bcrypt releases the GIL while hashing, so a small dedicated thread pool
+    gives real parallelism without blocking other requests. The number of
+    queued jobs is bounded: once full, new requests get a 503 instead of
+    piling up behind a login burst.
+    """
+
+    def __init__(self, max_workers: int, max_pending: int):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending = 0
+
+        # Metrics (only touched from the event loop thread)
+        self.completed = 0
+        self.rejected = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        self.total_run_seconds = 0.0
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="password-hash"
+            )
+        return self._executor
+
+    async def run(self, func: Callable, *args):
+        """Run func(*args) on the hashing pool and return its result"""
+        if self._pending >= self.max_pending:
+            self.rejected += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Server is busy, please try again shortly",
+                headers={"Retry-After": "1"}
+            )
+
+        submitted = time.perf_counter()
+
+        def job():
+            started = time.perf_counter()
+            result = func(*args)
+            return result, started - submitted, time.perf_counter() - started
+
+        self._pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            result, wait, run = await loop.run_in_executor(self.executor, job)
+        finally:
+            self._pending -= 1
+
+        self.completed += 1
+        self.total_wait_seconds += wait
+        self.total_run_seconds += run
+        if wait > self.max_wait_seconds:
+            self.max_wait_seconds = wait
+
+        return result
+
+    def stats(self) -> dict:
+        """Snapshot of pool usage and queue-time metrics"""
+        completed = self.completed or 1
+        return {
+            "workers": self.max_workers,
+            "max_pending": self.max_pending,
+            "pending": self._pending,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "avg_wait_ms": round(self.total_wait_seconds / completed * 1000, 2),
+            "max_wait_ms": round(self.max_wait_seconds * 1000, 2),
+            "avg_run_ms": round(self.total_run_seconds / completed * 1000, 2),
+        }
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+
+password_hash_pool = PasswordHashPool(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING
+)
@@ -0,0 +1,19 @@
+# app/core/startup.py - Measured Startup Steps
+import time
+from contextlib import contextmanager
+from typing import Dict
+
+# Step name -> duration in milliseconds, filled in by the lifespan handler
+startup_timings: Dict[str, float] = {}
+
+
+@contextmanager
+def startup_step(name: str):
+    """Time one initialisation step and record it in startup_timings"""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = (time.perf_counter() - started) * 1000
+        startup_timings[name] = round(elapsed, 2)
+        print(f"Startup step '{name}' took {elapsed:.1f}ms")
@@ -0,0 +1,179 @@
+# app/core/static_files.py - Fingerprinted, Precompressed Static File Serving
+import gzip
+import hashlib
+import mimetypes
+import os
+import sys
+import uuid
+from pathlib import Path
+from typing import Dict, Optional
+
+import anyio
+from starlette.datastructures import Headers
+from starlette.exceptions import HTTPException
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Scope
+
+from app.config import settings
+
+try:
+    import brotli  # optional: only needed to *create* .br files
+except ImportError:
+    brotli = None
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "no-cache"
+
+# Text assets worth compressing (images are already compressed)
+COMPRESSIBLE = {".css", ".js", ".svg", ".json", ".html", ".txt", ".map"}
+
+# Preferred encodings, best first: Accept-Encoding token -> sibling suffix
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+
+class AssetManifest:
+    """
+    Content hashes of the files under a static directory.
+    Built once at startup (or by the CLI at deploy time); a changed file gets
+    a new URL, so hashed URLs can be cached forever.
+
+    Compressed copies go to cache_dir under their hashed names, never into
+    the static directory itself, so a stale copy can't be served and the
+    static directory may be read-only.
+    """
+
+    def __init__(self, directory: str, cache_dir: Optional[str] = None):
+        self.directory = Path(directory)
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.hashed: Dict[str, str] = {}    # css/style.css -> css/style.3f2a9c1b7d4e.css
+        self.original: Dict[str, str] = {}  # the reverse mapping
+
+    def build(self, precompress: bool = True) -> "AssetManifest":
+        hashed, original = {}, {}
+        precompress = precompress and self.cache_dir is not None
+        for path in sorted(self.directory.rglob("*")):
+            if not path.is_file() or path.suffix in (".gz", ".br"):
+                continue
+            data = path.read_bytes()
+            rel = path.relative_to(self.directory).as_posix()
+            digest = hashlib.sha256(data).hexdigest()[:12]
+            name = Path(rel).with_suffix(f".{digest}{path.suffix}").as_posix()
+            hashed[rel] = name
+            original[name] = rel
+            if precompress and path.suffix in COMPRESSIBLE:
+                try:
+                    self._precompress(name, data)
+                except OSError as e:
+                    # Read-only or missing cache dir: serve uncompressed
+                    print(f"Not precompressing static files into {self.cache_dir}: {e}")
+                    precompress = False
+        self.hashed, self.original = hashed, original
+        return self
+
+    def _precompress(self, name: str, data: bytes):
+        """Write <cache_dir>/<hashed name>.gz (and .br when brotli is installed) if missing"""
+        compressors = [(".gz", lambda d: gzip.compress(d, compresslevel=9, mtime=0))]
+        if brotli is not None:
+            compressors.append((".br", lambda d: brotli.compress(d, quality=11)))
+        for suffix, compress in compressors:
+            target = self.cache_dir / (name + suffix)
+            if target.exists():
+                continue  # the name carries the content hash, so it can't be stale
+            target.parent.mkdir(parents=True, exist_ok=True)
+            # Write then rename, so workers starting together never see a partial file
+            tmp = target.with_name(f".{uuid.uuid4()}.part")
+            try:
+                tmp.write_bytes(compress(data))
+                os.replace(tmp, target)
+            finally:
+                tmp.unlink(missing_ok=True)
+
+    def compressed_path(self, path: str, suffix: str) -> Optional[Path]:
+        """Where the compressed copy of a static file would be (None if not in the manifest)"""
+        name = self.hashed.get(path)
+        if name is None or self.cache_dir is None:
+            return None
+        return self.cache_dir / (name + suffix)
+
+    def url(self, path: str, prefix: str = "/static/") -> str:
+        """Jinja helper: fingerprinted URL for an asset (plain URL if unknown)"""
+        return prefix + self.hashed.get(path, path)
+
+
+class CachedStaticFiles(StaticFiles):
+    """
+    StaticFiles with long-lived caching and precompressed responses.
+
+    - With a manifest, /static/css/style.<hash>.css serves css/style.css as
+      immutable; unhashed URLs still work but must revalidate (ETag).
+    - immutable=True marks every file immutable (uploads: names are unique).
+    - A precompressed .br/.gz copy from the manifest's cache_dir is served
+      when the client accepts that encoding.
+    - Hidden files and folders (in-progress .part uploads) are never served.
+    """
+
+    def __init__(self, *args, manifest: Optional[AssetManifest] = None, immutable: bool = False, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.manifest = manifest
+        self.immutable = immutable
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        if any(part.startswith(".") for part in Path(path).parts):
+            raise HTTPException(status_code=404)
+
+        cache_control = IMMUTABLE if self.immutable else REVALIDATE
+        if self.manifest is not None:
+            original = self.manifest.original.get(path.replace("\\", "/"))
+            if original is not None:
+                path, cache_control = original, IMMUTABLE
+
+        response = None
+        if self.manifest is not None and scope["method"] in ("GET", "HEAD") and Path(path).suffix in COMPRESSIBLE:
+            response = await self._precompressed_response(path, scope)
+        if response is None:
+            response = await super().get_response(path, scope)
+
+        if response.status_code in (200, 304):
+            response.headers["Cache-Control"] = cache_control
+            if Path(path).suffix in COMPRESSIBLE:
+                response.headers["Vary"] = "Accept-Encoding"
+        return response
+
+    async def _precompressed_response(self, path: str, scope: Scope) -> Optional[Response]:
+        request_headers = Headers(scope=scope)
+        accepted = {
+            token.split(";")[0].strip()
+            for token in request_headers.get("accept-encoding", "").split(",")
+        }
+        for encoding, suffix in ENCODINGS:
+            if encoding not in accepted:
+                continue
+            full_path = self.manifest.compressed_path(path.replace("\\", "/"), suffix)
+            if full_path is None:
+                return None
+            try:
+                stat_result = await anyio.to_thread.run_sync(os.stat, full_path)
+            except OSError:
+                continue
+            response = FileResponse(
+                full_path,
+                stat_result=stat_result,
+                media_type=mimetypes.guess_type(path)[0] or "text/plain",
+                headers={"Content-Encoding": encoding},
+            )
+            if self.is_not_modified(response.headers, request_headers):
+                return NotModifiedResponse(response.headers)
+            return response
+        return None
+
+
+if __name__ == "__main__":
+    # python -m app.core.static_files [directory [cache_dir]]  - precompress at deploy time
+    directory = sys.argv[1] if len(sys.argv) > 1 else "static"
+    cache_dir = sys.argv[2] if len(sys.argv) > 2 else settings.STATIC_CACHE_DIR
+    manifest = AssetManifest(directory, cache_dir).build()
+    for rel, name in manifest.hashed.items():
+        print(f"{rel} -> {name}")
+    if brotli is None:
+        print("brotli not installed: wrote .gz files only")
@@ -0,0 +1,50 @@
+# app/core/uploads.py - Request Body Size Limit
+from fastapi import HTTPException
+from starlette.responses import JSONResponse
+
+
+class RequestSizeLimitMiddleware:
+    """
+    Pure ASGI middleware rejecting request bodies over max_size with 413.
+    A too-large Content-Length is refused before any body is read; chunked
+    or lying clients are cut off as soon as the streamed bytes pass the limit,
+    so the multipart parser never spools more than max_size to disk.
+    """
+
+    def __init__(self, app, max_size: int):
+        self.app = app
+        self.max_size = max_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        for name, value in scope["headers"]:
+            if name == b"content-length":
+                try:
+                    declared = int(value)
+                except ValueError:
+                    declared = 0
+                if declared > self.max_size:
+                    response = JSONResponse({"detail": self._detail()}, status_code=413)
+                    await response(scope, receive, send)
+                    return
+                break
+
+        received = 0
+
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_size:
+                    # Raised inside body parsing, so the app's exception handling turns it into a 413
+                    raise HTTPException(status_code=413, detail=self._detail())
+            return message
+
+        await self.app(scope, limited_receive, send)
+
+    def _detail(self) -> str:
+        return f"Request body too large (limit {self.max_size // (1024 * 1024)}MB)"
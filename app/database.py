@@ -1,16 +1,30 @@
 # app/database.py - Database Connection and Session Management
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncEngine, AsyncSession
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from fastapi import Request
+from typing import Optional, List
+import itertools
+import threading
+import time
 from app.config import settings
+from app.core.db_pool import pool_options, primary_pool_budget, install_pool_events
+from app.core.query_stats import install_query_events
 
-# Create database engine
+# The primary database has two engines: this sync one, used by the threadpool
+# endpoints (admin, public listings, imports), and the async one below, used
+# by the auth flow (login/register and principal loading). They split one
+# connection budget (DB_POOL_SIZE/DB_MAX_OVERFLOW, see primary_pool_budget) so
+# a worker never opens more connections than that, whichever engine it uses.
 engine = create_engine(
     settings.DATABASE_URL,
-    pool_pre_ping=True,
-    pool_recycle=3600,
-    echo=False  # Set to True for SQL query logging
+    echo=False,  # Set to True for SQL query logging
+    **pool_options(settings.DATABASE_URL, "primary", budget=primary_pool_budget("primary"))
 )
+install_pool_events(engine, "primary")
+install_query_events(engine)
 
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -29,4 +43,177 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+# ============ READ REPLICAS ============
+class Replica:
+    """One read replica with its own engine, session factory and health state"""
+
+    def __init__(self, name: str, url: str):
+        self.name = name
+        self.engine = create_engine(url, echo=False, **pool_options(url, name))
+        install_pool_events(self.engine, name)
+        install_query_events(self.engine)
+        self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
+        self.healthy = True
+        self.retry_at = 0.0
+        self._lock = threading.Lock()
+
+        @event.listens_for(self.engine, "handle_error")
+        def _on_error(context):
+            # Lost/refused connections take the replica out of rotation
+            if context.is_disconnect or context.connection is None:
+                self.mark_unhealthy()
+
+    def mark_unhealthy(self):
+        with self._lock:
+            self.healthy = False
+            self.retry_at = time.monotonic() + settings.REPLICA_RETRY_SECONDS
+
+    def is_available(self) -> bool:
+        """Healthy, or due for a re-check and answering a ping again"""
+        if self.healthy:
+            return True
+        with self._lock:
+            if time.monotonic() < self.retry_at:
+                return False
+            # Only one request probes; others keep skipping until it's done
+            self.retry_at = time.monotonic() + settings.REPLICA_RETRY_SECONDS
+        try:
+            with self.engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+        except Exception as e:
+            print(f"Replica {self.name} still unavailable: {e}")
+            return False
+        self.healthy = True
+        return True
+
+
+class ReplicaSet:
+    """Round-robin over the replicas that are currently healthy"""
+
+    def __init__(self, urls: List[str]):
+        self.replicas = [Replica(f"replica-{i}", url) for i, url in enumerate(urls)]
+        self._counter = itertools.count()
+
+    def pick(self) -> Optional[Replica]:
+        for _ in range(len(self.replicas)):
+            replica = self.replicas[next(self._counter) % len(self.replicas)]
+            if replica.is_available():
+                return replica
+        return None
+
+
+replica_set = ReplicaSet(settings.replica_urls) if settings.replica_urls else None
+
+# Session key holding the time until which reads must go to the primary
+PRIMARY_STICKY_KEY = "read_primary_until"
+
+
+def mark_primary_sticky(request: Request):
+    """After a write, route this client's reads to the primary for a while"""
+    request.session[PRIMARY_STICKY_KEY] = time.time() + settings.READ_YOUR_WRITES_SECONDS
+
+
+def get_read_db(request: Request):
+    """
+    Dependency for read-only endpoints.
+    Uses a healthy replica when configured, falling back to the primary when
+    none is available or the client has just written (read-your-writes).
+    Admin sessions always read from the primary so edits show up at once.
+    """
+    replica = None
+    if (
+        replica_set
+        and request.session.get("role") != "admin"
+        and request.session.get(PRIMARY_STICKY_KEY, 0) < time.time()
+    ):
+        replica = replica_set.pick()
+
+    db = None
+    if replica:
+        db = replica.SessionLocal()
+        try:
+            # Check out a connection now so a dead replica falls back to the primary
+            db.connection()
+        except Exception as e:
+            print(f"Replica {replica.name} failed, reading from primary: {e}")
+            replica.mark_unhealthy()
+            db.close()
+            db = None
+
+    if db is None:
+        db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+# ============ ASYNC ENGINE ============
+# Sync drivers and their asyncio counterparts
+ASYNC_DRIVERS = {
+    "mysql+pymysql": "mysql+aiomysql",
+    "mysql": "mysql+aiomysql",
+    "sqlite": "sqlite+aiosqlite",
+    "sqlite+pysqlite": "sqlite+aiosqlite",
+}
+
+
+def get_async_database_url() -> str:
+    """ASYNC_DATABASE_URL if set, otherwise DATABASE_URL with an async driver"""
+    if settings.ASYNC_DATABASE_URL:
+        return settings.ASYNC_DATABASE_URL
+
+    scheme, sep, rest = settings.DATABASE_URL.partition("://")
+    return ASYNC_DRIVERS.get(scheme, scheme) + sep + rest
+
+
+_async_engine: Optional[AsyncEngine] = None
+_AsyncSessionLocal: Optional[async_sessionmaker] = None
+
+
+def get_async_engine() -> AsyncEngine:
+    """
+    Create the async engine on first use so the async driver
+    (aiomysql/aiosqlite) is only imported when it is actually needed.
+    """
+    global _async_engine, _AsyncSessionLocal
+    if _async_engine is None:
+        url = get_async_database_url()
+        _async_engine = create_async_engine(
+            url,
+            echo=False,
+            **pool_options(url, "async", base=AsyncAdaptedQueuePool, budget=primary_pool_budget("async"))
+        )
+        install_pool_events(_async_engine.sync_engine, "async")
+        install_query_events(_async_engine.sync_engine)
+        # expire_on_commit=False: attributes can't be lazy-loaded after commit in async code
+        _AsyncSessionLocal = async_sessionmaker(
+            _async_engine,
+            class_=AsyncSession,
+            autoflush=False,
+            expire_on_commit=False
+        )
+    return _async_engine
+
+
+async def dispose_engines():
+    """Close pooled connections of every engine (app shutdown)"""
+    engine.dispose()
+    if replica_set:
+        for replica in replica_set.replicas:
+            replica.engine.dispose()
+    if _async_engine is not None:
+        await _async_engine.dispose()
+
+
+async def get_async_db():
+    """
+    Async dependency to get database session.
+    Lets async def endpoints await queries instead of blocking the event loop.
+    """
+    get_async_engine()
+    async with _AsyncSessionLocal() as db:
+        yield db
@@ -0,0 +1,93 @@
+# app/migrations/__init__.py - Versioned Schema Migrations
+"""
+Minimal built-in migration runner.
+
+Each migration module defines VERSION, DESCRIPTION and upgrade(conn).
+Applied versions are recorded in the schema_version table, so startup only
+has to read one row instead of reflecting every table.
+
+    python -m app.migrations upgrade   # apply pending migrations
+    python -m app.migrations current   # show current/latest version
+"""
+from sqlalchemy import Table, Column, Integer, String, DateTime, MetaData, func, select, inspect
+from sqlalchemy.engine import Engine
+
+from app.migrations import (
+    m0001_initial_schema,
+    m0002_hot_query_indexes,
+    m0003_image_variants,
+    m0004_upload_path_indexes,
+    m0005_image_metadata,
+    m0006_user_directory_indexes,
+)
+
+MIGRATIONS = [
+    m0001_initial_schema,
+    m0002_hot_query_indexes,
+    m0003_image_variants,
+    m0004_upload_path_indexes,
+    m0005_image_metadata,
+    m0006_user_directory_indexes,
+]
+
+LATEST_VERSION = MIGRATIONS[-1].VERSION
+
+# Kept out of Base.metadata so model create_all never touches it
+version_metadata = MetaData()
+schema_version = Table(
+    "schema_version", version_metadata,
+    Column("version", Integer, primary_key=True, autoincrement=False),
+    Column("description", String(200), nullable=False),
+    Column("applied_at", DateTime, server_default=func.now()),
+)
+
+
+class SchemaVersionError(RuntimeError):
+    """Database schema is older than the code expects"""
+
+
+def current_version(engine: Engine) -> int:
+    """Highest applied migration version (0 for an unmanaged database)"""
+    with engine.connect() as conn:
+        if not inspect(conn).has_table("schema_version"):
+            return 0
+        return conn.execute(select(func.max(schema_version.c.version))).scalar() or 0
+
+
+def upgrade(engine: Engine) -> list:
+    """Apply every pending migration in order; returns the versions applied"""
+    version_metadata.create_all(engine, checkfirst=True)
+    current = current_version(engine)
+
+    applied = []
+    for migration in MIGRATIONS:
+        if migration.VERSION <= current:
+            continue
+        print(f"Applying migration {migration.VERSION:04d}: {migration.DESCRIPTION}")
+        with engine.begin() as conn:
+            migration.upgrade(conn)
+            conn.execute(schema_version.insert().values(
+                version=migration.VERSION,
+                description=migration.DESCRIPTION
+            ))
+        applied.append(migration.VERSION)
+    return applied
+
+
+def verify_schema_version(engine: Engine, auto_migrate: bool = False):
+    """
+    Startup check: make sure the database is at LATEST_VERSION.
+    Applies pending migrations when auto_migrate is set, otherwise raises.
+    """
+    current = current_version(engine)
+    if current >= LATEST_VERSION:
+        return
+
+    if auto_migrate:
+        upgrade(engine)
+        return
+
+    raise SchemaVersionError(
+        f"Database schema is at version {current}, expected {LATEST_VERSION}. "
+        f"Run: python -m app.migrations upgrade"
+    )
@@ -0,0 +1,28 @@
+# app/migrations/__main__.py - Migration Command Line
+import sys
+
+from app.database import engine
+from app.migrations import LATEST_VERSION, current_version, upgrade
+
+
+def main(argv: list) -> int:
+    command = argv[0] if argv else "upgrade"
+
+    if command == "upgrade":
+        applied = upgrade(engine)
+        if applied:
+            print(f"Database upgraded to version {applied[-1]}")
+        else:
+            print(f"Database already at version {current_version(engine)}")
+        return 0
+
+    if command == "current":
+        print(f"Current version: {current_version(engine)} (latest: {LATEST_VERSION})")
+        return 0
+
+    print("Usage: python -m app.migrations [upgrade|current]")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
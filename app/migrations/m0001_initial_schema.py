@@ -0,0 +1,11 @@
+# app/migrations/m0001_initial_schema.py - Baseline Tables
+"""Create the baseline tables (no-op for databases imported from tourism_guide.sql)"""
+from app.database import Base
+import app.models  # noqa: F401 - registers every table on Base.metadata
+
+VERSION = 1
+DESCRIPTION = "initial schema"
+
+
+def upgrade(conn):
+    Base.metadata.create_all(bind=conn, checkfirst=True)
@@ -0,0 +1,21 @@
+# app/migrations/m0002_hot_query_indexes.py - Composite Indexes for Hot Queries
+"""Composite indexes backing the public listing and moderation queries"""
+from app.database import Base
+import app.models  # noqa: F401
+
+VERSION = 2
+DESCRIPTION = "composite indexes for hot queries"
+
+INDEXES = [
+    ("destinations", "idx_destinations_active_name"),
+    ("reviews", "idx_reviews_dest_approved_created"),
+    ("routes", "idx_routes_active_name"),
+    ("website_feedback", "idx_feedback_public_created"),
+]
+
+
+def upgrade(conn):
+    for table_name, index_name in INDEXES:
+        table = Base.metadata.tables[table_name]
+        index = next(i for i in table.indexes if i.name == index_name)
+        index.create(conn, checkfirst=True)
@@ -0,0 +1,13 @@
+# app/migrations/m0003_image_variants.py - Responsive Image Variant Columns
+"""Nullable JSON columns recording the resized variants of each uploaded image"""
+from sqlalchemy import JSON, Column
+
+from app.migrations.ops import add_column
+
+VERSION = 3
+DESCRIPTION = "image variant columns"
+
+
+def upgrade(conn):
+    add_column(conn, "destinations", Column("image_variants", JSON, nullable=True))
+    add_column(conn, "destination_images", Column("variants", JSON, nullable=True))
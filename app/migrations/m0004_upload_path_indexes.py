@@ -0,0 +1,11 @@
+# app/migrations/m0004_upload_path_indexes.py - Upload Reference Indexes
+"""Indexes for counting references to a content-addressed upload file"""
+from app.migrations.ops import create_index
+
+VERSION = 4
+DESCRIPTION = "upload path indexes"
+
+
+def upgrade(conn):
+    create_index(conn, "destinations", "idx_destinations_image_path", "image_path")
+    create_index(conn, "destination_images", "idx_destination_images_image_path", "image_path")
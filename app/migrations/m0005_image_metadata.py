@@ -0,0 +1,26 @@
+# app/migrations/m0005_image_metadata.py - Image Metadata Columns
+"""Dimensions, size, dominant colour and blurhash of each uploaded image"""
+from sqlalchemy import Column, Integer, String
+
+from app.migrations.ops import add_column
+
+VERSION = 5
+DESCRIPTION = "image metadata columns"
+
+
+def metadata_columns(prefix: str = ""):
+    """The five nullable metadata columns, named with an optional prefix"""
+    return [
+        Column(f"{prefix}width", Integer, nullable=True),
+        Column(f"{prefix}height", Integer, nullable=True),
+        Column(f"{prefix}size_bytes", Integer, nullable=True),
+        Column(f"{prefix}color", String(7), nullable=True),
+        Column(f"{prefix}blurhash", String(64), nullable=True),
+    ]
+
+
+def upgrade(conn):
+    for column in metadata_columns("image_"):
+        add_column(conn, "destinations", column)
+    for column in metadata_columns():
+        add_column(conn, "destination_images", column)
@@ -0,0 +1,12 @@
+# app/migrations/m0006_user_directory_indexes.py - User Directory Indexes
+"""Indexes for prefix search on email and role-filtered, id-ordered user pages"""
+from app.migrations.ops import create_index
+
+VERSION = 6
+DESCRIPTION = "user directory indexes"
+
+
+def upgrade(conn):
+    # username prefix search uses the existing unique index
+    create_index(conn, "users", "idx_users_email", "email")
+    create_index(conn, "users", "idx_users_role_id", "role", "id")
@@ -0,0 +1,29 @@
+# app/migrations/ops.py - Idempotent Schema Operations for Migrations
+"""
+Helpers for migrations after 0001. Each migration spells out the columns
+and indexes it creates instead of reading them from the models, so later
+model changes never alter what an already-released migration does.
+"""
+from sqlalchemy import Column, Index, MetaData, Table, inspect, text
+from sqlalchemy.schema import CreateColumn
+
+
+def add_column(conn, table_name: str, column: Column):
+    """
+    ALTER TABLE ... ADD COLUMN for a freshly built Column.
+    Skipped when the column already exists (e.g. table created by 0001).
+    """
+    existing = {c["name"] for c in inspect(conn).get_columns(table_name)}
+    if column.name in existing:
+        return
+
+    # The DDL compiler needs the column attached to a table
+    Table(table_name, MetaData(), column)
+    ddl = CreateColumn(column).compile(dialect=conn.dialect)
+    conn.execute(text(f"ALTER TABLE {table_name} ADD COLUMN {ddl}"))
+
+
+def create_index(conn, table_name: str, index_name: str, *column_names: str):
+    """CREATE INDEX index_name ON table_name (column_names...), if missing"""
+    table = Table(table_name, MetaData(), *(Column(name) for name in column_names))
+    Index(index_name, *(table.c[name] for name in column_names)).create(conn, checkfirst=True)
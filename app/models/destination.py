@@ -1,5 +1,5 @@
 # app/models/destination.py - Destination Database Model
-from sqlalchemy import Column, Integer, String, Text, Numeric, Boolean, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, Numeric, Boolean, DateTime, ForeignKey, Index, JSON
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
@@ -22,10 +22,22 @@ class Destination(Base):
     entry_fee = Column(String(100), nullable=True)
     rating = Column(Numeric(2, 1), default=0.0)
     image_path = Column(String(255), nullable=True)
+    image_variants = Column(JSON, nullable=True)  # resized WebP/JPEG copies, see image_service
+    image_width = Column(Integer, nullable=True)
+    image_height = Column(Integer, nullable=True)
+    image_size_bytes = Column(Integer, nullable=True)
+    image_color = Column(String(7), nullable=True)  # dominant colour, #rrggbb
+    image_blurhash = Column(String(64), nullable=True)  # placeholder shown while loading
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
     
+    # Indexes (see app/migrations)
+    __table_args__ = (
+        Index('idx_destinations_active_name', 'is_active', 'name'),
+        Index('idx_destinations_image_path', 'image_path'),
+    )
+    
     # Relationships
     category = relationship("Category", back_populates="destinations")
     images = relationship("DestinationImage", back_populates="destination", cascade="all, delete-orphan")
@@ -38,9 +50,20 @@ class DestinationImage(Base):
     id = Column(Integer, primary_key=True, index=True)
     destination_id = Column(Integer, ForeignKey("destinations.id", ondelete="CASCADE"), nullable=False)
     image_path = Column(String(255), nullable=False)
+    variants = Column(JSON, nullable=True)  # resized WebP/JPEG copies, see image_service
+    width = Column(Integer, nullable=True)
+    height = Column(Integer, nullable=True)
+    size_bytes = Column(Integer, nullable=True)
+    color = Column(String(7), nullable=True)  # dominant colour, #rrggbb
+    blurhash = Column(String(64), nullable=True)  # placeholder shown while loading
     caption = Column(String(200), nullable=True)
     is_primary = Column(Boolean, default=False)
     created_at = Column(DateTime, server_default=func.now())
     
+    # Indexes (see app/migrations)
+    __table_args__ = (
+        Index('idx_destination_images_image_path', 'image_path'),
+    )
+    
     # Relationships
     destination = relationship("Destination", back_populates="images")
\ No newline at end of file
@@ -1,5 +1,5 @@
 # app/models/feedback.py - Website Feedback Model (FIXED)
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, CheckConstraint
+from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, CheckConstraint, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
@@ -35,6 +35,7 @@ class WebsiteFeedback(Base):
     # Constraints
     __table_args__ = (
         CheckConstraint('rating >= 1 AND rating <= 5', name='check_feedback_rating_range'),
+        Index('idx_feedback_public_created', 'is_public', 'created_at'),
     )
     
     # Relationships
@@ -1,5 +1,5 @@
 # app/models/review.py - Review Database Model
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, CheckConstraint
+from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, CheckConstraint, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
@@ -20,6 +20,7 @@ class Review(Base):
     # Constraints
     __table_args__ = (
         CheckConstraint('rating >= 1 AND rating <= 5', name='check_rating_range'),
+        Index('idx_reviews_dest_approved_created', 'destination_id', 'is_approved', 'created_at'),
     )
     
     # Relationships
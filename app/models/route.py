@@ -1,5 +1,5 @@
 # app/models/route.py - Route Database Model (ALTERNATIVE FIX)
-from sqlalchemy import Column, Integer, String, Text, Numeric, Boolean, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, Numeric, Boolean, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
@@ -35,6 +35,11 @@ class Route(Base):
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime, server_default=func.now())
     
+    # Indexes (see app/migrations)
+    __table_args__ = (
+        Index('idx_routes_active_name', 'is_active', 'route_name'),
+    )
+    
     # Relationships
     origin = relationship("Destination", foreign_keys=[origin_id])
     destination = relationship("Destination", foreign_keys=[destination_id])
\ No newline at end of file
@@ -1,5 +1,5 @@
 # app/models/user.py - User Database Model (FIXED)
-from sqlalchemy import Column, Integer, String, DateTime, Enum
+from sqlalchemy import Column, Integer, String, DateTime, Enum, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
@@ -21,6 +21,12 @@ class User(Base):
     role = Column(Enum(UserRole), default=UserRole.USER)
     created_at = Column(DateTime, server_default=func.now())
     
+    # Indexes (see app/migrations)
+    __table_args__ = (
+        Index('idx_users_email', 'email'),
+        Index('idx_users_role_id', 'role', 'id'),
+    )
+    
     # Relationships
     reviews = relationship("Review", back_populates="user")
     feedbacks = relationship("WebsiteFeedback", back_populates="user")
\ No newline at end of file
@@ -1,10 +1,11 @@
 from app.schemas.destination import (
     DestinationResponse,
     DestinationListResponse,
-    DestinationImageResponse
+    DestinationImageResponse,
+    DestinationImport
 )
 from app.schemas.category import CategoryResponse
-from app.schemas.route import RouteResponse
+from app.schemas.route import RouteBase, RouteImport, RouteResponse
 from app.schemas.review import (
     ReviewCreate,
     ReviewResponse,
@@ -22,15 +23,23 @@ from app.schemas.auth import (
     UserResponse,
     UserWithToken
 )
+from app.schemas.bulk import (
+    ReviewBulkAction,
+    FeedbackBulkAction,
+    DestinationBulkAction
+)
 
 __all__ = [
     # Destinations
     "DestinationResponse",
     "DestinationListResponse",
     "DestinationImageResponse",
+    "DestinationImport",
     # Categories
     "CategoryResponse",
     # Routes
+    "RouteBase",
+    "RouteImport",
     "RouteResponse",
     # Reviews
     "ReviewCreate",
@@ -46,4 +55,8 @@ __all__ = [
     "Token",
     "UserResponse",
     "UserWithToken",
+    # Admin bulk actions
+    "ReviewBulkAction",
+    "FeedbackBulkAction",
+    "DestinationBulkAction",
 ]
\ No newline at end of file
@@ -0,0 +1,62 @@
+# app/schemas/bulk.py - Pydantic Schemas for Admin Bulk Actions
+from pydantic import BaseModel, Field, model_validator
+from typing import Optional, List, Literal
+from datetime import datetime
+
+# Upper bound on explicit id lists (one IN (...) per statement)
+MAX_BULK_IDS = 1000
+
+
+class BulkSelection(BaseModel):
+    """
+    Select rows either by id or by filter - exactly one of the two.
+    A filter has no upper bound, so deleting by filter also requires
+    expected_count: the number of rows the client saw matching it.
+    """
+    ids: Optional[List[int]] = Field(None, min_length=1, max_length=MAX_BULK_IDS)
+    filter: Optional[BaseModel] = None
+    expected_count: Optional[int] = Field(None, ge=0)
+
+    @model_validator(mode="after")
+    def check_selection(self):
+        if (self.ids is None) == (self.filter is None):
+            raise ValueError("Provide either ids or filter")
+        if self.filter is not None and not self.filter.model_dump(exclude_none=True):
+            raise ValueError("filter must set at least one field")
+        if self.filter is not None and getattr(self, "action", None) == "delete" and self.expected_count is None:
+            raise ValueError("Deleting by filter requires expected_count")
+        return self
+
+
+class ReviewFilter(BaseModel):
+    destination_id: Optional[int] = None
+    is_approved: Optional[bool] = None
+    max_rating: Optional[int] = Field(None, ge=1, le=5)
+    created_before: Optional[datetime] = None
+
+
+class ReviewBulkAction(BulkSelection):
+    action: Literal["approve", "unapprove", "delete"]
+    filter: Optional[ReviewFilter] = None
+
+
+class FeedbackFilter(BaseModel):
+    is_read: Optional[bool] = None
+    category: Optional[str] = None
+    created_before: Optional[datetime] = None
+
+
+class FeedbackBulkAction(BulkSelection):
+    action: Literal["mark_read", "mark_unread", "delete"]
+    filter: Optional[FeedbackFilter] = None
+
+
+class DestinationFilter(BaseModel):
+    category_id: Optional[int] = None
+    is_active: Optional[bool] = None
+
+
+class DestinationBulkAction(BulkSelection):
+    action: Literal["activate", "deactivate", "delete"]
+    filter: Optional[DestinationFilter] = None
+
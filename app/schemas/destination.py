@@ -7,6 +7,12 @@ from decimal import Decimal
 
 class DestinationImageBase(BaseModel):
     image_path: str
+    variants: Optional[dict] = None
+    width: Optional[int] = None
+    height: Optional[int] = None
+    size_bytes: Optional[int] = None
+    color: Optional[str] = None
+    blurhash: Optional[str] = None
     caption: Optional[str] = None
     is_primary: bool = False
 
@@ -33,10 +39,22 @@ class DestinationBase(BaseModel):
     entry_fee: Optional[str] = Field(None, max_length=100)
 
 
+class DestinationImport(DestinationBase):
+    """One row of a catalog import; the category may be given by name"""
+    category: Optional[str] = None
+    is_active: bool = True
+
+
 class DestinationResponse(DestinationBase):
     id: int
     rating: Decimal
     image_path: Optional[str]
+    image_variants: Optional[dict] = None
+    image_width: Optional[int] = None
+    image_height: Optional[int] = None
+    image_size_bytes: Optional[int] = None
+    image_color: Optional[str] = None
+    image_blurhash: Optional[str] = None
     is_active: bool
     created_at: datetime
     updated_at: datetime
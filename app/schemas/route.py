@@ -1,23 +1,32 @@
 # app/schemas/route.py - Pydantic Schemas for Routes
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Optional
 from datetime import datetime
 from decimal import Decimal
 from app.models.route import TransportMode
 
 
-class RouteResponse(BaseModel):
-    id: int
-    route_name: Optional[str]
-    origin_id: Optional[int]
-    destination_id: Optional[int]
+class RouteBase(BaseModel):
+    route_name: Optional[str] = Field(None, max_length=200)
+    origin_id: Optional[int] = None
+    destination_id: Optional[int] = None
     transport_mode: TransportMode
-    distance_km: Optional[Decimal]
-    estimated_time_minutes: Optional[int]
-    base_fare: Optional[Decimal]
-    fare_per_km: Optional[Decimal]
-    description: Optional[str]
-    is_active: bool
+    distance_km: Optional[Decimal] = None
+    estimated_time_minutes: Optional[int] = None
+    base_fare: Optional[Decimal] = None
+    fare_per_km: Optional[Decimal] = None
+    description: Optional[str] = None
+    is_active: bool = True
+
+
+class RouteImport(RouteBase):
+    """One row of a catalog import; endpoints may be given by destination name"""
+    origin: Optional[str] = None
+    destination: Optional[str] = None
+
+
+class RouteResponse(RouteBase):
+    id: int
     created_at: datetime
     
     # Related data
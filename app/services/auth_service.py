@@ -3,11 +3,13 @@ from datetime import datetime, timedelta
 from typing import Optional
 from jose import JWTError, jwt
 from passlib.context import CryptContext
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
 
 from app.models.user import User, UserRole
 from app.config import settings
+from app.core.security import password_hash_pool
 
 # Password hashing - Support both PHP bcrypt ($2y$) and Python bcrypt ($2b$)
 pwd_context = CryptContext(
@@ -42,6 +44,18 @@ class AuthService:
         """Hash a password"""
         return pwd_context.hash(password)
     
+    @staticmethod
+    async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+        """Verify a password on the hashing pool without blocking the event loop"""
+        return await password_hash_pool.run(
+            AuthService.verify_password, plain_password, hashed_password
+        )
+    
+    @staticmethod
+    async def get_password_hash_async(password: str) -> str:
+        """Hash a password on the hashing pool without blocking the event loop"""
+        return await password_hash_pool.run(AuthService.get_password_hash, password)
+    
     @staticmethod
     def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
         """Create JWT access token"""
@@ -69,10 +83,10 @@ class AuthService:
             )
     
     @staticmethod
-    def authenticate_user(db: Session, username: str, password: str) -> Optional[User]:
+    async def authenticate_user(db: AsyncSession, username: str, password: str) -> Optional[User]:
         """Authenticate user with username and password - FIXED"""
         try:
-            user = db.query(User).filter(User.username == username).first()
+            user = await AuthService.get_user_by_username(db, username)
             
             if not user:
                 print(f"User not found: {username}")
@@ -82,23 +96,29 @@ class AuthService:
             stored_password = str(user.password)
             print(f"Verifying password for user: {username}")
             
-            if not AuthService.verify_password(password, stored_password):
+            # End the read transaction so the connection goes back to the
+            # pool while bcrypt runs (expire_on_commit=False keeps user loaded)
+            await db.commit()
+            
+            if not await AuthService.verify_password_async(password, stored_password):
                 print(f"Password verification failed for user: {username}")
                 return None
             
             print(f"User authenticated successfully: {username}")
             return user
             
+        except HTTPException:
+            raise
         except Exception as e:
             print(f"Authentication error: {e}")
             return None
     
     @staticmethod
-    def register_user(db: Session, username: str, email: str, password: str) -> User:
+    async def register_user(db: AsyncSession, username: str, email: str, password: str) -> User:
         """Register a new user - FIXED"""
         try:
             # Check if username exists
-            existing_user = db.query(User).filter(User.username == username).first()
+            existing_user = await AuthService.get_user_by_username(db, username)
             if existing_user:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
@@ -107,15 +127,19 @@ class AuthService:
             
             # Check if email exists
             if email:
-                existing_email = db.query(User).filter(User.email == email).first()
+                result = await db.execute(select(User).where(User.email == email))
+                existing_email = result.scalars().first()
                 if existing_email:
                     raise HTTPException(
                         status_code=status.HTTP_400_BAD_REQUEST,
                         detail="Email already registered"
                     )
             
+            # Release the connection while hashing, as in authenticate_user
+            await db.commit()
+            
             # Hash password
-            hashed_password = AuthService.get_password_hash(password)
+            hashed_password = await AuthService.get_password_hash_async(password)
             print(f"Creating user: {username} with hashed password")
             
             # Create new user
@@ -127,8 +151,8 @@ class AuthService:
             )
             
             db.add(new_user)
-            db.commit()
-            db.refresh(new_user)
+            await db.commit()
+            await db.refresh(new_user)
             
             print(f"User created successfully: {username} (ID: {new_user.id})")
             return new_user
@@ -136,7 +160,7 @@ class AuthService:
         except HTTPException:
             raise
         except Exception as e:
-            db.rollback()
+            await db.rollback()
             print(f"Registration error: {e}")
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -144,11 +168,12 @@ class AuthService:
             )
     
     @staticmethod
-    def get_user_by_id(db: Session, user_id: int) -> Optional[User]:
+    async def get_user_by_id(db: AsyncSession, user_id: int) -> Optional[User]:
         """Get user by ID"""
-        return db.query(User).filter(User.id == user_id).first()
+        return await db.get(User, user_id)
     
     @staticmethod
-    def get_user_by_username(db: Session, username: str) -> Optional[User]:
+    async def get_user_by_username(db: AsyncSession, username: str) -> Optional[User]:
         """Get user by username"""
-        return db.query(User).filter(User.username == username).first()
\ No newline at end of file
+        result = await db.execute(select(User).where(User.username == username))
+        return result.scalars().first()
\ No newline at end of file
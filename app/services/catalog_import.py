@@ -0,0 +1,350 @@
+# app/services/catalog_import.py - Bulk Catalog Import (Destinations & Routes)
+"""
+Loads a municipality's catalog from CSV, NDJSON or a JSON array.
+
+Rows are read one at a time, validated with the schemas in app.schemas and
+written in chunks of IMPORT_BATCH_SIZE: one SELECT finds the rows that
+already exist by natural key, then one multi-row INSERT and one bulk
+UPDATE by primary key write the chunk, which commits on its own. A bad row
+(or a chunk the database rejects) is recorded in the report and the rest
+of the file still goes in.
+
+Natural keys: destinations by name, routes by (origin, destination,
+transport mode). Categories and route endpoints may be given by name.
+A name shared by several stored destinations is reported as an error
+instead of picking one of them.
+"""
+import argparse
+import csv
+import io
+import json
+import sys
+from typing import IO, Dict, Iterator, List, Optional, Tuple
+
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import insert, select, update
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.models.category import Category
+from app.models.destination import Destination
+from app.models.route import Route
+from app.schemas.destination import DestinationImport
+from app.schemas.route import RouteImport
+
+# Rows per SELECT/INSERT/UPDATE round and per commit
+IMPORT_BATCH_SIZE = 500
+
+# Errors listed individually in a report; the rest are only counted
+MAX_REPORTED_ERRORS = 1000
+
+FORMATS = ("csv", "ndjson", "json")
+
+
+class ImportReport:
+    def __init__(self, dataset: str, dry_run: bool):
+        self.dataset = dataset
+        self.dry_run = dry_run
+        self.rows = 0
+        self.inserted = 0
+        self.updated = 0
+        self.failed = 0
+        self.errors: List[dict] = []
+
+    def error(self, row: int, *messages: str):
+        self.failed += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({"row": row, "errors": list(messages)})
+
+    def as_dict(self) -> dict:
+        return {
+            "dataset": self.dataset,
+            "dry_run": self.dry_run,
+            "rows": self.rows,
+            "inserted": self.inserted,
+            "updated": self.updated,
+            "failed": self.failed,
+            "errors": sorted(self.errors, key=lambda e: e["row"]),
+        }
+
+
+# ============ READING ============
+def detect_format(filename: Optional[str]) -> str:
+    suffix = (filename or "").rsplit(".", 1)[-1].lower()
+    if suffix == "jsonl":
+        return "ndjson"
+    if suffix not in FORMATS:
+        raise ValueError(f"Cannot tell the format of {filename!r}; use one of {', '.join(FORMATS)}")
+    return suffix
+
+
+def read_rows(stream: IO[bytes], fmt: str) -> Iterator[dict]:
+    """
+    Yield one dict per record. CSV and NDJSON are streamed line by line;
+    a JSON document is parsed whole, and may also be newline-delimited.
+    Empty CSV cells are dropped, so they never overwrite stored values.
+    """
+    text = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+    if fmt == "csv":
+        for record in csv.DictReader(text):
+            yield {k.strip(): v.strip() for k, v in record.items() if k and v is not None and v.strip()}
+        return
+
+    if fmt == "json":
+        head = text.read(1)
+        while head.isspace():
+            head = text.read(1)
+        if head == "[":
+            records = json.loads(head + text.read())
+            for record in records:
+                yield record if isinstance(record, dict) else {"_invalid": f"not an object: {record!r}"}
+            return
+        lines = _prepend(head, text)
+    else:
+        lines = text
+
+    for line in lines:
+        if line.strip():
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                record = {"_invalid": f"invalid JSON: {e.msg}"}
+            yield record if isinstance(record, dict) else {"_invalid": f"not an object: {record!r}"}
+
+
+def _prepend(first: str, text: IO[str]) -> Iterator[str]:
+    """The lines of text, with the character already consumed put back"""
+    line = first + text.readline()
+    while line:
+        yield line
+        line = text.readline()
+
+
+def _chunks(records: Iterator[dict], size: int) -> Iterator[List[Tuple[int, dict]]]:
+    """(1-based record number, record) pairs, size at a time"""
+    chunk = []
+    for number, record in enumerate(records, start=1):
+        chunk.append((number, record))
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _validate(schema, number: int, record: dict, report: ImportReport) -> Optional[BaseModel]:
+    if "_invalid" in record:
+        report.error(number, record["_invalid"])
+        return None
+    try:
+        return schema.model_validate(record)
+    except ValidationError as e:
+        report.error(number, *(
+            f"{'.'.join(str(p) for p in err['loc']) or 'row'}: {err['msg']}" for err in e.errors()
+        ))
+        return None
+
+
+# ============ WRITING ============
+def _write_chunk(db: Session, model, inserts: List[dict], updates: List[dict], report: ImportReport,
+                 numbers: List[int]):
+    """Insert and update one chunk in a transaction of its own"""
+    if report.dry_run:
+        report.inserted += len(inserts)
+        report.updated += len(updates)
+        return
+    try:
+        if inserts:
+            db.execute(insert(model), inserts)
+        if updates:
+            # ORM bulk UPDATE by primary key: one executemany per set of columns
+            db.execute(update(model), updates)
+        db.commit()
+    except SQLAlchemyError as e:
+        db.rollback()
+        message = f"chunk rejected by the database: {str(getattr(e, 'orig', None) or e)[:200]}"
+        for number in numbers:
+            report.error(number, message)
+        return
+    report.inserted += len(inserts)
+    report.updated += len(updates)
+
+
+def _upsert_values(item: BaseModel, exclude: set) -> Tuple[dict, dict]:
+    """Column values for an INSERT (all of them) and an UPDATE (only those given)"""
+    return (
+        item.model_dump(exclude=exclude),
+        item.model_dump(exclude=exclude, exclude_unset=True, exclude_none=True),
+    )
+
+
+def _destination_ids(db: Session, names) -> Dict[str, List[int]]:
+    """Ids of the destinations with each name (more than one if names repeat)"""
+    ids: Dict[str, List[int]] = {}
+    for id, name in db.execute(
+        select(Destination.id, Destination.name)
+        .where(Destination.name.in_(names))
+        .order_by(Destination.id)
+    ):
+        ids.setdefault(name, []).append(id)
+    return ids
+
+
+def _ambiguous(field: str, name: str, ids: List[int]) -> str:
+    return f"{field}: {len(ids)} destinations are named {name!r} (ids {', '.join(map(str, ids))})"
+
+
+def import_destinations(db: Session, records: Iterator[dict], dry_run: bool = False,
+                        batch_size: int = IMPORT_BATCH_SIZE) -> ImportReport:
+    """Upsert destinations by name; `category` names resolve to category ids"""
+    report = ImportReport("destinations", dry_run)
+    categories = {name.strip().lower(): id for id, name in db.execute(select(Category.id, Category.name))}
+    # Names a dry run has counted as inserted: later chunks would update them
+    planned = set()
+
+    for chunk in _chunks(records, batch_size):
+        report.rows += len(chunk)
+        rows: Dict[str, Tuple[int, dict, dict]] = {}
+        for number, record in chunk:
+            item = _validate(DestinationImport, number, record, report)
+            if item is None:
+                continue
+            values, changes = _upsert_values(item, {"category"})
+            if item.category is not None:
+                category_id = categories.get(item.category.strip().lower())
+                if category_id is None:
+                    report.error(number, f"category: unknown category {item.category!r}")
+                    continue
+                values["category_id"] = changes["category_id"] = category_id
+            # A name repeated within the file: the later row wins
+            rows[item.name] = (number, values, changes)
+
+        existing = _destination_ids(db, rows.keys()) if rows else {}
+
+        inserts, updates, numbers = [], [], []
+        for name, (number, values, changes) in rows.items():
+            ids = existing.get(name, [])
+            if len(ids) > 1:
+                # Updating one of them would be a guess
+                report.error(number, _ambiguous("name", name, ids))
+                continue
+            if ids:
+                updates.append({"id": ids[0], **changes})
+            elif name in planned:
+                updates.append(changes)
+            else:
+                inserts.append(values)
+                if dry_run:
+                    planned.add(name)
+            numbers.append(number)
+        _write_chunk(db, Destination, inserts, updates, report, numbers)
+
+    return report
+
+
+def import_routes(db: Session, records: Iterator[dict], dry_run: bool = False,
+                  batch_size: int = IMPORT_BATCH_SIZE) -> ImportReport:
+    """Upsert routes by (origin, destination, transport mode); endpoints may be destination names"""
+    report = ImportReport("routes", dry_run)
+    planned = set()  # as in import_destinations
+
+    for chunk in _chunks(records, batch_size):
+        report.rows += len(chunk)
+        items = []
+        for number, record in chunk:
+            item = _validate(RouteImport, number, record, report)
+            if item is not None:
+                items.append((number, item))
+
+        # Resolve every destination name used in the chunk in one query
+        names = {n for _, item in items for n in (item.origin, item.destination) if n}
+        destination_ids = _destination_ids(db, names) if names else {}
+
+        rows: Dict[tuple, Tuple[int, dict, dict]] = {}
+        for number, item in items:
+            values, changes = _upsert_values(item, {"origin", "destination"})
+            problems = []
+            for field, name in (("origin", item.origin), ("destination", item.destination)):
+                if name is not None:
+                    ids = destination_ids.get(name, [])
+                    if len(ids) != 1:
+                        problems.append(
+                            (_ambiguous(field, name, ids) + f"; give {field}_id") if ids
+                            else f"{field}: unknown destination {name!r}"
+                        )
+                        continue
+                    values[f"{field}_id"] = changes[f"{field}_id"] = ids[0]
+                elif values[f"{field}_id"] is None:
+                    problems.append(f"{field}: give {field} (a destination name) or {field}_id")
+            if problems:
+                report.error(number, *problems)
+                continue
+            values["transport_mode"] = changes["transport_mode"] = item.transport_mode.value
+            rows[(values["origin_id"], values["destination_id"], values["transport_mode"])] = (number, values, changes)
+
+        existing = {}
+        if rows:
+            origins = {key[0] for key in rows}
+            targets = {key[1] for key in rows}
+            for id, *key in db.execute(
+                select(Route.id, Route.origin_id, Route.destination_id, Route.transport_mode)
+                .where(Route.origin_id.in_(origins), Route.destination_id.in_(targets))
+                .order_by(Route.id)
+            ):
+                existing.setdefault(tuple(key), id)
+
+        inserts, updates = [], []
+        for key, (number, values, changes) in rows.items():
+            if key in existing:
+                updates.append({"id": existing[key], **changes})
+            elif key in planned:
+                updates.append(changes)
+            else:
+                inserts.append(values)
+                if dry_run:
+                    planned.add(key)
+        _write_chunk(db, Route, inserts, updates, report, [number for number, _, _ in rows.values()])
+
+    return report
+
+
+IMPORTERS = {
+    "destinations": import_destinations,
+    "routes": import_routes,
+}
+
+
+def run_import(db: Session, dataset: str, stream: IO[bytes], fmt: str, dry_run: bool = False) -> ImportReport:
+    """Import one file into a dataset (see IMPORTERS)"""
+    return IMPORTERS[dataset](db, read_rows(stream, fmt), dry_run)
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Import destinations or routes from CSV/JSON")
+    parser.add_argument("dataset", choices=sorted(IMPORTERS))
+    parser.add_argument("path", help="file to import (.csv, .ndjson/.jsonl or .json)")
+    parser.add_argument("--format", choices=FORMATS, default=None, help="override the format taken from the extension")
+    parser.add_argument("--dry-run", action="store_true", help="validate and report without writing")
+    args = parser.parse_args(argv)
+
+    from app.database import SessionLocal
+
+    fmt = args.format or detect_format(args.path)
+    db = SessionLocal()
+    try:
+        with open(args.path, "rb") as f:
+            report = run_import(db, args.dataset, f, fmt, args.dry_run)
+    finally:
+        db.close()
+
+    for error in report.errors:
+        print(f"row {error['row']}: {'; '.join(error['errors'])}")
+    print(
+        f"{report.rows} rows: {report.inserted} inserted, {report.updated} updated, {report.failed} failed"
+        + (" [dry run]" if args.dry_run else "")
+    )
+    return 1 if report.failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,174 @@
+# app/services/image_cache.py - On-Demand Resized Image Cache
+import asyncio
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import BinaryIO, Dict, Optional
+
+import anyio
+from fastapi import HTTPException
+
+from app.config import settings
+from app.services.image_service import VARIANT_FORMATS, get_pool, open_image, resize_to_width, save_as
+
+
+def _resize_to_file(source: str, target: str, width: int, fmt: str) -> int:
+    """Runs in a worker process: write one rendition atomically and return its size"""
+    image = resize_to_width(open_image(source), width)
+    tmp = f"{target}.{os.getpid()}.tmp"
+    save_as(image, tmp, fmt)
+    os.replace(tmp, target)
+    return os.path.getsize(target)
+
+
+class ResizeCache:
+    """
+    Size-bounded LRU of resized images on disk.
+
+    Entries are keyed by source path, mtime, size, width and format, so a
+    replaced source never serves a stale rendition. Concurrent requests for
+    the same missing rendition share one render on the process pool. The
+    LRU order survives restarts through file mtimes (touched on every hit).
+    Each worker process keeps its own index, so with N workers the directory
+    can briefly exceed max_bytes until their evictions catch up.
+    Renditions are handed out as open files: eviction (here or in another
+    worker) may unlink a file at any time, but an open file stays readable.
+    """
+
+    def __init__(self, directory: str, max_bytes: int):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, int]" = OrderedDict()  # cache-relative path -> bytes, oldest first
+        self._total = 0
+        self._loaded = False
+        self._lock = threading.Lock()
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+
+    def _load(self):
+        """Index files left by a previous run, least recently used first"""
+        with self._lock:
+            if self._loaded:
+                return
+            files = []
+            if self.directory.is_dir():
+                for path in self.directory.rglob("*"):
+                    if path.is_file() and not path.name.endswith(".tmp"):
+                        stat = path.stat()
+                        files.append((stat.st_mtime, path.relative_to(self.directory).as_posix(), stat.st_size))
+            for _, rel, size in sorted(files):
+                self._entries[rel] = size
+                self._total += size
+            self._loaded = True
+        self._evict()
+
+    def key(self, source_rel: str, stat: os.stat_result, width: int, fmt: str) -> str:
+        digest = hashlib.sha256(
+            f"{source_rel}\0{stat.st_mtime_ns}\0{stat.st_size}\0{width}\0{fmt}".encode()
+        ).hexdigest()
+        return f"{digest[:2]}/{digest}{VARIANT_FORMATS[fmt][0]}"
+
+    def _open(self, rel: str, hit: bool) -> Optional[BinaryIO]:
+        """Open a cached rendition, or None if it isn't on disk (any more)"""
+        path = self.directory / rel
+        try:
+            file = open(path, "rb")
+        except FileNotFoundError:
+            with self._lock:
+                if rel in self._entries:
+                    # Evicted by another worker
+                    self._total -= self._entries.pop(rel)
+            return None
+        with self._lock:
+            indexed = rel in self._entries
+            if indexed:
+                self._entries.move_to_end(rel)
+            if hit:
+                self.hits += 1
+        if not indexed:
+            # Rendered by another worker: index it instead of rendering it again
+            self._add(rel, os.fstat(file.fileno()).st_size)
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return file
+
+    def _add(self, rel: str, size: int):
+        with self._lock:
+            self._total += size - self._entries.pop(rel, 0)
+            self._entries[rel] = size
+        self._evict()
+
+    def _evict(self):
+        while True:
+            with self._lock:
+                # Always keep the newest entry, even if it alone is over the limit
+                if self._total <= self.max_bytes or len(self._entries) <= 1:
+                    return
+                rel, size = self._entries.popitem(last=False)
+                self._total -= size
+                self.evictions += 1
+            (self.directory / rel).unlink(missing_ok=True)
+
+    async def open(self, source: Path, source_rel: str, width: int, fmt: str) -> BinaryIO:
+        """Open file of the cached rendition, rendering it first if needed"""
+        if not self._loaded:
+            await anyio.to_thread.run_sync(self._load)
+
+        stat = await anyio.to_thread.run_sync(source.stat)
+        rel = self.key(source_rel, stat, width, fmt)
+        file = await anyio.to_thread.run_sync(self._open, rel, True)
+
+        # A fresh rendition can be evicted again before it is opened (other
+        # workers, a tiny cache), so render and retry a few times
+        for _ in range(3):
+            if file is not None:
+                return file
+            await self._render_shared(source, rel, width, fmt)
+            file = await anyio.to_thread.run_sync(self._open, rel, False)
+        if file is not None:
+            return file
+        raise HTTPException(status_code=503, detail="Image cache is busy, please retry")
+
+    async def _render_shared(self, source: Path, rel: str, width: int, fmt: str):
+        """Render rel, joining a render of the same rendition already in progress"""
+        task = self._inflight.get(rel)
+        if task is None:
+            self.misses += 1
+            task = asyncio.create_task(self._render(source, rel, width, fmt))
+            self._inflight[rel] = task
+            task.add_done_callback(lambda _: self._inflight.pop(rel, None))
+        else:
+            self.coalesced += 1
+
+        # shield: a client disconnecting must not cancel a render others wait for
+        await asyncio.shield(task)
+
+    async def _render(self, source: Path, rel: str, width: int, fmt: str):
+        target = self.directory / rel
+        await anyio.to_thread.run_sync(lambda: target.parent.mkdir(parents=True, exist_ok=True))
+        size = await asyncio.get_running_loop().run_in_executor(
+            get_pool(), _resize_to_file, str(source), str(target), width, fmt
+        )
+        self._add(rel, size)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._total,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "coalesced": self.coalesced,
+                "evictions": self.evictions,
+            }
+
+
+resize_cache = ResizeCache(settings.IMAGE_CACHE_DIR, settings.IMAGE_CACHE_MAX_BYTES)
@@ -0,0 +1,320 @@
+# app/services/image_service.py - Responsive Image Variants
+import math
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+from app.config import settings
+
+# Output formats: extension, Pillow format name and save options
+VARIANT_FORMATS = {
+    "webp": (".webp", "WEBP", {"quality": 80, "method": 4}),
+    "jpeg": (".jpg", "JPEG", {"quality": 82, "optimize": True, "progressive": True}),
+}
+
+# Pillow format name -> extension uploads are saved with
+SNIFFED_EXTENSIONS = {"JPEG": ".jpg", "PNG": ".png", "GIF": ".gif", "WEBP": ".webp"}
+
+# Metadata stored per image: columns on DestinationImage, "image_" + key on Destination
+METADATA_FIELDS = ("width", "height", "size_bytes", "color", "blurhash")
+
+BASE83 = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz#$%*+,-.:;=?@[]^_{|}~"
+
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+def get_pool() -> ProcessPoolExecutor:
+    """Process pool for Pillow work (CPU bound, so threads would fight over the GIL)"""
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(max_workers=settings.IMAGE_WORKERS)
+    return _pool
+
+
+def shutdown_pool():
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+def variant_path(rel_path: str, width: int, fmt: str) -> str:
+    """uploads-relative path of one variant, e.g. destinations/abc_w640.webp"""
+    ext = VARIANT_FORMATS[fmt][0]
+    return str(Path(rel_path).with_suffix("")) + f"_w{width}{ext}"
+
+
+def sniff_image_extension(path) -> Optional[str]:
+    """Extension for the image type found in the file's content, or None if it isn't an image"""
+    from PIL import Image
+
+    try:
+        with Image.open(path) as image:
+            image.verify()
+            return SNIFFED_EXTENSIONS.get(image.format)
+    except Exception:
+        return None
+
+
+def open_image(path):
+    """Open an image upright (EXIF orientation applied) in RGB or RGBA mode"""
+    from PIL import Image, ImageOps
+
+    with Image.open(path) as original:
+        image = ImageOps.exif_transpose(original)
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA" if "transparency" in image.info else "RGB")
+        image.load()
+    return image
+
+
+def resize_to_width(image, width: int):
+    """Downscale to width keeping the aspect ratio; never upscales"""
+    from PIL import Image
+
+    target_w = min(width, image.width)
+    if target_w == image.width:
+        return image
+    target_h = max(1, round(image.height * target_w / image.width))
+    return image.resize((target_w, target_h), Image.LANCZOS, reducing_gap=3.0)
+
+
+def save_as(image, path, fmt: str):
+    """Encode image in one of VARIANT_FORMATS"""
+    from PIL import Image
+
+    _, pil_format, options = VARIANT_FORMATS[fmt]
+    if pil_format == "JPEG" and image.mode == "RGBA":
+        # JPEG has no alpha channel: flatten onto white
+        background = Image.new("RGB", image.size, (255, 255, 255))
+        background.paste(image, mask=image.getchannel("A"))
+        image = background
+    image.save(path, pil_format, **options)
+
+
+def _write_variants(image, upload_dir: str, rel_path: str, widths: list) -> dict:
+    """
+    Write every width/format variant of an opened image.
+    Returns {"320": {"width": 320, "height": 213, "webp": path, "jpeg": path}, ...}.
+    Images are never upscaled; widths wider than the original reuse its size.
+    """
+    base = Path(upload_dir)
+    variants = {}
+    done = set()
+    for width in sorted(widths):
+        resized = resize_to_width(image, width)
+        if resized.width in done:
+            continue
+        done.add(resized.width)
+
+        entry = {"width": resized.width, "height": resized.height}
+        for fmt in VARIANT_FORMATS:
+            path = variant_path(rel_path, width, fmt)
+            save_as(resized, base / path, fmt)
+            entry[fmt] = path
+        variants[str(width)] = entry
+
+    return variants
+
+
+def _render_variants(upload_dir: str, rel_path: str, widths: list) -> dict:
+    """Runs in a worker process: write the variants of one upload"""
+    return _write_variants(open_image(Path(upload_dir) / rel_path), upload_dir, rel_path, widths)
+
+
+def _base83(value: int, length: int) -> str:
+    return "".join(BASE83[value // 83 ** (length - i - 1) % 83] for i in range(length))
+
+
+def _srgb_to_linear(value: int) -> float:
+    v = value / 255
+    return v / 12.92 if v <= 0.04045 else ((v + 0.055) / 1.055) ** 2.4
+
+
+def _linear_to_srgb(value: float) -> int:
+    v = max(0.0, min(1.0, value))
+    if v <= 0.0031308:
+        return int(v * 12.92 * 255 + 0.5)
+    return int((1.055 * v ** (1 / 2.4) - 0.055) * 255 + 0.5)
+
+
+def blurhash_encode(image, x_components: int = 4, y_components: int = 3) -> str:
+    """BlurHash (https://blurha.sh) of a small RGB image"""
+    width, height = image.size
+    pixels = [tuple(_srgb_to_linear(c) for c in p) for p in image.getdata()]
+
+    factors = []
+    for j in range(y_components):
+        for i in range(x_components):
+            norm = 1 if i == 0 and j == 0 else 2
+            r = g = b = 0.0
+            for y in range(height):
+                cos_y = math.cos(math.pi * j * y / height)
+                row = y * width
+                for x in range(width):
+                    basis = norm * math.cos(math.pi * i * x / width) * cos_y
+                    pr, pg, pb = pixels[row + x]
+                    r += basis * pr
+                    g += basis * pg
+                    b += basis * pb
+            scale = 1 / (width * height)
+            factors.append((r * scale, g * scale, b * scale))
+
+    dc, ac = factors[0], factors[1:]
+    result = _base83((x_components - 1) + (y_components - 1) * 9, 1)
+    if ac:
+        quantised = max(0, min(82, int(max(abs(v) for f in ac for v in f) * 166 - 0.5)))
+        max_ac = (quantised + 1) / 166
+        result += _base83(quantised, 1)
+    else:
+        max_ac = 1.0
+        result += _base83(0, 1)
+
+    result += _base83((_linear_to_srgb(dc[0]) << 16) + (_linear_to_srgb(dc[1]) << 8) + _linear_to_srgb(dc[2]), 4)
+
+    def quantise(v: float) -> int:
+        return max(0, min(18, int(math.copysign(abs(v / max_ac) ** 0.5, v) * 9 + 9.5)))
+
+    for r, g, b in ac:
+        result += _base83(quantise(r) * 19 * 19 + quantise(g) * 19 + quantise(b), 2)
+    return result
+
+
+def _describe(image, path) -> dict:
+    """Dimensions, file size, dominant colour and blurhash of an opened image"""
+    from PIL import Image
+
+    # Analyse a 32px thumbnail: plenty for a colour and a 4x3 blurhash
+    small = image.convert("RGB")
+    small.thumbnail((32, 32), Image.BOX)
+
+    palette_image = small.quantize(colors=5)
+    palette = palette_image.getpalette()
+    _, index = max(palette_image.getcolors())
+    r, g, b = palette[index * 3:index * 3 + 3]
+
+    return {
+        "width": image.width,
+        "height": image.height,
+        "size_bytes": os.path.getsize(path),
+        "color": f"#{r:02x}{g:02x}{b:02x}",
+        "blurhash": blurhash_encode(small),
+    }
+
+
+def _read_metadata(upload_dir: str, rel_path: str) -> dict:
+    """Runs in a worker process: metadata of one upload"""
+    path = os.path.join(upload_dir, rel_path)
+    return _describe(open_image(path), path)
+
+
+def _process_upload(upload_dir: str, rel_path: str, widths: list) -> dict:
+    """Runs in a worker process: variants and metadata of one upload from a single decode"""
+    path = os.path.join(upload_dir, rel_path)
+    image = open_image(path)
+    return {
+        "variants": _write_variants(image, upload_dir, rel_path, widths),
+        "metadata": _describe(image, path),
+    }
+
+
+def submit_processing(rel_path: str):
+    """Start variants + metadata for an upload on the process pool; returns a Future"""
+    return get_pool().submit(_process_upload, settings.UPLOAD_DIR, rel_path, settings.IMAGE_VARIANT_WIDTHS)
+
+
+def image_metadata(rel_path: str) -> Optional[dict]:
+    """Compute the stored metadata for an uploaded image on the process pool (None on error)"""
+    try:
+        return get_pool().submit(_read_metadata, settings.UPLOAD_DIR, rel_path).result()
+    except Exception as e:
+        print(f"Could not read metadata for {rel_path}: {e}")
+        return None
+
+
+def apply_metadata(row, metadata: Optional[dict]):
+    """Copy image_metadata() output onto a Destination (image_* columns) or DestinationImage"""
+    if not metadata:
+        return
+    prefix = "image_" if hasattr(row, "image_variants") else ""
+    for field in METADATA_FIELDS:
+        setattr(row, prefix + field, metadata[field])
+
+
+def create_variants(rel_path: str) -> Optional[dict]:
+    """
+    Generate the configured variants for an uploaded image on the process pool.
+    Blocks the calling thread (admin handlers run in the threadpool).
+    Returns None if the file can't be processed as an image.
+    """
+    try:
+        return get_pool().submit(
+            _render_variants, settings.UPLOAD_DIR, rel_path, settings.IMAGE_VARIANT_WIDTHS
+        ).result()
+    except Exception as e:
+        print(f"Could not create variants for {rel_path}: {e}")
+        return None
+
+
+def delete_variants(variants: Optional[dict]):
+    """Remove the variant files recorded for an image"""
+    if not variants:
+        return
+    base = Path(settings.UPLOAD_DIR)
+    for entry in variants.values():
+        for fmt in VARIANT_FORMATS:
+            if entry.get(fmt):
+                (base / entry[fmt]).unlink(missing_ok=True)
+
+
+def backfill(db) -> int:
+    """Create variants and metadata for images uploaded before they existed"""
+    from sqlalchemy import or_
+    from app.models.destination import Destination, DestinationImage
+
+    count = 0
+    for model, path_attr, variants_attr, prefix in (
+        (Destination, "image_path", "image_variants", "image_"),
+        (DestinationImage, "image_path", "variants", ""),
+    ):
+        rows = db.query(model).filter(
+            getattr(model, path_attr).isnot(None),
+            or_(
+                getattr(model, variants_attr).is_(None),
+                getattr(model, prefix + "blurhash").is_(None)
+            )
+        ).all()
+        for row in rows:
+            path = getattr(row, path_attr)
+            updated = False
+            if getattr(row, variants_attr) is None:
+                variants = create_variants(path)
+                if variants:
+                    setattr(row, variants_attr, variants)
+                    updated = True
+            if getattr(row, prefix + "blurhash") is None:
+                metadata = image_metadata(path)
+                if metadata:
+                    apply_metadata(row, metadata)
+                    updated = True
+            count += updated
+        db.commit()
+    return count
+
+
+if __name__ == "__main__":
+    # python -m app.services.image_service backfill
+    if sys.argv[1:] != ["backfill"]:
+        print("Usage: python -m app.services.image_service backfill")
+        sys.exit(1)
+
+    from app.database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        print(f"Updated variants/metadata for {backfill(db)} images")
+    finally:
+        db.close()
+        shutdown_pool()
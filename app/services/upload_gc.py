@@ -0,0 +1,244 @@
+# app/services/upload_gc.py - Orphaned Upload Garbage Collection
+"""
+Finds files under UPLOAD_DIR that no Destination/DestinationImage row
+references (left behind by failed deletes, replaced images, old bugs).
+
+Orphans older than a grace period are first moved to
+UPLOAD_QUARANTINE_DIR/<date>/ and only deleted once they have sat there
+for UPLOAD_GC_PURGE_DAYS, so a wrong call can still be undone by moving
+the file back. The quarantine lives outside UPLOAD_DIR, which is served
+publicly under /uploads. The directory is scanned with os.scandir and checked against
+the database one batch at a time, so memory stays flat however many
+files there are.
+"""
+import argparse
+import asyncio
+import os
+import re
+import shutil
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Iterator, List, Optional, Set
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.services.image_service import VARIANT_FORMATS
+from app.services.upload_store import IMAGE_COLUMNS
+
+# Folders holding uploads referenced by image_path columns
+UPLOAD_FOLDERS = ("destinations",)
+
+# destinations/<stem>_w640.webp -> variant of destinations/<stem>.<ext>
+VARIANT_NAME = re.compile(
+    r"^(?P<stem>.+)_w\d+(" + "|".join(re.escape(ext) for ext, _, _ in VARIANT_FORMATS.values()) + r")$"
+)
+
+# Extensions an original may have had (uploads used to keep the client's extension)
+OWNER_EXTENSIONS = ("", ".jpg", ".jpeg", ".png", ".gif", ".webp")
+
+# Bound parameters per IN (...) query
+IN_CHUNK = 900
+
+
+class GCReport:
+    def __init__(self, dry_run: bool):
+        self.dry_run = dry_run
+        self.scanned = 0
+        self.orphans = 0
+        self.orphan_bytes = 0
+        self.quarantined = 0
+        self.purged = 0
+        self.purged_bytes = 0
+
+    def as_dict(self) -> dict:
+        return {
+            "dry_run": self.dry_run,
+            "scanned": self.scanned,
+            "orphans": self.orphans,
+            "orphan_bytes": self.orphan_bytes,
+            "quarantined": self.quarantined,
+            "purged": self.purged,
+            "purged_bytes": self.purged_bytes,
+        }
+
+
+def _scan(upload_dir: Path) -> Iterator[os.DirEntry]:
+    """Files in the upload folders, streamed one directory entry at a time"""
+    for folder in UPLOAD_FOLDERS:
+        try:
+            with os.scandir(upload_dir / folder) as entries:
+                for entry in entries:
+                    if entry.is_file(follow_symlinks=False):
+                        yield entry
+        except FileNotFoundError:
+            continue
+
+
+def _batches(iterator: Iterator, size: int) -> Iterator[list]:
+    batch = []
+    for item in iterator:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _owner_candidates(rel_path: str) -> List[str]:
+    """image_path values that would keep this file alive"""
+    folder, name = rel_path.rsplit("/", 1)
+    match = VARIANT_NAME.match(name)
+    if not match:
+        return [rel_path]
+    stem = f"{folder}/{match.group('stem')}"
+    return [rel_path] + [stem + ext for ext in OWNER_EXTENSIONS] + [stem + ext.upper() for ext in OWNER_EXTENSIONS if ext]
+
+
+def _referenced(db: Session, candidates: Set[str]) -> Set[str]:
+    found = set()
+    values = sorted(candidates)
+    for i in range(0, len(values), IN_CHUNK):
+        chunk = values[i:i + IN_CHUNK]
+        for path_column, _ in IMAGE_COLUMNS:
+            found.update(db.execute(select(path_column).where(path_column.in_(chunk))).scalars())
+    return found
+
+
+def find_orphans(db: Session, upload_dir: Path, grace_seconds: float, batch_size: int, report: GCReport) -> Iterator[tuple]:
+    """Yield (relative path, size) for unreferenced files older than the grace period"""
+    cutoff = time.time() - grace_seconds
+    for batch in _batches(_scan(upload_dir), batch_size):
+        report.scanned += len(batch)
+        candidates = {}
+        for entry in batch:
+            stat = entry.stat(follow_symlinks=False)
+            if stat.st_mtime > cutoff:
+                continue  # may belong to an upload whose row isn't committed yet
+            rel = Path(entry.path).relative_to(upload_dir).as_posix()
+            if entry.name.startswith("."):
+                if entry.name.endswith(".part"):
+                    yield rel, stat.st_size  # temp file of an upload that never finished
+                continue
+            candidates[rel] = (stat.st_size, _owner_candidates(rel))
+
+        referenced = _referenced(db, {c for _, owners in candidates.values() for c in owners})
+        for rel, (size, owners) in candidates.items():
+            if not referenced.intersection(owners):
+                yield rel, size
+
+
+def _quarantine(upload_dir: Path, quarantine: Path, rel: str, grace_seconds: float) -> bool:
+    source = upload_dir / rel
+    try:
+        # Re-check right before moving: a re-upload of the same content refreshes the mtime
+        if source.stat().st_mtime > time.time() - grace_seconds:
+            return False
+    except FileNotFoundError:
+        return False
+    target = quarantine / datetime.now().strftime("%Y%m%d") / rel
+    target.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        # A rename when both are on one filesystem, copy + delete otherwise
+        shutil.move(source, target)
+    except FileNotFoundError:
+        return False  # another worker got there first
+    return True
+
+
+def _purge(quarantine: Path, purge_days: float, report: GCReport):
+    """Delete quarantine folders older than purge_days"""
+    if not quarantine.is_dir():
+        return
+    cutoff = (datetime.now() - timedelta(days=purge_days)).strftime("%Y%m%d")
+    with os.scandir(quarantine) as days:
+        for day in days:
+            if not day.is_dir() or day.name >= cutoff:
+                continue
+            for root, _, files in os.walk(day.path):
+                for name in files:
+                    report.purged += 1
+                    report.purged_bytes += os.path.getsize(os.path.join(root, name))
+            if not report.dry_run:
+                shutil.rmtree(day.path, ignore_errors=True)
+
+
+def collect(
+    db: Session,
+    dry_run: bool = False,
+    grace_hours: Optional[float] = None,
+    purge_days: Optional[float] = None,
+    batch_size: Optional[int] = None,
+    verbose: bool = False,
+) -> GCReport:
+    """Quarantine orphaned uploads and purge old quarantine folders"""
+    upload_dir = Path(settings.UPLOAD_DIR)
+    quarantine = Path(settings.UPLOAD_QUARANTINE_DIR)
+    grace_seconds = (settings.UPLOAD_GC_GRACE_HOURS if grace_hours is None else grace_hours) * 3600
+    report = GCReport(dry_run)
+
+    for rel, size in find_orphans(db, upload_dir, grace_seconds, batch_size or settings.UPLOAD_GC_BATCH_SIZE, report):
+        report.orphans += 1
+        report.orphan_bytes += size
+        if verbose:
+            print(f"{'would quarantine' if dry_run else 'quarantine'} {rel} ({size} bytes)")
+        if not dry_run and _quarantine(upload_dir, quarantine, rel, grace_seconds):
+            report.quarantined += 1
+
+    _purge(quarantine, settings.UPLOAD_GC_PURGE_DAYS if purge_days is None else purge_days, report)
+    return report
+
+
+async def run_periodically():
+    """Lifespan task: collect every UPLOAD_GC_INTERVAL_HOURS"""
+    from starlette.concurrency import run_in_threadpool
+    from app.database import SessionLocal
+
+    def run_once():
+        db = SessionLocal()
+        try:
+            return collect(db)
+        finally:
+            db.close()
+
+    while True:
+        await asyncio.sleep(settings.UPLOAD_GC_INTERVAL_HOURS * 3600)
+        try:
+            report = await run_in_threadpool(run_once)
+            print(f"Upload GC: {report.as_dict()}")
+        except Exception as e:
+            print(f"Upload GC failed: {e}")
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Quarantine and purge unreferenced upload files")
+    parser.add_argument("--dry-run", action="store_true", help="only report what would be moved/deleted")
+    parser.add_argument("--grace-hours", type=float, default=None, help="ignore files newer than this")
+    parser.add_argument("--purge-days", type=float, default=None, help="delete quarantined files older than this")
+    parser.add_argument("--batch-size", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    from app.database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        report = collect(db, args.dry_run, args.grace_hours, args.purge_days, args.batch_size, verbose=True)
+    finally:
+        db.close()
+
+    summary = report.as_dict()
+    print(
+        f"Scanned {summary['scanned']} files: {summary['orphans']} orphans "
+        f"({summary['orphan_bytes'] / 1024:.1f}KB), {summary['quarantined']} quarantined, "
+        f"{summary['purged']} purged from quarantine ({summary['purged_bytes'] / 1024:.1f}KB)"
+        + (" [dry run]" if args.dry_run else "")
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
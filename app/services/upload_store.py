@@ -0,0 +1,313 @@
+# app/services/upload_store.py - Content-Addressed Upload Storage
+"""
+Uploaded images are stored as <folder>/<sha256 of content><ext>, so the same
+photo uploaded twice is one file on disk with one set of variants (and one
+browser cache entry). Files are shared between rows, so a file is only
+removed once no Destination.image_path or DestinationImage.image_path
+references it any more.
+
+A new upload reaches its hashed name before the row pointing at it is
+committed. release_upload therefore leaves recently written files alone
+(UPLOAD_RELEASE_GRACE_SECONDS); the upload GC collects them later if they
+really are orphaned.
+"""
+import hashlib
+import os
+import sys
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from fastapi import HTTPException, UploadFile
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.destination import Destination, DestinationImage
+from app.services.image_service import METADATA_FIELDS, delete_variants, sniff_image_extension, submit_processing
+
+UPLOAD_DIR = Path(settings.UPLOAD_DIR)
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+# Columns that reference upload files, with the variants column stored next to each
+IMAGE_COLUMNS = (
+    (Destination.image_path, Destination.image_variants),
+    (DestinationImage.image_path, DestinationImage.variants),
+)
+
+# Striped locks pairing the rename in store_upload with the check-and-unlink
+# in release_upload for the same file (within one worker; across workers the
+# grace window alone covers it)
+_path_locks = [threading.Lock() for _ in range(64)]
+
+
+def _path_lock(path: str) -> threading.Lock:
+    return _path_locks[hash(path) % len(_path_locks)]
+
+
+def store_upload(file: UploadFile, folder: str) -> str:
+    """
+    Save an uploaded image and return its path relative to UPLOAD_DIR.
+    Copies in fixed-size chunks, aborting with 413 past MAX_UPLOAD_SIZE, and
+    takes the extension from the type Pillow detects, not the client filename.
+    The file name is the SHA-256 of the content, so duplicates share one file.
+    """
+    too_large = HTTPException(
+        status_code=413,
+        detail=f"{file.filename} is larger than {settings.MAX_UPLOAD_SIZE // (1024 * 1024)}MB"
+    )
+    if file.size is not None and file.size > settings.MAX_UPLOAD_SIZE:
+        raise too_large
+
+    tmp_path = UPLOAD_DIR / folder / f".{uuid.uuid4()}.part"
+    try:
+        digest = hashlib.sha256()
+        written = 0
+        with open(tmp_path, "wb") as f:
+            while chunk := file.file.read(UPLOAD_CHUNK_SIZE):
+                written += len(chunk)
+                if written > settings.MAX_UPLOAD_SIZE:
+                    raise too_large
+                digest.update(chunk)
+                f.write(chunk)
+
+        ext = sniff_image_extension(tmp_path)
+        if ext not in settings.ALLOWED_EXTENSIONS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"{file.filename} is not a supported image "
+                       f"({', '.join(sorted(settings.ALLOWED_EXTENSIONS))})"
+            )
+
+        # Replacing an existing copy is harmless (same bytes) and atomic, and
+        # guarantees the file exists even if a concurrent delete just released it
+        filename = digest.hexdigest() + ext
+        with _path_lock(f"{folder}/{filename}"):
+            os.replace(tmp_path, UPLOAD_DIR / folder / filename)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+    return f"{folder}/{filename}"
+
+
+def reference_count(db: Session, path: str) -> int:
+    """Rows currently pointing at an upload file"""
+    counts = [
+        select(func.count()).where(path_column == path).scalar_subquery()
+        for path_column, _ in IMAGE_COLUMNS
+    ]
+    return sum(db.execute(select(*counts)).one())
+
+
+@dataclass
+class StoredUpload:
+    """Outcome of one file in a multi-file upload"""
+    filename: str
+    path: Optional[str] = None
+    variants: Optional[dict] = None
+    metadata: Optional[dict] = None
+    status_code: int = 200
+    detail: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.path is not None
+
+    def report(self) -> dict:
+        return {
+            "filename": self.filename,
+            "status": "saved" if self.ok else "failed",
+            "path": self.path,
+            "detail": self.detail,
+        }
+
+
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Threads that stream, hash and validate uploads in parallel"""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=settings.UPLOAD_WORKERS, thread_name_prefix="upload")
+    return _executor
+
+
+def shutdown_executor():
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False)
+        _executor = None
+
+
+def _store_one(file: UploadFile, folder: str) -> StoredUpload:
+    try:
+        return StoredUpload(file.filename, path=store_upload(file, folder))
+    except HTTPException as e:
+        return StoredUpload(file.filename, status_code=e.status_code, detail=e.detail)
+
+
+def _known_images(db: Session, paths: Set[str]) -> Dict[str, tuple]:
+    """(variants, metadata) already stored for any of these files, in one query per table"""
+    known = {}
+    if not paths:
+        return known
+    for path_column, variants_column in IMAGE_COLUMNS:
+        model = path_column.class_
+        prefix = "image_" if model is Destination else ""
+        metadata_columns = [getattr(model, prefix + field) for field in METADATA_FIELDS]
+        rows = db.execute(
+            select(path_column, variants_column, *metadata_columns)
+            .where(path_column.in_(paths), variants_column.isnot(None), metadata_columns[-1].isnot(None))
+        )
+        for path, variants, *values in rows:
+            known.setdefault(path, (variants, dict(zip(METADATA_FIELDS, values))))
+    return known
+
+
+def process_uploads(db: Session, files: List[UploadFile], folder: str) -> List[StoredUpload]:
+    """
+    Store a batch of uploads concurrently and prepare their variants and metadata.
+    Files are written and validated on the upload threads, then every new
+    image is rendered on the process pool at once; images already known
+    (same content uploaded before) reuse their stored variants. A rejected
+    file is reported in its StoredUpload instead of failing the batch.
+    """
+    results = list(get_executor().map(_store_one, files, [folder] * len(files)))
+
+    paths = {r.path for r in results if r.ok}
+    known = _known_images(db, paths)
+    futures = {path: submit_processing(path) for path in paths - known.keys()}
+
+    for result in results:
+        if not result.ok:
+            continue
+        if result.path in known:
+            result.variants, result.metadata = known[result.path]
+            continue
+        try:
+            processed = futures[result.path].result()
+            result.variants, result.metadata = processed["variants"], processed["metadata"]
+        except Exception as e:
+            # Still a valid upload; the image_service backfill can retry later
+            print(f"Could not process {result.path}: {e}")
+    return results
+
+
+def release_upload(db: Session, path: Optional[str], variants: Optional[dict] = None) -> bool:
+    """
+    Delete an upload file (and its variants) if nothing references it any more.
+    Call after the deleting transaction has committed. Returns True if removed.
+    Files written within UPLOAD_RELEASE_GRACE_SECONDS are kept, since an
+    upload of the same content may not have committed its row yet.
+    """
+    if not path or reference_count(db, path) > 0:
+        return False
+
+    target = UPLOAD_DIR / path
+    with _path_lock(path):
+        try:
+            if target.stat().st_mtime > time.time() - settings.UPLOAD_RELEASE_GRACE_SECONDS:
+                return False
+        except FileNotFoundError:
+            pass
+        target.unlink(missing_ok=True)
+    delete_variants(variants)
+    return True
+
+
+def release_uploads(files: Iterable[Tuple[Optional[str], Optional[dict]]]) -> int:
+    """
+    Background task form of release_upload for many (path, variants) pairs.
+    Uses a session of its own, since the request's session is closed by the
+    time background tasks run. Returns the number of files removed.
+    """
+    from app.database import SessionLocal
+
+    unique = {}
+    for path, variants in files:
+        if path:
+            unique.setdefault(path, variants)
+
+    removed = 0
+    db = SessionLocal()
+    try:
+        for path, variants in unique.items():
+            try:
+                removed += release_upload(db, path, variants)
+            except Exception as e:
+                # Left for the upload GC to pick up
+                print(f"Could not release {path}: {e}")
+    finally:
+        db.close()
+    return removed
+
+
+def file_digest(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(UPLOAD_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def dedupe(db: Session) -> int:
+    """
+    Move files uploaded before content addressing to their hashed names,
+    merging exact duplicates. Variants of renamed files are dropped so a
+    following image_service backfill recreates them under the new names.
+    Returns the number of files removed as duplicates.
+    """
+    removed = 0
+    paths = set()
+    for path_column, _ in IMAGE_COLUMNS:
+        paths.update(p for (p,) in db.execute(select(path_column).where(path_column.isnot(None)).distinct()))
+
+    for path in sorted(paths):
+        source = UPLOAD_DIR / path
+        if not source.exists():
+            continue
+        target_path = str(Path(path).parent / (file_digest(source) + source.suffix.lower()))
+        if target_path == path:
+            continue
+
+        target = UPLOAD_DIR / target_path
+        if target.exists():
+            source.unlink()
+            removed += 1
+        else:
+            os.replace(source, target)
+
+        for path_column, variants_column in IMAGE_COLUMNS:
+            model = path_column.class_
+            rows = db.query(model).filter(path_column == path).all()
+            for row in rows:
+                delete_variants(getattr(row, variants_column.key))
+                setattr(row, path_column.key, target_path)
+                setattr(row, variants_column.key, None)
+        db.commit()
+
+    return removed
+
+
+if __name__ == "__main__":
+    # python -m app.services.upload_store dedupe
+    if sys.argv[1:] != ["dedupe"]:
+        print("Usage: python -m app.services.upload_store dedupe")
+        sys.exit(1)
+
+    from app.database import SessionLocal
+    from app.services import image_service
+
+    db = SessionLocal()
+    try:
+        print(f"Removed {dedupe(db)} duplicate files")
+        print(f"Updated variants/metadata for {image_service.backfill(db)} images")
+    finally:
+        db.close()
+        image_service.shutdown_pool()
@@ -0,0 +1,27 @@
+# app/testing.py - Pytest Helpers (enable with: pytest_plugins = ["app.testing"])
+from contextlib import contextmanager
+
+import pytest
+
+from app.core.query_stats import capture_queries
+
+
+@pytest.fixture
+def max_queries():
+    """
+    Assert an upper bound on SQL queries executed inside a block:
+
+        def test_listing(client, max_queries):
+            with max_queries(3):
+                client.get("/api/destinations/")
+    """
+
+    @contextmanager
+    def _max_queries(limit: int):
+        with capture_queries() as stats:
+            yield stats
+        assert stats.count <= limit, (
+            f"Expected at most {limit} queries, got {stats.report()}"
+        )
+
+    return _max_queries
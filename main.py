@@ -1,35 +1,70 @@
 # main.py - COMPLETE FastAPI Application with Admin Panel
 from fastapi import FastAPI, Request
-from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-from fastapi.responses import HTMLResponse, RedirectResponse
+from fastapi.responses import HTMLResponse, RedirectResponse, PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.middleware.sessions import SessionMiddleware
-from pathlib import Path
+from starlette.concurrency import run_in_threadpool
+from contextlib import asynccontextmanager
+import anyio
+import asyncio
 
-from app.database import engine, Base
+from app.database import engine, dispose_engines
 from app.api.endpoints import destinations, categories, routes, reviews, feedback, auth
 from app.api.endpoints import admin as admin_api
+from app.api.endpoints import export as export_api
+from app.api.endpoints import imports as imports_api
+from app.api.endpoints import internal as internal_api
+from app.api.endpoints import images as images_api
 from app.config import settings
+from app.core.security import password_hash_pool
+from app.core.startup import startup_step
+from app.services import image_service, upload_gc, upload_store
+from app.core.query_stats import QueryStatsMiddleware
+from app.core.uploads import RequestSizeLimitMiddleware
+from app.core.static_files import AssetManifest, CachedStaticFiles
+from app.core.metrics import MetricsMiddleware, registry as metrics_registry
 
-# Import ALL models BEFORE creating tables
-from app.models import (
-    user,
-    category,
-    destination,
-    review,
-    feedback as feedback_model,
-    route
-)
 
-# Create database tables
-Base.metadata.create_all(bind=engine)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Startup/shutdown work, kept out of import time so workers and tests start fast"""
+    with startup_step("threadpool"):
+        # Sync endpoints (admin, public GETs) share this pool
+        anyio.to_thread.current_default_thread_limiter().total_tokens = settings.THREADPOOL_SIZE
+
+    with startup_step("upload directories"):
+        admin_api.ensure_upload_dirs()
+
+    with startup_step("static assets"):
+        # Fingerprint /static files; precompressed copies go to STATIC_CACHE_DIR
+        await run_in_threadpool(static_assets.build, settings.STATIC_PRECOMPRESS_ON_STARTUP)
+
+    with startup_step("schema version"):
+        # Only reads schema_version instead of reflecting every table
+        from app.migrations import verify_schema_version
+        await run_in_threadpool(verify_schema_version, engine, settings.AUTO_MIGRATE)
+
+    gc_task = None
+    if settings.UPLOAD_GC_INTERVAL_HOURS > 0:
+        gc_task = asyncio.create_task(upload_gc.run_periodically())
+
+    yield
+
+    if gc_task is not None:
+        gc_task.cancel()
+    password_hash_pool.shutdown()
+    image_service.shutdown_pool()
+    upload_store.shutdown_executor()
+    await dispose_engines()
+
 
 # Initialize FastAPI app
 app = FastAPI(
     title="Tourism Guide System",
     description="Explore amazing places in Ormoc City",
-    version="2.0.0"
+    version="2.0.0",
+    lifespan=lifespan
 )
 
 # Session Middleware (MUST be before other middleware)
@@ -51,12 +86,27 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Mount static files
-app.mount("/static", StaticFiles(directory="static"), name="static")
-app.mount("/uploads", StaticFiles(directory="uploads"), name="uploads")
+# Reject oversized request bodies before they are parsed/spooled
+app.add_middleware(RequestSizeLimitMiddleware, max_size=settings.MAX_REQUEST_SIZE)
+
+# Per-request SQL query counting (headers + N+1 warnings in DEBUG mode)
+app.add_middleware(
+    QueryStatsMiddleware,
+    debug=settings.DEBUG,
+    repeat_threshold=settings.QUERY_REPEAT_THRESHOLD
+)
+
+# Per-route request metrics (outermost so it sees the full latency)
+app.add_middleware(MetricsMiddleware)
+
+# Mount static files (hashed URLs and uploads are cached as immutable)
+static_assets = AssetManifest("static", cache_dir=settings.STATIC_CACHE_DIR)
+app.mount("/static", CachedStaticFiles(directory="static", manifest=static_assets), name="static")
+app.mount("/uploads", CachedStaticFiles(directory=settings.UPLOAD_DIR, check_dir=False, immutable=True), name="uploads")
 
 # Templates
 templates = Jinja2Templates(directory="app/templates")
+templates.env.globals["static_url"] = static_assets.url
 
 # Include API routers
 app.include_router(auth.router, prefix="/api/auth", tags=["authentication"])
@@ -66,6 +116,10 @@ app.include_router(routes.router, prefix="/api/routes", tags=["routes"])
 app.include_router(reviews.router, prefix="/api/reviews", tags=["reviews"])
 app.include_router(feedback.router, prefix="/api/feedback", tags=["feedback"])
 app.include_router(admin_api.router, prefix="/api/admin", tags=["admin"])
+app.include_router(export_api.router, prefix="/api/admin/export", tags=["admin"])
+app.include_router(imports_api.router, prefix="/api/admin/import", tags=["admin"])
+app.include_router(internal_api.router, prefix="/internal", tags=["internal"])
+app.include_router(images_api.router, prefix="/img", tags=["images"])
 
 
 # ============ USER PANEL ROUTES ============
@@ -196,10 +250,20 @@ async def health_check():
         "version": "2.0.0",
         "database": "connected",
         "authentication": "enabled",
-        "admin_panel": "enabled"
+        "admin_panel": "enabled",
+        "password_hashing": password_hash_pool.stats()
     }
 
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus metrics for this worker (rendered on the loop, which owns the request metrics)"""
+    return PlainTextResponse(
+        metrics_registry.render(),
+        media_type="text/plain; version=0.0.4"
+    )
+
+
 if __name__ == "__main__":
     import uvicorn
     print("🚀 Starting Tourism Guide System...")
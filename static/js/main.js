@@ -27,4 +27,133 @@ document.querySelectorAll('a[href^="#"]').forEach(anchor => {
             });
         }
     });
-});
\ No newline at end of file
+});
+// ============ RESPONSIVE IMAGES ============
+// `variants` is the image_variants/variants object from the API:
+// { "320": { "width": 320, "height": 213, "webp": "...", "jpeg": "..." }, ... }
+
+// URL of the smallest variant at least `width` px wide (falls back to the original upload)
+function variantUrl(imagePath, variants, width, format = 'webp') {
+    const entries = Object.values(variants || {}).sort((a, b) => a.width - b.width);
+    const match = entries.find(v => v.width >= width) || entries[entries.length - 1];
+    return match && match[format] ? `/uploads/${match[format]}` : `/uploads/${imagePath}`;
+}
+
+// Size and placeholder fields from the API (Destination uses the "image_" prefix)
+function imageMeta(record, prefix = '') {
+    return {
+        width: record[prefix + 'width'],
+        height: record[prefix + 'height'],
+        color: record[prefix + 'color'],
+        blurhash: record[prefix + 'blurhash']
+    };
+}
+
+// Inline style painting the dominant colour and blurhash until the image loads
+function placeholderStyle(meta) {
+    if (!meta) return '';
+    const parts = [];
+    if (meta.color) parts.push(`background-color:${meta.color}`);
+    const blur = meta.blurhash ? blurhashToDataURL(meta.blurhash) : null;
+    if (blur) parts.push(`background-image:url(${blur})`, 'background-size:cover', 'background-position:center');
+    return parts.join(';');
+}
+
+// <picture> with WebP and JPEG srcsets so the browser downloads only the size it needs.
+// width/height from `meta` let the browser reserve space before the file arrives.
+function responsiveImage(imagePath, variants, attrs = '', sizes = '100vw', meta = null) {
+    const src = `/uploads/${imagePath}`;
+    const dims = meta && meta.width ? `width="${meta.width}" height="${meta.height}"` : '';
+    const style = placeholderStyle(meta);
+    const imgAttrs = `${dims} ${style ? `style="${style}"` : ''} ${attrs}`;
+    const entries = Object.values(variants || {}).sort((a, b) => a.width - b.width);
+    if (entries.length === 0) {
+        return `<img src="${src}" ${imgAttrs}>`;
+    }
+    const srcset = format => entries.map(v => `/uploads/${v[format]} ${v.width}w`).join(', ');
+    return `<picture>
+        <source type="image/webp" srcset="${srcset('webp')}" sizes="${sizes}">
+        <img src="${src}" srcset="${srcset('jpeg')}" sizes="${sizes}" ${imgAttrs}>
+    </picture>`;
+}
+
+// ============ BLURHASH ============
+// Decoder for the placeholders computed on upload (https://blurha.sh)
+const BLURHASH_CHARS = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz#$%*+,-.:;=?@[]^_{|}~';
+const blurhashCache = new Map();
+
+function decode83(str) {
+    let value = 0;
+    for (const c of str) value = value * 83 + BLURHASH_CHARS.indexOf(c);
+    return value;
+}
+
+function sRGBToLinear(value) {
+    const v = value / 255;
+    return v <= 0.04045 ? v / 12.92 : Math.pow((v + 0.055) / 1.055, 2.4);
+}
+
+function linearToSRGB(value) {
+    const v = Math.max(0, Math.min(1, value));
+    return v <= 0.0031308 ? Math.round(v * 12.92 * 255) : Math.round((1.055 * Math.pow(v, 1 / 2.4) - 0.055) * 255);
+}
+
+function signPow(value, exp) {
+    return Math.sign(value) * Math.pow(Math.abs(value), exp);
+}
+
+// Small PNG data URL for a blurhash (null if invalid); browsers scale it up smoothly
+function blurhashToDataURL(hash, width = 32, height = 32) {
+    if (blurhashCache.has(hash)) return blurhashCache.get(hash);
+    let url = null;
+    try {
+        const sizeFlag = decode83(hash[0]);
+        const numX = (sizeFlag % 9) + 1;
+        const numY = Math.floor(sizeFlag / 9) + 1;
+        if (hash.length !== 4 + 2 * numX * numY) throw new Error('bad blurhash length');
+
+        const maxValue = (decode83(hash[1]) + 1) / 166;
+        const colors = [];
+        const dc = decode83(hash.substring(2, 6));
+        colors.push([sRGBToLinear(dc >> 16), sRGBToLinear((dc >> 8) & 255), sRGBToLinear(dc & 255)]);
+        for (let i = 1; i < numX * numY; i++) {
+            const ac = decode83(hash.substring(4 + i * 2, 6 + i * 2));
+            colors.push([
+                signPow((Math.floor(ac / 361) - 9) / 9, 2) * maxValue,
+                signPow((Math.floor(ac / 19) % 19 - 9) / 9, 2) * maxValue,
+                signPow((ac % 19 - 9) / 9, 2) * maxValue
+            ]);
+        }
+
+        const canvas = document.createElement('canvas');
+        canvas.width = width;
+        canvas.height = height;
+        const ctx = canvas.getContext('2d');
+        const image = ctx.createImageData(width, height);
+        for (let y = 0; y < height; y++) {
+            for (let x = 0; x < width; x++) {
+                let r = 0, g = 0, b = 0;
+                for (let j = 0; j < numY; j++) {
+                    for (let i = 0; i < numX; i++) {
+                        const basis = Math.cos(Math.PI * x * i / width) * Math.cos(Math.PI * y * j / height);
+                        const color = colors[i + j * numX];
+                        r += color[0] * basis;
+                        g += color[1] * basis;
+                        b += color[2] * basis;
+                    }
+                }
+                const offset = 4 * (x + y * width);
+                image.data[offset] = linearToSRGB(r);
+                image.data[offset + 1] = linearToSRGB(g);
+                image.data[offset + 2] = linearToSRGB(b);
+                image.data[offset + 3] = 255;
+            }
+        }
+        ctx.putImageData(image, 0, 0);
+        url = canvas.toDataURL();
+    } catch (e) {
+        console.warn('Could not decode blurhash', e);
+    }
+    blurhashCache.set(hash, url);
+    return url;
+}
@@ -0,0 +1,72 @@
+# tests/conftest.py - Shared Test Fixtures
+import os
+import shutil
+import tempfile
+
+# Settings are read at import time, so point everything at a scratch
+# directory before the application is imported
+TEST_DIR = tempfile.mkdtemp(prefix="tourism-tests-")
+os.environ["DATABASE_URL"] = f"sqlite:///{TEST_DIR}/test.db"
+os.environ["AUTO_MIGRATE"] = "true"
+os.environ["UPLOAD_DIR"] = f"{TEST_DIR}/uploads"
+os.environ["UPLOAD_QUARANTINE_DIR"] = f"{TEST_DIR}/uploads_quarantine"
+os.environ["IMAGE_CACHE_DIR"] = f"{TEST_DIR}/cache/images"
+os.environ["STATIC_CACHE_DIR"] = f"{TEST_DIR}/cache/static"
+os.environ["UPLOAD_GC_INTERVAL_HOURS"] = "0"
+os.environ["LOGIN_RATE_LIMIT_ENABLED"] = "false"
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.database import SessionLocal
+from app.models.user import User, UserRole
+from app.services.auth_service import AuthService
+
+pytest_plugins = ["app.testing"]
+
+ADMIN_USERNAME = "admin"
+ADMIN_PASSWORD = "admin-secret"
+
+
+def pytest_sessionfinish(session, exitstatus):
+    shutil.rmtree(TEST_DIR, ignore_errors=True)
+
+
+@pytest.fixture(scope="session")
+def client():
+    """TestClient with the lifespan run (migrations, upload directories)"""
+    import main
+
+    with TestClient(main.app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def db():
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture(scope="session")
+def admin_headers(client):
+    """Bearer header for an admin account"""
+    session = SessionLocal()
+    if not session.query(User).filter(User.username == ADMIN_USERNAME).first():
+        session.add(User(
+            username=ADMIN_USERNAME,
+            email="admin@example.com",
+            password=AuthService.get_password_hash(ADMIN_PASSWORD),
+            role=UserRole.ADMIN
+        ))
+        session.commit()
+    session.close()
+
+    response = client.post("/api/auth/login", json={
+        "username": ADMIN_USERNAME,
+        "password": ADMIN_PASSWORD
+    })
+    assert response.status_code == 200, response.text
+    return {"Authorization": f"Bearer {response.json()['token']['access_token']}"}
@@ -0,0 +1,60 @@
+# tests/test_admin_latency.py - Admin Work Must Not Stall Other Requests
+import io
+import os
+import threading
+import time
+
+from PIL import Image
+
+from app.api.endpoints import admin as admin_api
+from app.models.category import Category
+
+SLOW_UPLOAD_SECONDS = 1.5
+
+
+def large_png() -> bytes:
+    """About 3MB of incompressible pixels"""
+    image = Image.frombytes("RGB", (1000, 1000), os.urandom(1000 * 1000 * 3))
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def test_health_stays_fast_during_large_destination_create(client, admin_headers, db, monkeypatch):
+    category = Category(name="Latency")
+    db.add(category)
+    db.commit()
+
+    # Stretch the blocking upload work so the overlap is deterministic
+    started = threading.Event()
+    process_uploads = admin_api.process_destination_uploads
+
+    def slow_process_uploads(*args, **kwargs):
+        started.set()
+        time.sleep(SLOW_UPLOAD_SECONDS)
+        return process_uploads(*args, **kwargs)
+
+    monkeypatch.setattr(admin_api, "process_destination_uploads", slow_process_uploads)
+
+    result = {}
+
+    def create():
+        result["response"] = client.post(
+            "/api/admin/destinations",
+            headers=admin_headers,
+            data={"name": "Latency check", "category_id": str(category.id)},
+            files={"image": ("large.png", large_png(), "image/png")}
+        )
+
+    worker = threading.Thread(target=create)
+    worker.start()
+    assert started.wait(30), "upload processing never started"
+
+    began = time.perf_counter()
+    health = client.get("/health")
+    elapsed = time.perf_counter() - began
+    worker.join()
+
+    assert health.status_code == 200
+    assert elapsed < SLOW_UPLOAD_SECONDS / 3, f"/health took {elapsed:.2f}s while an upload was processed"
+    assert result["response"].status_code == 200, result["response"].text
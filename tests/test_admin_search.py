@@ -0,0 +1,39 @@
+# tests/test_admin_search.py - Admin Listing Search
+import pytest
+
+from app.models.category import Category
+from app.models.destination import Destination
+from app.models.route import Route
+
+
+@pytest.fixture(scope="module")
+def searchable(client):
+    """Names that only differ where a search could hold a LIKE wildcard"""
+    from app.database import SessionLocal
+
+    db = SessionLocal()
+    category = Category(name="Search")
+    db.add(category)
+    db.flush()
+    sale = Destination(name="Wildcard 100% Resort", category_id=category.id)
+    plain = Destination(name="Wildcard 1000 Resort", category_id=category.id)
+    db.add_all([sale, plain])
+    db.flush()
+    db.add_all([
+        Route(route_name="Wildcard_route", origin_id=sale.id, destination_id=plain.id, transport_mode="jeepney"),
+        Route(route_name="Wildcard-route", origin_id=plain.id, destination_id=sale.id, transport_mode="jeepney"),
+    ])
+    db.commit()
+    db.close()
+
+
+def test_destination_search_treats_wildcards_literally(client, admin_headers, searchable):
+    response = client.get("/api/admin/destinations", headers=admin_headers, params={"search": "100%"})
+    assert response.status_code == 200, response.text
+    assert [d["name"] for d in response.json()["destinations"]] == ["Wildcard 100% Resort"]
+
+
+def test_route_search_treats_wildcards_literally(client, admin_headers, searchable):
+    response = client.get("/api/admin/routes", headers=admin_headers, params={"search": "wildcard_"})
+    assert response.status_code == 200, response.text
+    assert [r["route_name"] for r in response.json()["routes"]] == ["Wildcard_route"]
@@ -0,0 +1,118 @@
+# tests/test_bulk_actions.py - Admin Bulk Actions
+import pytest
+
+from app.api.endpoints import admin as admin_api
+from app.models.category import Category
+from app.models.destination import Destination, DestinationImage
+from app.models.feedback import WebsiteFeedback
+from app.models.review import Review
+
+
+@pytest.fixture
+def destination(db):
+    category = Category(name="Bulk actions")
+    db.add(category)
+    db.flush()
+    dest = Destination(name="Bulk target", category_id=category.id, is_active=True)
+    db.add(dest)
+    db.commit()
+    return dest
+
+
+@pytest.fixture
+def released(monkeypatch):
+    """Files handed to the release_uploads background task"""
+    calls = []
+    monkeypatch.setattr(admin_api, "release_uploads", lambda files: calls.append(sorted(files)))
+    return calls
+
+
+def add_reviews(db, destination, approved):
+    reviews = [Review(destination_id=destination.id, rating=3, is_approved=a) for a in approved]
+    db.add_all(reviews)
+    db.commit()
+    return [r.id for r in reviews]
+
+
+def test_review_updates_count_only_rows_that_change(client, admin_headers, db, destination):
+    add_reviews(db, destination, [True, False, False])
+
+    response = client.post("/api/admin/reviews/bulk", headers=admin_headers, json={
+        "action": "approve", "filter": {"destination_id": destination.id}
+    })
+    assert response.status_code == 200, response.text
+    assert response.json()["affected"] == 2
+
+    again = client.post("/api/admin/reviews/bulk", headers=admin_headers, json={
+        "action": "approve", "filter": {"destination_id": destination.id}
+    })
+    assert again.json()["affected"] == 0
+
+
+def test_filter_delete_requires_and_checks_expected_count(client, admin_headers, db, destination):
+    add_reviews(db, destination, [True, True, False])
+    selection = {"action": "delete", "filter": {"destination_id": destination.id}}
+
+    missing = client.post("/api/admin/reviews/bulk", headers=admin_headers, json=selection)
+    assert missing.status_code == 422
+
+    mismatch = client.post("/api/admin/reviews/bulk", headers=admin_headers, json={**selection, "expected_count": 2})
+    assert mismatch.status_code == 409
+    db.expire_all()
+    assert db.query(Review).filter(Review.destination_id == destination.id).count() == 3
+
+    deleted = client.post("/api/admin/reviews/bulk", headers=admin_headers, json={**selection, "expected_count": 3})
+    assert deleted.status_code == 200, deleted.text
+    assert deleted.json()["affected"] == 3
+    assert db.query(Review).filter(Review.destination_id == destination.id).count() == 0
+
+
+def test_feedback_bulk_by_ids_and_by_filter(client, admin_headers, db):
+    entries = [WebsiteFeedback(rating=4, feedback="Bulk", category="bulk-test", is_read=r) for r in (False, False, True)]
+    db.add_all(entries)
+    db.commit()
+    ids = [e.id for e in entries]
+
+    marked = client.post("/api/admin/feedback/bulk", headers=admin_headers, json={"action": "mark_read", "ids": ids})
+    assert marked.json()["affected"] == 2
+
+    deleted = client.post("/api/admin/feedback/bulk", headers=admin_headers, json={
+        "action": "delete", "filter": {"category": "bulk-test"}, "expected_count": 3
+    })
+    assert deleted.status_code == 200, deleted.text
+    assert deleted.json()["affected"] == 3
+    assert db.query(WebsiteFeedback).filter(WebsiteFeedback.id.in_(ids)).count() == 0
+
+
+def test_destination_delete_removes_children_and_releases_their_files(client, admin_headers, db, destination, released):
+    destination.image_path = "destinations/bulk-cover.jpg"
+    destination.image_variants = {"320": {"width": 320, "height": 240, "webp": "destinations/bulk-cover_w320.webp"}}
+    db.add(DestinationImage(destination_id=destination.id, image_path="destinations/bulk-photo.jpg"))
+    db.commit()
+    add_reviews(db, destination, [True])
+
+    response = client.post("/api/admin/destinations/bulk", headers=admin_headers, json={
+        "action": "delete", "ids": [destination.id]
+    })
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert body["affected"] == 1
+    assert body["related"] == {"images": 1, "reviews": 1, "routes": 0}
+
+    assert released == [[
+        ("destinations/bulk-cover.jpg", {"320": {"width": 320, "height": 240, "webp": "destinations/bulk-cover_w320.webp"}}),
+        ("destinations/bulk-photo.jpg", None),
+    ]]
+
+
+def test_destination_status_change_skips_rows_already_in_that_state(client, admin_headers, db, destination, released):
+    response = client.post("/api/admin/destinations/bulk", headers=admin_headers, json={
+        "action": "deactivate", "filter": {"category_id": destination.category_id}
+    })
+    assert response.json()["affected"] == 1
+
+    again = client.post("/api/admin/destinations/bulk", headers=admin_headers, json={
+        "action": "deactivate", "ids": [destination.id]
+    })
+    assert again.json()["affected"] == 0
+    assert released == []
@@ -0,0 +1,108 @@
+# tests/test_catalog_import.py - Bulk Catalog Import
+import io
+
+import pytest
+
+from app.models.category import Category
+from app.models.destination import Destination
+from app.models.route import Route
+from app.services.catalog_import import import_destinations, import_routes, read_rows
+
+
+def rows(data: bytes, fmt: str) -> list:
+    return list(read_rows(io.BytesIO(data), fmt))
+
+
+@pytest.fixture(scope="module")
+def category(client):
+    from app.database import SessionLocal
+
+    db = SessionLocal()
+    category = Category(name="Import Beaches")
+    db.add(category)
+    db.commit()
+    db.refresh(category)
+    db.close()
+    return category
+
+
+# ============ READING ============
+def test_csv_rows_drop_empty_cells_and_the_bom():
+    data = "\ufeffname,category,address\nLake Danao, Import Beaches ,\n".encode("utf-8")
+    assert rows(data, "csv") == [{"name": "Lake Danao", "category": "Import Beaches"}]
+
+
+def test_ndjson_rows_report_bad_lines_in_place():
+    data = b'{"name": "A"}\n\nnot json\n[1, 2]\n{"name": "B"}\n'
+    parsed = rows(data, "ndjson")
+    assert [r.get("name") for r in parsed] == ["A", None, None, "B"]
+    assert parsed[1]["_invalid"].startswith("invalid JSON")
+    assert parsed[2]["_invalid"].startswith("not an object")
+
+
+def test_json_accepts_an_array_or_newline_delimited_objects():
+    assert rows(b' [{"name": "A"}, 3]', "json") == [{"name": "A"}, {"_invalid": "not an object: 3"}]
+    assert rows(b'{"name": "A"}\n{"name": "B"}\n', "json") == [{"name": "A"}, {"name": "B"}]
+
+
+# ============ WRITING ============
+def test_destinations_are_upserted_by_name(db, category):
+    records = [
+        {"name": "Import Falls", "category": "import beaches", "address": "Brgy. 1"},
+        {"name": "Import Cave", "category": "Import Beaches"},
+    ]
+    first = import_destinations(db, iter(records))
+    assert (first.inserted, first.updated, first.failed) == (2, 0, 0)
+
+    second = import_destinations(db, iter([{"name": "Import Falls", "description": "Tall"}]))
+    assert (second.inserted, second.updated) == (0, 1)
+
+    falls = db.query(Destination).filter(Destination.name == "Import Falls").one()
+    # Only the columns given are updated
+    assert (falls.description, falls.address, falls.category_id) == ("Tall", "Brgy. 1", category.id)
+
+
+def test_error_report_lists_bad_rows_and_keeps_the_rest(db, category):
+    records = [
+        {"name": "Import Spring", "category": "Import Beaches"},
+        {"name": "Import Reef", "category": "No such category"},
+        {"category": "Import Beaches"},
+        {"_invalid": "invalid JSON: Expecting value"},
+    ]
+    report = import_destinations(db, iter(records)).as_dict()
+
+    assert (report["rows"], report["inserted"], report["failed"]) == (4, 1, 3)
+    assert [e["row"] for e in report["errors"]] == [2, 3, 4]
+    assert report["errors"][0]["errors"] == ["category: unknown category 'No such category'"]
+    assert report["errors"][1]["errors"][0].startswith("name:")
+
+
+def test_dry_run_counts_a_name_repeated_across_chunks_once(db, category):
+    records = [{"name": "Import Dry", "category": "Import Beaches"}] * 3
+
+    dry = import_destinations(db, iter(records), dry_run=True, batch_size=1)
+    assert (dry.inserted, dry.updated) == (1, 2)
+    assert db.query(Destination).filter(Destination.name == "Import Dry").count() == 0
+
+    real = import_destinations(db, iter(records), batch_size=1)
+    assert (real.inserted, real.updated) == (dry.inserted, dry.updated)
+
+
+def test_ambiguous_destination_names_are_reported_not_guessed(db, category):
+    twins = [Destination(name="Import Twin", category_id=category.id) for _ in range(2)]
+    db.add_all(twins + [Destination(name="Import Hub", category_id=category.id)])
+    db.commit()
+
+    report = import_destinations(db, iter([{"name": "Import Twin", "description": "Which one?"}]))
+    assert (report.updated, report.failed) == (0, 1)
+    assert report.errors[0]["errors"] == [
+        f"name: 2 destinations are named 'Import Twin' (ids {twins[0].id}, {twins[1].id})"
+    ]
+
+    routes = import_routes(db, iter([
+        {"origin": "Import Hub", "destination": "Import Twin", "transport_mode": "jeepney"},
+        {"origin": "Import Hub", "destination_id": twins[1].id, "transport_mode": "jeepney"},
+    ]))
+    assert (routes.inserted, routes.failed) == (1, 1)
+    assert routes.errors[0]["errors"][0].startswith("destination: 2 destinations are named 'Import Twin'")
+    assert db.query(Route).filter(Route.destination_id == twins[1].id).count() == 1
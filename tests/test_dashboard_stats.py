@@ -0,0 +1,36 @@
+# tests/test_dashboard_stats.py - Cached Admin Dashboard Counts
+from app.models.category import Category
+from app.models.destination import Destination
+from app.models.review import Review
+
+
+def stats(client, admin_headers) -> dict:
+    response = client.get("/api/admin/dashboard/stats", headers=admin_headers)
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_single_item_changes_show_up_before_the_ttl_expires(client, admin_headers, db):
+    category = Category(name="Dashboard")
+    db.add(category)
+    db.flush()
+    destination = Destination(name="Dashboard destination", category_id=category.id, is_active=True)
+    db.add(destination)
+    db.flush()
+    review = Review(destination_id=destination.id, rating=3, is_approved=False)
+    db.add(review)
+    db.commit()
+
+    before = stats(client, admin_headers)
+
+    client.patch(f"/api/admin/destinations/{destination.id}/toggle", headers=admin_headers)
+    assert stats(client, admin_headers)["active_destinations"] == before["active_destinations"] - 1
+
+    client.patch(f"/api/admin/reviews/{review.id}/toggle", headers=admin_headers)
+    assert stats(client, admin_headers)["pending_reviews"] == before["pending_reviews"] - 1
+
+    client.delete(f"/api/admin/reviews/{review.id}", headers=admin_headers)
+    assert stats(client, admin_headers)["total_reviews"] == before["total_reviews"] - 1
+
+    client.delete(f"/api/admin/destinations/{destination.id}", headers=admin_headers)
+    assert stats(client, admin_headers)["total_destinations"] == before["total_destinations"] - 1
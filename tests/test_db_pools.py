@@ -0,0 +1,80 @@
+# tests/test_db_pools.py - Sync/Async Connection Pools
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy import text
+
+from app.config import settings
+from app.core.db_pool import describe_pools, primary_pool_budget
+from app.database import get_async_engine
+from app.services.auth_service import AuthService
+
+HASH_SECONDS = 0.2
+
+
+def test_both_engines_share_one_connection_budget(monkeypatch):
+    monkeypatch.setattr(settings, "DB_POOL_SIZE", 5)
+    monkeypatch.setattr(settings, "DB_MAX_OVERFLOW", 10)
+    monkeypatch.setattr(settings, "DB_ASYNC_POOL_SHARE", 0.2)
+    monkeypatch.setattr(settings, "PASSWORD_HASH_WORKERS", 2)
+
+    sync_size, sync_overflow = primary_pool_budget("primary")
+    async_size, async_overflow = primary_pool_budget("async")
+
+    assert sync_size + async_size == 5
+    assert sync_overflow + async_overflow == 10
+    # One connection per hashing worker plus one for principal loads
+    assert async_size == 3
+
+
+def test_concurrent_logins_do_not_hold_connections_while_hashing(client, admin_headers, monkeypatch):
+    get_async_engine()
+    async_pool = describe_pools()["async"]
+    logins = (async_pool["size"] + async_pool["max_overflow"]) * 3
+    checked_out_while_hashing = []
+
+    def slow_verify(plain_password, hashed_password):
+        checked_out_while_hashing.append(describe_pools()["async"]["checked_out"])
+        time.sleep(HASH_SECONDS)
+        return True
+
+    monkeypatch.setattr(AuthService, "verify_password", staticmethod(slow_verify))
+
+    def login(_):
+        return client.post("/api/auth/login", json={"username": "admin", "password": "any"}).status_code
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=logins) as executor:
+        statuses = list(executor.map(login, range(logins)))
+    elapsed = time.perf_counter() - started
+
+    assert statuses == [200] * logins
+    # Bounded by the hashing workers, not by waits for a pooled connection
+    expected = logins / settings.PASSWORD_HASH_WORKERS * HASH_SECONDS
+    assert elapsed < expected + 2, f"{logins} logins took {elapsed:.1f}s"
+    assert describe_pools()["async"]["timeouts"] == 0
+    # Apart from the first wave (everyone looking up the user at once),
+    # hashing runs with no async connection checked out
+    assert checked_out_while_hashing.count(0) > logins // 2, checked_out_while_hashing
+
+
+def test_pool_metrics_endpoint_reports_every_engine(client, admin_headers, db):
+    before = client.get("/internal/metrics/pool", headers=admin_headers)
+    assert before.status_code == 200
+    primary = before.json()["primary"]
+    assert primary["pool_class"].endswith("QueuePool")
+    assert primary["size"] == primary_pool_budget("primary")[0]
+    for key in ("checked_out", "overflow", "max_overflow", "checkouts", "timeouts", "avg_wait_ms"):
+        assert key in primary
+
+    db.execute(text("SELECT 1"))
+    db.commit()
+    after = client.get("/internal/metrics/pool", headers=admin_headers).json()["primary"]
+    assert after["checkouts"] > primary["checkouts"]
+
+
+def test_pool_metrics_endpoint_requires_admin():
+    import main
+    from fastapi.testclient import TestClient
+
+    assert TestClient(main.app).get("/internal/metrics/pool").status_code == 401
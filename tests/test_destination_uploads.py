@@ -0,0 +1,49 @@
+# tests/test_destination_uploads.py - Multi-Photo Destination Uploads
+import io
+
+from PIL import Image
+
+from app.core.query_stats import capture_queries
+from app.models.category import Category
+from app.models.destination import DestinationImage
+
+
+def png(color) -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", (64, 48), color).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def test_multi_photo_create_reports_each_file_and_inserts_once(client, admin_headers, db):
+    category = Category(name="Gallery uploads")
+    db.add(category)
+    db.commit()
+
+    photos = [
+        ("additional_photos", ("first.png", png((200, 0, 0)), "image/png")),
+        ("additional_photos", ("notes.png", b"not an image at all", "image/png")),
+        ("additional_photos", ("second.png", png((0, 200, 0)), "image/png")),
+        ("additional_photos", ("third.png", png((0, 0, 200)), "image/png")),
+    ]
+    with capture_queries() as stats:
+        response = client.post(
+            "/api/admin/destinations",
+            headers=admin_headers,
+            data={"name": "Gallery check", "category_id": str(category.id)},
+            files=photos
+        )
+    assert response.status_code == 200, response.text
+
+    reports = response.json()["photos"]
+    assert [r["filename"] for r in reports] == ["first.png", "notes.png", "second.png", "third.png"]
+    assert [r["status"] for r in reports] == ["saved", "failed", "saved", "saved"]
+    assert reports[1]["path"] is None and reports[1]["detail"]
+
+    gallery_inserts = [
+        (statement, n) for statement, n in stats.statements.items()
+        if statement.lstrip().upper().startswith("INSERT INTO DESTINATION_IMAGES")
+    ]
+    assert len(gallery_inserts) == 1 and gallery_inserts[0][1] == 1
+
+    rows = db.query(DestinationImage).filter(DestinationImage.destination_id == response.json()["id"]).all()
+    assert sorted(row.image_path for row in rows) == sorted(r["path"] for r in reports if r["status"] == "saved")
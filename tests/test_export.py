@@ -0,0 +1,82 @@
+# tests/test_export.py - Streaming Admin Export
+import csv
+import gzip
+import io
+import json
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.models.feedback import WebsiteFeedback
+
+
+@pytest.fixture(scope="module")
+def dated_feedback(client):
+    """Three feedback rows in 2020/2021, older than anything other tests create"""
+    from app.database import SessionLocal
+
+    db = SessionLocal()
+    rows = [
+        WebsiteFeedback(rating=5, feedback="export, \"quoted\"", created_at=datetime(2020, 1, 15, 9, 30)),
+        WebsiteFeedback(rating=4, feedback="export june", created_at=datetime(2020, 6, 30, 23, 59)),
+        WebsiteFeedback(rating=3, feedback="export 2021", created_at=datetime(2021, 2, 1)),
+    ]
+    db.add_all(rows)
+    db.commit()
+    ids = [r.id for r in rows]
+    db.close()
+    return ids
+
+
+def test_csv_export_applies_inclusive_date_range(client, admin_headers, dated_feedback):
+    response = client.get(
+        "/api/admin/export/feedback?start_date=2020-01-01&end_date=2020-06-30",
+        headers=admin_headers
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert 'filename="feedback_' in response.headers["content-disposition"]
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [int(r["id"]) for r in rows] == dated_feedback[:2]
+    assert rows[0]["feedback"] == 'export, "quoted"'
+    assert rows[0]["created_at"] == "2020-01-15T09:30:00"
+
+
+def test_ndjson_export_writes_one_object_per_line(client, admin_headers, dated_feedback):
+    response = client.get(
+        "/api/admin/export/feedback?format=ndjson&start_date=2021-01-01&end_date=2021-12-31",
+        headers=admin_headers
+    )
+
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["id"] for line in lines] == dated_feedback[2:]
+    assert lines[0]["rating"] == 3 and lines[0]["is_read"] is False
+
+
+def test_gzip_export_is_a_complete_gzip_stream(client, admin_headers, dated_feedback):
+    response = client.get(
+        "/api/admin/export/feedback?gzip=true&end_date=2021-12-31",
+        headers=admin_headers
+    )
+
+    assert response.headers["content-type"] == "application/gzip"
+    assert response.headers["content-disposition"].endswith('.csv.gz"')
+    rows = list(csv.DictReader(io.StringIO(gzip.decompress(response.content).decode("utf-8"))))
+    assert [int(r["id"]) for r in rows] == dated_feedback
+
+
+def test_export_rejects_unknown_datasets_and_inverted_ranges(client, admin_headers):
+    assert client.get("/api/admin/export/users", headers=admin_headers).status_code == 404
+    inverted = client.get("/api/admin/export/reviews?start_date=2021-01-02&end_date=2021-01-01", headers=admin_headers)
+    assert inverted.status_code == 400
+
+
+def test_export_requires_an_admin(client):
+    import main
+
+    # A fresh client: the shared one carries the admin's session cookie
+    anonymous = TestClient(main.app)
+    assert anonymous.get("/api/admin/export/reviews").status_code in (401, 403)
@@ -0,0 +1,85 @@
+# tests/test_image_cache.py - On-Demand Resized Image Cache
+import io
+
+import anyio
+from fastapi import UploadFile
+from PIL import Image
+
+from app.api.endpoints.images import OpenFileResponse
+from app.services.image_cache import resize_cache
+from app.services.upload_store import store_upload
+
+
+def stored_image(color) -> str:
+    buffer = io.BytesIO()
+    Image.new("RGB", (400, 300), color).save(buffer, format="PNG")
+    buffer.seek(0)
+    return store_upload(UploadFile(buffer, filename="photo.png"), "destinations")
+
+
+def assert_jpeg(response, width: int):
+    assert response.status_code == 200, response.text
+    assert int(response.headers["Content-Length"]) == len(response.content)
+    assert Image.open(io.BytesIO(response.content)).size[0] == width
+
+
+def test_rendition_evicted_after_open_is_still_served(client, monkeypatch):
+    path = stored_image((200, 10, 10))
+    assert_jpeg(client.get(f"/img/160/{path}?format=jpeg"), 160)
+
+    # Eviction unlinks the file between the cache hit and the response body
+    open_entry = resize_cache._open
+
+    def open_then_evict(rel, hit):
+        file = open_entry(rel, hit)
+        if file is not None:
+            (resize_cache.directory / rel).unlink()
+        return file
+
+    monkeypatch.setattr(resize_cache, "_open", open_then_evict)
+    assert_jpeg(client.get(f"/img/160/{path}?format=jpeg"), 160)
+
+
+def test_rendition_removed_by_another_worker_is_rendered_again(client):
+    path = stored_image((10, 200, 10))
+    assert_jpeg(client.get(f"/img/320/{path}?format=jpeg"), 320)
+
+    for cached in list(resize_cache.directory.rglob("*.jpg")):
+        cached.unlink()
+    misses = resize_cache.misses
+
+    assert_jpeg(client.get(f"/img/320/{path}?format=jpeg"), 320)
+    assert resize_cache.misses == misses + 1
+
+
+def test_rendition_written_by_another_worker_is_indexed_not_rendered(client):
+    path = stored_image((10, 10, 200))
+    before = set(resize_cache._entries)
+    assert_jpeg(client.get(f"/img/320/{path}?format=jpeg"), 320)
+    (rel,) = set(resize_cache._entries) - before
+
+    # This worker's index doesn't know the file another worker rendered
+    with resize_cache._lock:
+        resize_cache._total -= resize_cache._entries.pop(rel)
+    misses, hits = resize_cache.misses, resize_cache.hits
+
+    assert_jpeg(client.get(f"/img/320/{path}?format=jpeg"), 320)
+    assert resize_cache.misses == misses
+    assert resize_cache.hits == hits + 1
+    assert rel in resize_cache._entries
+
+
+def test_file_is_closed_when_the_client_leaves_before_the_body(tmp_path):
+    source = tmp_path / "rendition.jpg"
+    source.write_bytes(b"x" * 1024)
+    file = open(source, "rb")
+    response = OpenFileResponse(file, media_type="image/jpeg")
+
+    async def receive():
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        await anyio.sleep(10)  # the disconnect wins before the body starts
+
+    anyio.run(response, {"type": "http", "asgi": {"spec_version": "2.3"}}, receive, send)
+    assert file.closed
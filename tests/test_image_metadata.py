@@ -0,0 +1,50 @@
+# tests/test_image_metadata.py - Image Metadata Stored With Uploads
+import io
+
+from PIL import Image
+
+from app.models.category import Category
+from app.models.destination import Destination, DestinationImage
+from app.services.image_service import BASE83
+
+BLUE = (20, 60, 200)
+
+
+def two_tone_png(width: int, height: int) -> bytes:
+    """Mostly blue with a white strip, so the dominant colour is unambiguous"""
+    image = Image.new("RGB", (width, height), BLUE)
+    image.paste((255, 255, 255), (width * 3 // 4, 0, width, height))
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def test_featured_image_and_gallery_photos_store_their_metadata(client, admin_headers, db):
+    category = Category(name="Metadata")
+    db.add(category)
+    db.commit()
+
+    response = client.post(
+        "/api/admin/destinations",
+        headers=admin_headers,
+        data={"name": "Metadata check", "category_id": str(category.id)},
+        files=[
+            ("image", ("cover.png", two_tone_png(300, 200), "image/png")),
+            ("additional_photos", ("gallery.png", two_tone_png(120, 160), "image/png")),
+        ]
+    )
+    assert response.status_code == 200, response.text
+
+    destination = db.get(Destination, response.json()["id"])
+    assert (destination.image_width, destination.image_height) == (300, 200)
+    assert destination.image_color == "#143cc8"
+    # 4x3 components: size flag, max AC, DC (4 chars), 11 AC values (2 chars each)
+    assert len(destination.image_blurhash) == 28
+    assert set(destination.image_blurhash) <= set(BASE83)
+    assert destination.image_size_bytes > 0
+
+    photo = db.query(DestinationImage).filter(DestinationImage.destination_id == destination.id).one()
+    assert (photo.width, photo.height) == (120, 160)
+    assert photo.color == "#143cc8"
+    assert len(photo.blurhash) == 28
+    assert photo.blurhash != destination.image_blurhash  # different aspect, different layout
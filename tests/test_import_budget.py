@@ -0,0 +1,15 @@
+# tests/test_import_budget.py - Import-Time Budget
+from app.core.import_budget import IMPORT_BUDGET_MS, measure_import
+
+# A real regression is over budget on every run; a noisy machine only on some
+ATTEMPTS = 5
+
+
+def test_import_main_within_budget():
+    # The first run may still be compiling .pyc files
+    runs_ms = []
+    for _ in range(ATTEMPTS):
+        runs_ms.append(measure_import("main")[0] / 1000)
+        if runs_ms[-1] <= IMPORT_BUDGET_MS:
+            break
+    assert min(runs_ms) <= IMPORT_BUDGET_MS, f"import main took {min(runs_ms):.0f}ms (runs: {runs_ms})"
@@ -0,0 +1,20 @@
+# tests/test_metrics.py - Prometheus Metrics Endpoint
+import inspect
+
+import main
+
+
+def test_metrics_handler_runs_on_the_event_loop():
+    # render() reads dicts the middleware mutates on the loop without locks
+    route = next(r for r in main.app.routes if getattr(r, "path", None) == "/metrics")
+    assert inspect.iscoroutinefunction(route.endpoint)
+
+
+def test_cumulative_values_are_counters(client):
+    client.get("/health")
+    body = client.get("/metrics").text
+
+    assert "# TYPE password_hash_rejected_total counter" in body
+    assert "# TYPE db_pool_timeouts_total counter" in body
+    assert "# TYPE http_requests_total counter" in body
+    assert 'http_requests_total{method="GET",route="/health",status="200"}' in body
@@ -0,0 +1,53 @@
+# tests/test_migrations.py - Schema Migrations
+from sqlalchemy import create_engine, inspect, text
+
+from app.database import Base
+from app.migrations import LATEST_VERSION, current_version, schema_version, upgrade, version_metadata
+
+# Columns and indexes added after 0002, which an older database lacks
+LATER_INDEXES = [
+    "idx_destinations_image_path", "idx_destination_images_image_path",
+    "idx_users_email", "idx_users_role_id",
+]
+LATER_COLUMNS = {
+    "destinations": [
+        "image_variants", "image_width", "image_height",
+        "image_size_bytes", "image_color", "image_blurhash",
+    ],
+    "destination_images": ["variants", "width", "height", "size_bytes", "color", "blurhash"],
+}
+
+
+def schema(engine) -> dict:
+    inspector = inspect(engine)
+    return {
+        table: (
+            {(c["name"], str(c["type"]), c["nullable"]) for c in inspector.get_columns(table)},
+            {(i["name"], tuple(i["column_names"])) for i in inspector.get_indexes(table)},
+        )
+        for table in inspector.get_table_names()
+        if table != "schema_version"
+    }
+
+
+def test_upgrade_from_version_2_matches_the_models(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path}/old.db")
+    Base.metadata.create_all(engine)
+    expected = schema(engine)
+
+    # Roll the database back to what 0001 + 0002 produced
+    with engine.begin() as conn:
+        for index in LATER_INDEXES:
+            conn.execute(text(f"DROP INDEX {index}"))
+        for table, columns in LATER_COLUMNS.items():
+            for column in columns:
+                conn.execute(text(f"ALTER TABLE {table} DROP COLUMN {column}"))
+    version_metadata.create_all(engine)
+    with engine.begin() as conn:
+        for version in (1, 2):
+            conn.execute(schema_version.insert().values(version=version, description="released"))
+
+    assert upgrade(engine) == list(range(3, LATEST_VERSION + 1))
+    assert current_version(engine) == LATEST_VERSION
+    assert schema(engine) == expected
+    engine.dispose()
@@ -0,0 +1,59 @@
+# tests/test_password_hashing.py - Bounded Password Hashing Pool
+import asyncio
+import threading
+
+import pytest
+from fastapi import HTTPException
+
+from app.core.security import PasswordHashPool
+
+
+def test_jobs_past_max_pending_get_503_and_the_rest_complete():
+    pool = PasswordHashPool(max_workers=1, max_pending=2)
+    release = threading.Event()
+
+    def slow_hash(value):
+        release.wait(5)
+        return value * 2
+
+    async def scenario():
+        first = asyncio.create_task(pool.run(slow_hash, 1))
+        second = asyncio.create_task(pool.run(slow_hash, 2))
+        await asyncio.sleep(0)  # let both tasks take a pending slot
+
+        with pytest.raises(HTTPException) as rejected:
+            await pool.run(slow_hash, 3)
+
+        release.set()
+        return rejected.value, await asyncio.gather(first, second)
+
+    try:
+        rejected, results = asyncio.run(scenario())
+    finally:
+        pool.shutdown()
+
+    assert rejected.status_code == 503
+    assert rejected.headers["Retry-After"] == "1"
+    assert results == [2, 4]
+    stats = pool.stats()
+    assert (stats["completed"], stats["rejected"], stats["pending"]) == (2, 1, 0)
+    # The second job queued behind the first on the single worker
+    assert stats["max_wait_ms"] > 0
+
+
+def test_a_failing_job_frees_its_slot():
+    pool = PasswordHashPool(max_workers=1, max_pending=1)
+
+    def broken(_):
+        raise ValueError("bad hash")
+
+    async def scenario():
+        with pytest.raises(ValueError):
+            await pool.run(broken, "x")
+        return await pool.run(str.upper, "ok")
+
+    try:
+        assert asyncio.run(scenario()) == "OK"
+    finally:
+        pool.shutdown()
+    assert pool.stats()["pending"] == 0
@@ -0,0 +1,45 @@
+# tests/test_principal_cache.py - Authenticated-Principal Cache
+from fastapi.testclient import TestClient
+
+from app.api.deps import principal_cache
+from app.models.user import User, UserRole
+from app.services.auth_service import AuthService
+
+
+def login_as_new_user(db, username: str):
+    """A separate client (own session cookie) logged in as a fresh regular user"""
+    import main
+
+    user = User(username=username, email=f"{username}@example.com",
+                password=AuthService.get_password_hash("user-secret"), role=UserRole.USER)
+    db.add(user)
+    db.commit()
+
+    user_client = TestClient(main.app)
+    response = user_client.post("/api/auth/login", json={"username": username, "password": "user-secret"})
+    assert response.status_code == 200, response.text
+    headers = {"Authorization": f"Bearer {response.json()['token']['access_token']}"}
+    return user.id, user_client, headers
+
+
+def test_role_change_takes_effect_without_waiting_for_the_ttl(client, admin_headers, db):
+    user_id, user_client, headers = login_as_new_user(db, "cache-promoted")
+    assert user_client.get("/api/admin/dashboard/stats", headers=headers).status_code == 403
+    assert principal_cache.get(user_id).role == UserRole.USER
+
+    response = client.patch(f"/api/admin/users/{user_id}/toggle-role", headers=admin_headers)
+    assert response.json()["role"] == "admin"
+
+    assert principal_cache.get(user_id) is None
+    assert user_client.get("/api/admin/dashboard/stats", headers=headers).status_code == 200
+
+
+def test_deleted_user_is_logged_out_at_once(client, admin_headers, db):
+    user_id, user_client, headers = login_as_new_user(db, "cache-deleted")
+    assert user_client.get("/api/auth/me", headers=headers).status_code == 200
+    assert principal_cache.get(user_id) is not None
+
+    assert client.delete(f"/api/admin/users/{user_id}", headers=admin_headers).status_code == 200
+
+    assert principal_cache.get(user_id) is None
+    assert user_client.get("/api/auth/me", headers=headers).status_code == 401
@@ -0,0 +1,53 @@
+# tests/test_query_counts.py - Query Budgets for Listing Endpoints
+import pytest
+
+from app.models.category import Category
+from app.models.destination import Destination, DestinationImage
+from app.models.feedback import WebsiteFeedback
+from app.models.review import Review
+from app.models.user import User, UserRole
+
+ROWS = 15  # well above every budget below, so an N+1 cannot hide
+
+
+@pytest.fixture(scope="module")
+def catalog(client, admin_headers):
+    """Destinations with images and reviews, and users with reviews and feedback"""
+    from app.database import SessionLocal
+
+    db = SessionLocal()
+    category = Category(name="Query budget")
+    db.add(category)
+    db.flush()
+
+    for i in range(ROWS):
+        user = User(username=f"qb-user-{i}", email=f"qb{i}@example.com", password="x", role=UserRole.USER)
+        destination = Destination(name=f"QB destination {i}", category_id=category.id, is_active=True)
+        db.add_all([user, destination])
+        db.flush()
+        db.add_all([
+            DestinationImage(destination_id=destination.id, image_path=f"qb/{i}.jpg"),
+            Review(destination_id=destination.id, user_id=user.id, rating=4, is_approved=i % 2 == 0),
+            Review(destination_id=destination.id, user_id=user.id, rating=5),
+            WebsiteFeedback(user_id=user.id, rating=5, feedback="Great"),
+        ])
+    db.commit()
+    db.close()
+
+    # Load the admin principal so its lookup isn't counted below
+    client.get("/api/admin/dashboard/stats", headers=admin_headers)
+
+
+def test_admin_destination_listing_is_not_n_plus_one(client, admin_headers, catalog, max_queries):
+    with max_queries(3):
+        response = client.get("/api/admin/destinations?page_size=50", headers=admin_headers)
+    assert response.status_code == 200
+    assert len(response.json()["destinations"]) >= ROWS
+
+
+def test_admin_user_directory_is_not_n_plus_one(client, admin_headers, catalog, max_queries):
+    with max_queries(3):
+        response = client.get("/api/admin/users?limit=50", headers=admin_headers)
+    assert response.status_code == 200
+    assert len(response.json()["users"]) >= ROWS
+
@@ -0,0 +1,59 @@
+# tests/test_query_stats.py - Query Counting Across Threads and Failed Statements
+import threading
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.pool import StaticPool
+
+from app.core.query_stats import capture_queries, install_query_events
+
+THREADS = 8
+QUERIES = 50
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    install_query_events(engine)
+    yield engine
+    engine.dispose()
+
+
+def test_failed_statements_leave_nothing_on_the_connection(engine):
+    with engine.connect() as conn:
+        for _ in range(3):
+            with pytest.raises(OperationalError):
+                conn.execute(text("SELECT * FROM missing_table"))
+        with capture_queries() as stats:
+            conn.execute(text("SELECT 1"))
+        raw_info = dict(conn.info)
+
+    assert stats.count == 1
+    assert raw_info == {}
+
+
+def test_captures_opened_and_closed_on_other_threads_miss_nothing(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path}/threads.db", pool_size=THREADS)
+    install_query_events(engine)
+    counts = []
+    start = threading.Barrier(THREADS)
+
+    def worker():
+        start.wait()
+        with engine.connect() as conn:
+            for _ in range(QUERIES):
+                # Each query runs while other threads enter and leave captures
+                with capture_queries() as stats:
+                    conn.execute(text("SELECT 1"))
+                counts.append(stats.count)
+
+    threads = [threading.Thread(target=worker) for _ in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    engine.dispose()
+
+    assert len(counts) == THREADS * QUERIES
+    assert min(counts) >= 1
@@ -0,0 +1,124 @@
+# tests/test_rate_limit.py - Login Throttling
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from app.api.endpoints import auth as auth_api
+from app.config import settings
+from app.core import rate_limit
+from app.core.rate_limit import LoginThrottle, MemoryBackend, SQLiteBackend, TokenBucketLimiter
+from app.services.auth_service import AuthService
+
+
+class FakeClock:
+    """Stands in for the time module: both backends read the same fake now"""
+
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def monotonic(self):
+        return self.now
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(rate_limit, "time", fake)
+    return fake
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def backend(request, tmp_path):
+    if request.param == "memory":
+        return MemoryBackend()
+    return SQLiteBackend(str(tmp_path / "throttle.db"))
+
+
+@pytest.fixture
+def throttle(backend, monkeypatch):
+    monkeypatch.setattr(settings, "LOGIN_RATE_LIMIT_ENABLED", True)
+    monkeypatch.setattr(settings, "LOGIN_IP_BURST", 20)
+    monkeypatch.setattr(settings, "LOGIN_IP_PER_MINUTE", 10)
+    monkeypatch.setattr(settings, "LOGIN_USERNAME_BURST", 5)
+    monkeypatch.setattr(settings, "LOGIN_USERNAME_PER_MINUTE", 2)
+    return LoginThrottle(backend)
+
+
+def attempt(throttle, ip, username):
+    """429 HTTPException of a login attempt, or None when allowed"""
+    try:
+        asyncio.run(throttle.check(ip, username))
+    except HTTPException as e:
+        return e
+    return None
+
+
+def test_bucket_refills_at_its_rate(backend, clock):
+    limiter = TokenBucketLimiter(backend, "test", capacity=2, per_minute=60)
+
+    assert limiter.hit("k") == 0
+    assert limiter.hit("k") == 0
+    assert limiter.hit("k") == pytest.approx(1.0)
+
+    clock.now += 0.5
+    assert limiter.hit("k") == pytest.approx(0.5)
+    clock.now += 0.5
+    assert limiter.hit("k") == 0
+    # Other keys have buckets of their own
+    assert limiter.hit("other") == 0
+
+
+def test_exhausted_username_gets_429_with_retry_after(throttle, clock):
+    for _ in range(5):
+        assert attempt(throttle, "10.0.0.1", "Alice ") is None
+
+    rejected = attempt(throttle, "10.0.0.2", "alice")
+    assert rejected.status_code == 429
+    # 2 tokens per minute: the next one is 30s away
+    assert rejected.headers["Retry-After"] == "30"
+    assert throttle.rejected == 1
+
+    clock.now += 30
+    assert attempt(throttle, "10.0.0.2", "alice") is None
+
+
+def test_throttled_ip_does_not_drain_the_username_bucket(throttle, clock):
+    for i in range(20):
+        assert attempt(throttle, "10.0.0.1", f"user{i}") is None
+    for _ in range(10):
+        assert attempt(throttle, "10.0.0.1", "victim").status_code == 429
+
+    # The victim still has the full username allowance from elsewhere
+    for _ in range(5):
+        assert attempt(throttle, "10.0.0.9", "victim") is None
+
+
+def test_successful_login_resets_the_username_bucket(throttle, clock):
+    for _ in range(5):
+        attempt(throttle, "10.0.0.1", "bob")
+    assert attempt(throttle, "10.0.0.1", "bob") is not None
+
+    asyncio.run(throttle.success("BOB"))
+    assert attempt(throttle, "10.0.0.1", "bob") is None
+
+
+def test_login_throttle_runs_before_the_database_and_bcrypt(client, admin_headers, monkeypatch, max_queries):
+    monkeypatch.setattr(settings, "LOGIN_RATE_LIMIT_ENABLED", True)
+    monkeypatch.setattr(auth_api, "login_throttle", LoginThrottle(MemoryBackend()))
+    wrong_password = {"username": "admin", "password": "wrong"}
+
+    for _ in range(settings.LOGIN_USERNAME_BURST):
+        assert client.post("/api/auth/login", json=wrong_password).status_code == 401
+
+    def must_not_run(*args, **kwargs):
+        raise AssertionError("bcrypt ran for a throttled login")
+
+    monkeypatch.setattr(AuthService, "verify_password", staticmethod(must_not_run))
+    with max_queries(0):
+        response = client.post("/api/auth/login", json=wrong_password)
+    assert response.status_code == 429
+    assert int(response.headers["Retry-After"]) > 0
@@ -0,0 +1,59 @@
+# tests/test_read_replicas.py - Read Routing Between Replicas and the Primary
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from app import database
+from app.database import PRIMARY_STICKY_KEY, ReplicaSet, get_read_db
+
+
+def read_bind(session: dict):
+    """Engine the read dependency picks for a request with this session"""
+    dependency = get_read_db(SimpleNamespace(session=session))
+    db = next(dependency)
+    try:
+        return db.get_bind()
+    finally:
+        dependency.close()
+
+
+@pytest.fixture
+def replicas(monkeypatch, tmp_path):
+    """A dead replica (its directory doesn't exist) followed by a working one"""
+    missing = tmp_path / "missing" / "replica.db"
+    working = tmp_path / "replica.db"
+    replica_set = ReplicaSet([f"sqlite:///{missing}", f"sqlite:///{working}"])
+    monkeypatch.setattr(database, "replica_set", replica_set)
+    yield replica_set
+    for replica in replica_set.replicas:
+        replica.engine.dispose()
+
+
+def test_failed_replica_falls_back_and_is_skipped(replicas):
+    dead, alive = replicas.replicas
+
+    # Round-robin starts at the dead replica: this read goes to the primary
+    assert read_bind({}) is database.engine
+    assert not dead.healthy
+
+    # Until its retry time, only the working replica is used
+    assert read_bind({}) is alive.engine
+    assert read_bind({}) is alive.engine
+
+
+def test_all_replicas_down_reads_from_primary(replicas):
+    for replica in replicas.replicas:
+        replica.mark_unhealthy()
+
+    assert read_bind({}) is database.engine
+
+
+def test_sticky_key_and_admin_sessions_read_from_primary(replicas):
+    dead, alive = replicas.replicas
+    dead.mark_unhealthy()
+
+    assert read_bind({PRIMARY_STICKY_KEY: time.time() + 60}) is database.engine
+    assert read_bind({"role": "admin"}) is database.engine
+    # Once the sticky window has passed, reads go back to the replica
+    assert read_bind({PRIMARY_STICKY_KEY: time.time() - 1}) is alive.engine
@@ -0,0 +1,70 @@
+# tests/test_static_files.py - Fingerprinted, Precompressed Static Files
+import gzip
+from pathlib import Path
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.static_files import AssetManifest, CachedStaticFiles
+
+CSS = b"body { color: #333; }\n" * 200
+
+
+def static_app(static_dir, cache_dir):
+    manifest = AssetManifest(str(static_dir), cache_dir=str(cache_dir)).build()
+    app = FastAPI()
+    app.mount("/static", CachedStaticFiles(directory=str(static_dir), manifest=manifest))
+    return TestClient(app), manifest
+
+
+def test_precompressed_copies_go_to_the_cache_dir(tmp_path):
+    static_dir = tmp_path / "static"
+    (static_dir / "css").mkdir(parents=True)
+    (static_dir / "css" / "style.css").write_bytes(CSS)
+
+    client, manifest = static_app(static_dir, tmp_path / "cache")
+
+    assert sorted(p.name for p in static_dir.rglob("*")) == ["css", "style.css"]
+    response = client.get("/static/" + manifest.hashed["css/style.css"], headers={"Accept-Encoding": "gzip"})
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["Cache-Control"] == "public, max-age=31536000, immutable"
+    assert int(response.headers["Content-Length"]) == len(gzip.compress(CSS, compresslevel=9, mtime=0))
+    assert response.content == CSS
+
+
+def test_unwritable_cache_dir_falls_back_to_uncompressed(tmp_path):
+    static_dir = tmp_path / "static"
+    static_dir.mkdir()
+    (static_dir / "app.js").write_bytes(b"console.log('hi');\n" * 100)
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_text("")
+
+    client, manifest = static_app(static_dir, blocker / "cache")
+
+    assert manifest.hashed["app.js"].startswith("app.")
+    response = client.get("/static/app.js", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert "Content-Encoding" not in response.headers
+    assert response.headers["Cache-Control"] == "no-cache"
+
+
+def test_uploads_are_served_from_the_configured_upload_dir(client):
+    from app.config import settings
+
+    upload = Path(settings.UPLOAD_DIR) / "destinations" / "served-check.jpg"
+    upload.write_bytes(b"not really a jpeg")
+
+    response = client.get("/uploads/destinations/served-check.jpg")
+    assert response.status_code == 200
+    assert response.content == b"not really a jpeg"
+    assert response.headers["Cache-Control"] == "public, max-age=31536000, immutable"
+
+
+def test_hidden_upload_files_are_not_served(client):
+    from app.config import settings
+
+    part = Path(settings.UPLOAD_DIR) / "destinations" / ".in-progress.part"
+    part.write_bytes(b"partial upload")
+
+    assert client.get("/uploads/destinations/.in-progress.part").status_code == 404
+    assert client.get("/uploads/.quarantine/destinations/photo.jpg").status_code == 404
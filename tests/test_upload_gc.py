@@ -0,0 +1,131 @@
+# tests/test_upload_gc.py - Orphaned Upload Garbage Collection
+import os
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.config import settings
+from app.models.category import Category
+from app.models.destination import Destination, DestinationImage
+from app.services import upload_gc
+
+GRACE_HOURS = 24
+TODAY = datetime.now().strftime("%Y%m%d")
+
+
+@pytest.fixture
+def dirs(tmp_path, monkeypatch):
+    """Empty upload and quarantine directories for one test"""
+    upload_dir = tmp_path / "uploads"
+    quarantine = tmp_path / "quarantine"
+    (upload_dir / "destinations").mkdir(parents=True)
+    monkeypatch.setattr(settings, "UPLOAD_DIR", str(upload_dir))
+    monkeypatch.setattr(settings, "UPLOAD_QUARANTINE_DIR", str(quarantine))
+    return upload_dir, quarantine
+
+
+@pytest.fixture(scope="module")
+def referenced(client):
+    """image_path values kept alive by database rows"""
+    from app.database import SessionLocal
+
+    db = SessionLocal()
+    category = Category(name="Upload GC")
+    db.add(category)
+    db.flush()
+    destination = Destination(name="GC kept", category_id=category.id, image_path="destinations/gc-cover.jpg")
+    db.add(destination)
+    db.flush()
+    db.add(DestinationImage(destination_id=destination.id, image_path="destinations/gc-photo.jpg"))
+    db.commit()
+    db.close()
+
+
+def upload(upload_dir, name: str, age_hours: float = GRACE_HOURS * 2):
+    path = upload_dir / "destinations" / name
+    path.write_bytes(b"x" * 10)
+    mtime = time.time() - age_hours * 3600
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+def collect(db, **kwargs):
+    kwargs.setdefault("grace_hours", GRACE_HOURS)
+    return upload_gc.collect(db, **kwargs)
+
+
+def test_referenced_files_and_variants_of_referenced_originals_are_kept(db, dirs, referenced):
+    upload_dir, quarantine = dirs
+    kept = [
+        upload(upload_dir, "gc-cover.jpg"),
+        upload(upload_dir, "gc-photo.jpg"),
+        upload(upload_dir, "gc-photo_w640.webp"),
+        upload(upload_dir, "gc-photo_w320.jpg"),
+    ]
+    orphan = upload(upload_dir, "gc-orphan.jpg")
+    orphan_variant = upload(upload_dir, "gc-orphan_w640.webp")
+
+    report = collect(db)
+
+    assert all(path.exists() for path in kept)
+    assert report.scanned == 6
+    assert report.orphans == report.quarantined == 2
+    assert not orphan.exists() and not orphan_variant.exists()
+    assert (quarantine / TODAY / "destinations" / "gc-orphan.jpg").exists()
+    assert (quarantine / TODAY / "destinations" / "gc-orphan_w640.webp").exists()
+
+
+def test_files_inside_the_grace_window_are_skipped(db, dirs, referenced):
+    upload_dir, _ = dirs
+    recent = upload(upload_dir, "gc-recent.jpg", age_hours=GRACE_HOURS / 2)
+    recent_part = upload(upload_dir, ".gc-recent.part", age_hours=GRACE_HOURS / 2)
+
+    report = collect(db)
+
+    assert report.orphans == 0
+    assert recent.exists() and recent_part.exists()
+
+
+def test_abandoned_part_files_are_collected(db, dirs, referenced):
+    upload_dir, quarantine = dirs
+    part = upload(upload_dir, ".gc-abandoned.part")
+    hidden = upload(upload_dir, ".gc-hidden")
+
+    report = collect(db)
+
+    assert report.quarantined == 1
+    assert not part.exists()
+    assert (quarantine / TODAY / "destinations" / ".gc-abandoned.part").exists()
+    assert hidden.exists()
+
+
+def test_purge_only_deletes_folders_older_than_the_cutoff(db, dirs, referenced):
+    _, quarantine = dirs
+    old_day = (datetime.now() - timedelta(days=10)).strftime("%Y%m%d")
+    recent_day = (datetime.now() - timedelta(days=2)).strftime("%Y%m%d")
+    for day in (old_day, recent_day):
+        (quarantine / day / "destinations").mkdir(parents=True)
+        (quarantine / day / "destinations" / "photo.jpg").write_bytes(b"x" * 10)
+
+    report = collect(db, purge_days=7)
+
+    assert report.purged == 1 and report.purged_bytes == 10
+    assert not (quarantine / old_day).exists()
+    assert (quarantine / recent_day / "destinations" / "photo.jpg").exists()
+
+
+def test_dry_run_moves_and_deletes_nothing(db, dirs, referenced):
+    upload_dir, quarantine = dirs
+    orphan = upload(upload_dir, "gc-dry-orphan.jpg")
+    old_day = (datetime.now() - timedelta(days=10)).strftime("%Y%m%d")
+    (quarantine / old_day).mkdir(parents=True)
+    (quarantine / old_day / "photo.jpg").write_bytes(b"x" * 10)
+
+    report = collect(db, dry_run=True, purge_days=7)
+
+    assert report.orphans == 1 and report.quarantined == 0
+    assert report.purged == 1
+    assert orphan.exists()
+    assert (quarantine / old_day / "photo.jpg").exists()
+    assert not (quarantine / TODAY).exists()
@@ -0,0 +1,35 @@
+# tests/test_upload_store.py - Content-Addressed Upload Storage
+import io
+import os
+import time
+
+from fastapi import UploadFile
+from PIL import Image
+
+from app.config import settings
+from app.services.upload_store import UPLOAD_DIR, release_upload, store_upload
+
+
+def png_upload(color) -> UploadFile:
+    buffer = io.BytesIO()
+    Image.new("RGB", (8, 8), color).save(buffer, format="PNG")
+    buffer.seek(0)
+    return UploadFile(buffer, filename="photo.png")
+
+
+def test_release_keeps_a_file_an_uncommitted_upload_just_stored(client, db):
+    # A second upload of the same content renamed the file into place, but
+    # its row isn't committed yet, so nothing references the file
+    path = store_upload(png_upload((10, 20, 30)), "destinations")
+
+    assert release_upload(db, path) is False
+    assert (UPLOAD_DIR / path).exists()
+
+
+def test_release_removes_an_unreferenced_file_past_the_grace_window(client, db):
+    path = store_upload(png_upload((40, 50, 60)), "destinations")
+    old = time.time() - settings.UPLOAD_RELEASE_GRACE_SECONDS - 1
+    os.utime(UPLOAD_DIR / path, (old, old))
+
+    assert release_upload(db, path) is True
+    assert not (UPLOAD_DIR / path).exists()